@@ -0,0 +1,14 @@
+"""Optional third-party backends."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def optional_numpy() -> Any:
+    """Return the ``numpy`` module, or None when the optional extra is not installed."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - exercised when numpy is absent
+        return None
+    return numpy
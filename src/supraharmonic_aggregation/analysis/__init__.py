@@ -1,16 +1,24 @@
 """Analytical and validation routines."""
 
 from .analytical import compute_analytical_statistics
+from .calibration import FeederMeasurement, calibrate_feeders, calibrate_kernel
 from .robustness import run_multiseed_validation_study, summarize_multiseed_rows
+from .safeguard import safeguard_activation_frame, sweep_safeguard_thresholds
 from .scaling import evaluate_scaling_laws
-from .tail import compute_tail_metrics
+from .tail import build_statistics_frame, compute_tail_metrics
 from .validation import check_integrability_conditions
 
 __all__ = [
     "compute_analytical_statistics",
+    "FeederMeasurement",
+    "calibrate_kernel",
+    "calibrate_feeders",
     "run_multiseed_validation_study",
     "summarize_multiseed_rows",
+    "safeguard_activation_frame",
+    "sweep_safeguard_thresholds",
     "evaluate_scaling_laws",
+    "build_statistics_frame",
     "compute_tail_metrics",
     "check_integrability_conditions",
 ]
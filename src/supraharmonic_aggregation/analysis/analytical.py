@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import math
+from dataclasses import astuple
+from typing import Sequence
 
+from ..cache import open_store
 from ..config import AnalysisConfig
 from ..core.kernel import ExponentialKernel
 from ..models import StatisticsFrame
@@ -112,22 +115,52 @@ def _amplitude_moments(config: AnalysisConfig, frequency_khz: float) -> tuple[fl
     return mean_amp, second_moment_amp
 
 
+def _transfer_moment_table(
+    config: AnalysisConfig, frequencies_khz: list[float], n_points: int = 256
+) -> list[tuple[float, float]]:
+    kernel = ExponentialKernel(alpha=config.kernel_alpha, resonance_scale=config.resonance_scale)
+    radius = max(config.region_radius_m, 1e-9)
+
+    def compute() -> list[float]:
+        distances = [radius * math.sqrt((idx + 0.5) / n_points) for idx in range(n_points)]
+        grid = kernel.impedance_grid(frequencies_khz, distances)
+        flat: list[float] = []
+        for frequency_khz, row in zip(frequencies_khz, grid):
+            admittance = config.admittance_s / (
+                1.0 + _ROLLOFF_MEAN * max(frequency_khz - 30.0, 0.0)
+            )
+            first = 0.0
+            second = 0.0
+            for z_tr in row:
+                gain = abs(z_tr) / abs(1.0 + admittance * z_tr)
+                first += gain
+                second += gain * gain
+            flat.extend((first / n_points, second / n_points))
+        return flat
+
+    store = open_store(config)
+    flat: Sequence[float]
+    if store is None:
+        flat = compute()
+    else:
+        flat = store.get_or_compute(
+            "transfer_moments",
+            {
+                "kernel": list(astuple(kernel)),
+                "frequencies_khz": [float(freq) for freq in frequencies_khz],
+                "region_radius_m": radius,
+                "admittance_s": config.admittance_s,
+                "n_points": n_points,
+            },
+            compute,
+        )
+    return [(flat[2 * idx], flat[2 * idx + 1]) for idx in range(len(frequencies_khz))]
+
+
 def _transfer_moments(
     config: AnalysisConfig, frequency_khz: float, n_points: int = 256
 ) -> tuple[float, float]:
-    kernel = ExponentialKernel(alpha=config.kernel_alpha, resonance_scale=config.resonance_scale)
-    radius = max(config.region_radius_m, 1e-9)
-    admittance = config.admittance_s / (1.0 + _ROLLOFF_MEAN * max(frequency_khz - 30.0, 0.0))
-    first = 0.0
-    second = 0.0
-    for idx in range(n_points):
-        u = (idx + 0.5) / n_points
-        distance = radius * math.sqrt(u)
-        z_tr = kernel.impedance(frequency_khz, distance)
-        gain = abs(z_tr) / abs(1.0 + admittance * z_tr)
-        first += gain
-        second += gain * gain
-    return first / n_points, second / n_points
+    return _transfer_moment_table(config, [frequency_khz], n_points=n_points)[0]
 
 
 def _phase_pair_correlation(coherence: float) -> float:
@@ -168,9 +201,9 @@ def compute_analytical_statistics(config: AnalysisConfig) -> StatisticsFrame:
     rows: StatisticsFrame = []
     density_scale = max(config.density, 1e-9) ** 0.5
 
-    for frequency in config.frequencies_khz:
+    transfer_table = _transfer_moment_table(config, config.frequencies_khz)
+    for frequency, (transfer_m1, transfer_m2) in zip(config.frequencies_khz, transfer_table):
         mean_amp, second_amp = _amplitude_moments(config, frequency)
-        transfer_m1, transfer_m2 = _transfer_moments(config, frequency)
         single_m1 = mean_amp * transfer_m1
         single_m2 = second_amp * transfer_m2
 
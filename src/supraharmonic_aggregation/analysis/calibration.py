@@ -0,0 +1,276 @@
+"""Least-squares calibration of ExponentialKernel parameters against measurements."""
+
+from __future__ import annotations
+
+import math
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+
+from ..core.kernel import ExponentialKernel
+
+DEFAULT_CALIBRATION_PARAMETERS = (
+    "r_ohm_per_km",
+    "l_h_per_km",
+    "c_f_per_km",
+    "skin_effect_coeff",
+    "dielectric_tan_delta",
+)
+RESONANCE_CALIBRATION_PARAMETERS = (
+    "resonance_scale",
+    "resonance_center_hz",
+    "resonance_width_hz",
+)
+_CALIBRATABLE = set(DEFAULT_CALIBRATION_PARAMETERS + RESONANCE_CALIBRATION_PARAMETERS)
+# Starting points for parameters that are disabled (zero) in the initial kernel: log-space
+# steps from a vanishing value leave the residuals flat and the fit stalled.
+_SEED_VALUES = {
+    "resonance_scale": 1.0,
+    "skin_effect_coeff": 0.1,
+    "dielectric_tan_delta": 0.01,
+}
+
+
+@dataclass(slots=True)
+class FeederMeasurement:
+    """Measured transfer impedances of one feeder on a frequency x distance grid."""
+
+    feeder_id: str
+    frequencies_khz: list[float]
+    distances_m: list[float]
+    impedances: list[list[complex]]
+
+
+@dataclass(slots=True)
+class CalibrationResult:
+    """Fitted kernel and convergence diagnostics for one feeder."""
+
+    feeder_id: str
+    kernel: ExponentialKernel
+    parameters: dict[str, float]
+    initial_cost: float
+    final_cost: float
+    rms_relative_error: float
+    iterations: int
+    converged: bool
+
+
+def _initial_value(kernel: ExponentialKernel, name: str) -> float:
+    value = getattr(kernel, name)
+    if value is not None and value > 0:
+        return float(value)
+    if name in _SEED_VALUES:
+        return _SEED_VALUES[name]
+    if value is not None:
+        return 1e-12
+    lc = max(kernel.l_h_per_km * kernel.c_f_per_km, 1e-18)
+    nominal_f0_hz = 1.0 / (2.0 * math.pi * math.sqrt(lc))
+    if name == "resonance_center_hz":
+        return nominal_f0_hz
+    return max(0.2 * nominal_f0_hz, 1.0)
+
+
+def _validate(measurement: FeederMeasurement, parameters: tuple[str, ...]) -> None:
+    unknown = set(parameters) - _CALIBRATABLE
+    if unknown:
+        raise ValueError(f"Unsupported calibration parameters: {sorted(unknown)}")
+    if not parameters:
+        raise ValueError("parameters must not be empty.")
+    if len(measurement.impedances) != len(measurement.frequencies_khz) or any(
+        len(row) != len(measurement.distances_m) for row in measurement.impedances
+    ):
+        raise ValueError("impedances must have one row per frequency and value per distance.")
+
+
+def _solve(matrix: list[list[float]], rhs: list[float]) -> list[float]:
+    """Solve a small dense system by Gaussian elimination with partial pivoting."""
+    n = len(rhs)
+    augmented = [row[:] + [value] for row, value in zip(matrix, rhs)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda idx: abs(augmented[idx][col]))
+        if abs(augmented[pivot][col]) <= 1e-300:
+            raise ZeroDivisionError("Singular calibration normal equations.")
+        augmented[col], augmented[pivot] = augmented[pivot], augmented[col]
+        for row in range(col + 1, n):
+            factor = augmented[row][col] / augmented[col][col]
+            if factor:
+                for k in range(col, n + 1):
+                    augmented[row][k] -= factor * augmented[col][k]
+    solution = [0.0] * n
+    for row in range(n - 1, -1, -1):
+        acc = augmented[row][n] - sum(augmented[row][k] * solution[k] for k in range(row + 1, n))
+        solution[row] = acc / augmented[row][row]
+    return solution
+
+
+class _Problem:
+    """Residuals of one feeder in log-parameter space."""
+
+    def __init__(
+        self,
+        measurement: FeederMeasurement,
+        initial: ExponentialKernel,
+        parameters: tuple[str, ...],
+    ) -> None:
+        self.measurement = measurement
+        self.initial = initial
+        self.parameters = parameters
+        self.scales = [
+            1.0 / max(abs(value), 1e-12) for row in measurement.impedances for value in row
+        ]
+        self.measured = [value for row in measurement.impedances for value in row]
+
+    def kernel(self, theta: list[float]) -> ExponentialKernel:
+        fitted = {name: math.exp(value) for name, value in zip(self.parameters, theta)}
+        initial = self.initial
+        return replace(
+            initial,
+            r_ohm_per_km=fitted.get("r_ohm_per_km", initial.r_ohm_per_km),
+            l_h_per_km=fitted.get("l_h_per_km", initial.l_h_per_km),
+            c_f_per_km=fitted.get("c_f_per_km", initial.c_f_per_km),
+            skin_effect_coeff=fitted.get("skin_effect_coeff", initial.skin_effect_coeff),
+            dielectric_tan_delta=fitted.get("dielectric_tan_delta", initial.dielectric_tan_delta),
+            resonance_scale=fitted.get("resonance_scale", initial.resonance_scale),
+            resonance_center_hz=fitted.get("resonance_center_hz", initial.resonance_center_hz),
+            resonance_width_hz=fitted.get("resonance_width_hz", initial.resonance_width_hz),
+        )
+
+    def residuals(self, theta: list[float]) -> list[float]:
+        try:
+            with warnings.catch_warnings():
+                # Trial steps far from the optimum may overflow the hyperbolic terms; those
+                # steps are rejected through a non-finite cost rather than reported.
+                warnings.simplefilter("ignore", RuntimeWarning)
+                grid = self.kernel(theta).impedance_grid(
+                    self.measurement.frequencies_khz, self.measurement.distances_m
+                )
+        except (OverflowError, ZeroDivisionError, ValueError):
+            return [math.inf] * (2 * len(self.measured))
+        out: list[float] = []
+        idx = 0
+        for row in grid:
+            for value in row:
+                error = (value - self.measured[idx]) * self.scales[idx]
+                out.append(error.real)
+                out.append(error.imag)
+                idx += 1
+        return out
+
+    def jacobian(self, theta: list[float], base: list[float]) -> list[list[float]]:
+        """Return forward-difference columns, one grid evaluation per parameter."""
+        columns: list[list[float]] = []
+        for idx in range(len(theta)):
+            step = 1e-6 * max(1.0, abs(theta[idx]))
+            shifted = theta[:]
+            shifted[idx] += step
+            perturbed = self.residuals(shifted)
+            columns.append([(p - b) / step for p, b in zip(perturbed, base)])
+        return columns
+
+
+def _cost(residuals: list[float]) -> float:
+    return 0.5 * sum(value * value for value in residuals)
+
+
+def calibrate_kernel(
+    measurement: FeederMeasurement,
+    initial: ExponentialKernel,
+    parameters: tuple[str, ...] = DEFAULT_CALIBRATION_PARAMETERS,
+    max_iterations: int = 60,
+    tolerance: float = 1e-10,
+) -> CalibrationResult:
+    """Fit kernel parameters to one feeder by Levenberg-Marquardt least squares.
+
+    Residuals are relative complex errors over the whole frequency x distance grid,
+    evaluated through :meth:`ExponentialKernel.impedance_grid`. Parameters are fitted in
+    log space so they stay positive; all others are taken from ``initial``. Parameters
+    that are zero or unset in ``initial`` start from a nominal value (unit resonance
+    scale, the nominal LC resonance for its center). ``converged`` is False when the
+    iteration budget runs out or no damped step reduces the cost any further.
+    """
+    _validate(measurement, parameters)
+    problem = _Problem(measurement, initial, parameters)
+    theta = [math.log(_initial_value(initial, name)) for name in parameters]
+    residuals = problem.residuals(theta)
+    cost = initial_cost = _cost(residuals)
+    damping = 1e-3
+    converged = False
+    iterations = 0
+
+    for iterations in range(1, max_iterations + 1):
+        columns = problem.jacobian(theta, residuals)
+        gradient = [sum(c * r for c, r in zip(column, residuals)) for column in columns]
+        normal = [
+            [sum(a * b for a, b in zip(left, right)) for right in columns] for left in columns
+        ]
+        improved = False
+        for _ in range(12):
+            damped = [row[:] for row in normal]
+            for idx in range(len(damped)):
+                damped[idx][idx] += damping * max(normal[idx][idx], 1e-12)
+            try:
+                delta = _solve(damped, [-value for value in gradient])
+            except ZeroDivisionError:
+                damping *= 10.0
+                continue
+            candidate = [value + step for value, step in zip(theta, delta)]
+            candidate_residuals = problem.residuals(candidate)
+            candidate_cost = _cost(candidate_residuals)
+            if math.isfinite(candidate_cost) and candidate_cost < cost:
+                relative_drop = (cost - candidate_cost) / max(cost, 1e-300)
+                theta, residuals, cost = candidate, candidate_residuals, candidate_cost
+                damping = max(damping / 3.0, 1e-12)
+                improved = True
+                if relative_drop < tolerance or max(abs(step) for step in delta) < tolerance:
+                    converged = True
+                break
+            damping *= 4.0
+        if cost <= 1e-30:
+            converged = True
+        # No damped step reducing the cost: the fit has stalled, which need not be a
+        # minimum, so it is reported as not converged.
+        if converged or not improved:
+            break
+
+    kernel = problem.kernel(theta)
+    n_points = max(len(residuals) // 2, 1)
+    return CalibrationResult(
+        feeder_id=measurement.feeder_id,
+        kernel=kernel,
+        parameters={name: float(getattr(kernel, name)) for name in parameters},
+        initial_cost=initial_cost,
+        final_cost=cost,
+        rms_relative_error=math.sqrt(2.0 * cost / n_points),
+        iterations=iterations,
+        converged=converged,
+    )
+
+
+def _calibrate_job(
+    job: tuple[FeederMeasurement, ExponentialKernel, tuple[str, ...], int, float],
+) -> CalibrationResult:
+    measurement, initial, parameters, max_iterations, tolerance = job
+    return calibrate_kernel(measurement, initial, parameters, max_iterations, tolerance)
+
+
+def calibrate_feeders(
+    measurements: list[FeederMeasurement],
+    initial: ExponentialKernel,
+    parameters: tuple[str, ...] = DEFAULT_CALIBRATION_PARAMETERS,
+    max_iterations: int = 60,
+    tolerance: float = 1e-10,
+    max_workers: int | None = None,
+) -> list[CalibrationResult]:
+    """Calibrate many feeders, fanning out across a process pool.
+
+    ``max_workers=1`` runs serially in-process; ``None`` uses the executor default.
+    Results are returned in the order of ``measurements``.
+    """
+    jobs = [
+        (measurement, initial, parameters, max_iterations, tolerance)
+        for measurement in measurements
+    ]
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_calibrate_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_calibrate_job, jobs))
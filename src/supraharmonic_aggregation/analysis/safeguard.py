@@ -0,0 +1,81 @@
+"""Tail sensitivity of the denominator safeguard from recorded telemetry."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from ..core.safeguard import SafeguardTelemetry
+from ..models import StatisticsFrame
+from .tail import compute_tail_metrics
+
+
+def safeguard_activation_frame(telemetry: SafeguardTelemetry) -> StatisticsFrame:
+    """Return per-frequency activation rates observed during a run."""
+    return [
+        {
+            "frequency_khz": frequency,
+            "min_denominator_magnitude": telemetry.min_denominator_magnitude,
+            "activation_rate_pct": 100.0 * rate,
+            "realization_activation_frequency_pct": 100.0 * fraction,
+        }
+        for frequency, rate, fraction in zip(
+            telemetry.frequencies_khz,
+            telemetry.activation_rate(),
+            telemetry.realization_activation_fraction(),
+        )
+    ]
+
+
+def sweep_safeguard_thresholds(
+    telemetry: SafeguardTelemetry,
+    per_frequency_samples: dict[str, Sequence[float]],
+    thresholds: Sequence[float],
+    exceedance_threshold: float,
+) -> StatisticsFrame:
+    """Recompute tail statistics for several ``min_denominator_magnitude`` values.
+
+    ``per_frequency_samples`` are the |V| samples of the run that filled ``telemetry``.
+    Only realizations holding a recorded denominator are re-evaluated; every threshold
+    must lie in [``telemetry.min_denominator_magnitude``, ``telemetry.record_below``].
+    """
+    for threshold in thresholds:
+        telemetry.check_threshold(threshold)
+    total_sources = sum(telemetry.source_counts)
+    n_realizations = len(telemetry.source_counts)
+    by_frequency: dict[int, list[tuple[int, int]]] = {}
+    for key in telemetry.records:
+        by_frequency.setdefault(key[1], []).append(key)
+
+    rows: StatisticsFrame = []
+    for threshold in thresholds:
+        for freq_idx, frequency in enumerate(telemetry.frequencies_khz):
+            values = list(per_frequency_samples[str(frequency)])
+            activated = 0
+            activated_realizations = 0
+            for key in by_frequency.get(freq_idx, []):
+                count = sum(
+                    1 for _, denominator in telemetry.records[key] if abs(denominator) < threshold
+                )
+                activated += count
+                activated_realizations += 1 if count else 0
+                values[key[0]] = abs(telemetry.voltage_at(key, threshold))
+            mean_abs_v = sum(values) / len(values) if values else 0.0
+            tail = compute_tail_metrics(values, threshold=exceedance_threshold)
+            rows.append(
+                {
+                    "min_denominator_magnitude": threshold,
+                    "frequency_khz": frequency,
+                    "activation_rate_pct": (
+                        100.0 * activated / total_sources if total_sources else 0.0
+                    ),
+                    "realization_activation_frequency_pct": (
+                        100.0 * activated_realizations / n_realizations if n_realizations else 0.0
+                    ),
+                    "mean_abs_v": mean_abs_v,
+                    "p95_abs_v": tail.percentiles.get(95, 0.0),
+                    "p99_abs_v": tail.percentiles.get(99, 0.0),
+                    "exceedance_probability": tail.exceedance_probability or 0.0,
+                    "exceedance_threshold_v": exceedance_threshold,
+                }
+            )
+    return rows
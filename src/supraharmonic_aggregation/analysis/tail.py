@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Mapping, Sequence
 
-from ..models import TailMetrics
+from ..models import StatisticsFrame, TailMetrics
 
 
 def _quantile(sorted_values: list[float], q: float) -> float:
@@ -42,3 +42,44 @@ def compute_tail_metrics(
 def adaptive_threshold(floor_threshold: float, rms_abs_v: float, multiplier: float) -> float:
     """Return an RMS-scaled threshold with a fixed lower bound."""
     return max(floor_threshold, multiplier * max(rms_abs_v, 0.0))
+
+
+def build_statistics_frame(
+    frequencies_khz: list[float],
+    per_frequency_samples: Mapping[str, Sequence[float]],
+    threshold: float | None,
+    threshold_rms_multiplier: float,
+) -> StatisticsFrame:
+    """Summarize |V| samples per frequency: moments, percentiles and exceedance.
+
+    The exceedance threshold is :func:`adaptive_threshold` of ``threshold`` and the
+    sample RMS.
+    """
+    rows: StatisticsFrame = []
+    for frequency in frequencies_khz:
+        key = str(frequency)
+        values = per_frequency_samples[key]
+        mean_abs_v = sum(values) / len(values) if values else 0.0
+        var_v = sum((value - mean_abs_v) ** 2 for value in values) / len(values) if values else 0.0
+        rms_abs_v = (mean_abs_v**2 + var_v) ** 0.5
+        tail_threshold = adaptive_threshold(
+            floor_threshold=threshold or 0.0,
+            rms_abs_v=rms_abs_v,
+            multiplier=threshold_rms_multiplier,
+        )
+        tail = compute_tail_metrics(values, threshold=tail_threshold)
+        rows.append(
+            {
+                "frequency_khz": frequency,
+                "mean_abs_v": mean_abs_v,
+                "var_v": var_v,
+                "rms_abs_v": rms_abs_v,
+                "p90_abs_v": tail.percentiles.get(90, 0.0),
+                "p95_abs_v": tail.percentiles.get(95, 0.0),
+                "p99_abs_v": tail.percentiles.get(99, 0.0),
+                "exceedance_probability": tail.exceedance_probability or 0.0,
+                "exceedance_threshold_v": tail_threshold,
+                "sample_size": tail.sample_size,
+            }
+        )
+    return rows
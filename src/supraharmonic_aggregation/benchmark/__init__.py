@@ -2,9 +2,17 @@
 
 from .compare import compare_with_feeder_benchmark
 from .independent import IndependentBenchmarkResult, IndependentBenchmarkRunner
+from .timing import (
+    benchmark_intensity_samplers,
+    benchmark_kernel_plan,
+    benchmark_poisson_sampler,
+)
 
 __all__ = [
     "compare_with_feeder_benchmark",
     "IndependentBenchmarkRunner",
     "IndependentBenchmarkResult",
+    "benchmark_kernel_plan",
+    "benchmark_poisson_sampler",
+    "benchmark_intensity_samplers",
 ]
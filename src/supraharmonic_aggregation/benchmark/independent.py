@@ -5,11 +5,15 @@ from __future__ import annotations
 import cmath
 import math
 import random
+from array import array
 from dataclasses import dataclass
 
 from ..analysis.tail import adaptive_threshold, compute_tail_metrics
 from ..config import AnalysisConfig
+from ..core.batch import batch_ranges
 from ..core.kernel import ExponentialKernel
+from ..core.poisson import sample_poisson
+from ..core.streams import STREAM_MODES, stream_rng
 from ..models import StatisticsFrame
 
 
@@ -21,34 +25,10 @@ class IndependentBenchmarkResult:
     statistics_frame: StatisticsFrame
 
 
-def _sample_poisson(lam: float, rng: random.Random) -> int:
-    if lam <= 0:
-        return 0
-    if lam <= 40.0:
-        limit = math.exp(-lam)
-        k = 0
-        p = 1.0
-        while p > limit:
-            k += 1
-            p *= rng.random()
-        return max(k - 1, 0)
-    if lam <= 5_000.0:
-        whole = int(lam // 40.0)
-        remainder = lam - (whole * 40.0)
-        total = 0
-        for _ in range(whole):
-            total += _sample_poisson(40.0, rng)
-        if remainder > 0:
-            total += _sample_poisson(remainder, rng)
-        return total
-    draw = int(round(rng.gauss(lam, math.sqrt(lam))))
-    return max(draw, 0)
-
-
 def _sample_count(mean_count: float, overdispersion_k: float, rng: random.Random) -> int:
     scale = mean_count / max(overdispersion_k, 1e-9)
     gamma_rate = rng.gammavariate(overdispersion_k, scale)
-    return _sample_poisson(gamma_rate, rng)
+    return sample_poisson(gamma_rate, rng)
 
 
 def _sample_distance(region_radius_m: float, rng: random.Random) -> float:
@@ -71,6 +51,11 @@ def _independent_kernel(config: AnalysisConfig) -> ExponentialKernel:
     )
 
 
+def _standard_normals(count: int, rng: random.Random) -> array:
+    gauss = rng.gauss
+    return array("d", [gauss(0.0, 1.0) for _ in range(count)])
+
+
 def _frequency_correction(frequency_khz: float) -> float:
     low_edge = 0.83 * math.exp(-frequency_khz / 3.8)
     high_sigmoid = 1.0 / (1.0 + math.exp(-(frequency_khz - 70.0) / 12.0))
@@ -115,11 +100,27 @@ def _summarize_statistics(
 
 
 class IndependentBenchmarkRunner:
-    """Generate a benchmark using an intentionally different model family."""
+    """Generate a benchmark using an intentionally different model family.
+
+    Realizations are drawn in seed order and their kernel grids evaluated ``batch_size``
+    at a time; samples do not depend on the batch size. ``streams="keyed"`` draws
+    realization ``k`` from its own stream keyed by ``(seed, k, "independent")``, and its
+    per-frequency jitter is drawn frequency by frequency during evaluation. A sequential
+    stream has to run ahead to the next realization, so there the jitter is drawn up
+    front into one packed float64 buffer per realization.
+    """
 
-    def __init__(self, config: AnalysisConfig, seed: int | None = None) -> None:
+    def __init__(
+        self,
+        config: AnalysisConfig,
+        seed: int | None = None,
+        batch_size: int | None = None,
+        streams: str | None = None,
+    ) -> None:
         self.config = config
         self.seed = config.seed if seed is None else seed
+        self.batch_size = config.simulation_batch_size if batch_size is None else batch_size
+        self.streams = config.simulation_streams if streams is None else streams
 
     def run(
         self,
@@ -129,6 +130,9 @@ class IndependentBenchmarkRunner:
         self.config.validate()
         if n_samples <= 0:
             raise ValueError("n_samples must be positive.")
+        if self.streams not in STREAM_MODES:
+            raise ValueError(f"Unsupported streams: {self.streams}")
+        keyed = self.streams == "keyed"
         freqs = list(frequencies_khz or self.config.frequencies_khz)
         rng = random.Random(self.seed)
         area_km2 = math.pi * (self.config.region_radius_m / 1000.0) ** 2
@@ -137,54 +141,55 @@ class IndependentBenchmarkRunner:
         kernel = _independent_kernel(self.config)
 
         per_frequency_samples: dict[str, list[float]] = {str(freq): [] for freq in freqs}
-        for _ in range(n_samples):
-            n_sources = _sample_count(mean_count, overdispersion_k, rng)
-            common_phase = rng.uniform(0.0, 2.0 * math.pi)
-            source_distances = [
-                _sample_distance(self.config.region_radius_m, rng) for _ in range(n_sources)
+        add_noise = self.config.measurement_noise_cv > 0
+        for start, stop in batch_ranges(n_samples, self.batch_size):
+            streams = [
+                stream_rng(self.seed, index, "independent") if keyed else rng
+                for index in range(start, stop)
             ]
-            sigma_ln = 0.30 + 0.12 * (1.0 - self.config.coherence)
-            mu_ln = math.log(max(self.config.base_current_a, 1e-9)) - 0.5 * sigma_ln * sigma_ln
-            source_base_amplitudes = [
-                min(
-                    max(rng.lognormvariate(mu_ln, sigma_ln), 1e-6),
-                    max(self.config.base_current_a, 1e-6) * 25.0,
+            realizations = [
+                self._draw_realization(
+                    0 if keyed else len(freqs), mean_count, overdispersion_k, add_noise, source
                 )
-                for _ in range(n_sources)
+                for source in streams
             ]
-            for idx in range(n_sources):
-                if rng.random() < 0.03:
-                    source_base_amplitudes[idx] *= 1.0 + rng.paretovariate(3.5)
-            kappa = 0.35 + 18.0 * self.config.coherence
-            source_phase_offsets = [
-                rng.vonmisesvariate(common_phase, kappa) for _ in range(n_sources)
-            ]
-            source_admittances = [
-                max(self.config.admittance_s * rng.lognormvariate(-0.03, 0.28), 1e-6)
-                for _ in range(n_sources)
-            ]
-
-            for frequency in freqs:
-                total = 0j
-                log_ratio = math.log(max(frequency, 1e-9) / 30.0)
-                for idx in range(n_sources):
-                    tilt = math.exp(rng.gauss(0.0, 0.18) * log_ratio)
-                    amplitude = source_base_amplitudes[idx] * tilt
-                    phase = source_phase_offsets[idx] + rng.gauss(0.0, 0.018) * frequency
-                    current = amplitude * cmath.exp(1j * phase)
-                    z_tr = kernel.impedance(frequency, source_distances[idx])
-                    damping = 1.0 + source_admittances[idx] * abs(z_tr) + 0.15 * abs(z_tr)
-                    total += (z_tr * current) / max(damping, 1e-9)
-
-                observed_abs_v = abs(total)
-                observed_abs_v *= _frequency_correction(frequency)
-                if self.config.measurement_noise_cv > 0:
-                    observed_abs_v = observed_abs_v * (1.0 + self.config.measurement_bias)
-                    observed_abs_v += rng.gauss(
-                        0.0, self.config.measurement_noise_cv * max(observed_abs_v, 1e-6)
-                    )
-                    observed_abs_v = max(observed_abs_v, 0.0)
-                per_frequency_samples[str(frequency)].append(observed_abs_v)
+            offsets = [0]
+            batch_distances: list[float] = []
+            for realization in realizations:
+                batch_distances.extend(realization[0])
+                offsets.append(len(batch_distances))
+            impedance_rows = kernel.impedance_grid(freqs, batch_distances)
+
+            for realization, offset, source in zip(realizations, offsets, streams):
+                _, base_amplitudes, phase_offsets, admittances, normals = realization
+                n_sources = len(base_amplitudes)
+                width = 2 * n_sources + add_noise
+                for freq_idx, frequency in enumerate(freqs):
+                    impedance_row = impedance_rows[freq_idx]
+                    if keyed:
+                        draws = _standard_normals(width, source)
+                    else:
+                        draws = normals[freq_idx * width : (freq_idx + 1) * width]
+                    total = 0j
+                    log_ratio = math.log(max(frequency, 1e-9) / 30.0)
+                    for idx in range(n_sources):
+                        tilt = math.exp((0.0 + draws[2 * idx] * 0.18) * log_ratio)
+                        amplitude = base_amplitudes[idx] * tilt
+                        phase = phase_offsets[idx] + (0.0 + draws[2 * idx + 1] * 0.018) * frequency
+                        current = amplitude * cmath.exp(1j * phase)
+                        z_tr = impedance_row[offset + idx]
+                        damping = 1.0 + admittances[idx] * abs(z_tr) + 0.15 * abs(z_tr)
+                        total += (z_tr * current) / max(damping, 1e-9)
+
+                    observed_abs_v = abs(total)
+                    observed_abs_v *= _frequency_correction(frequency)
+                    if add_noise:
+                        observed_abs_v = observed_abs_v * (1.0 + self.config.measurement_bias)
+                        observed_abs_v += 0.0 + draws[-1] * (
+                            self.config.measurement_noise_cv * max(observed_abs_v, 1e-6)
+                        )
+                        observed_abs_v = max(observed_abs_v, 0.0)
+                    per_frequency_samples[str(frequency)].append(observed_abs_v)
 
         statistics_frame = _summarize_statistics(
             frequencies_khz=freqs,
@@ -196,3 +201,49 @@ class IndependentBenchmarkRunner:
             per_frequency_samples=per_frequency_samples,
             statistics_frame=statistics_frame,
         )
+
+    def _draw_realization(
+        self,
+        n_frequencies: int,
+        mean_count: float,
+        overdispersion_k: float,
+        add_noise: bool,
+        rng: random.Random,
+    ) -> tuple[list[float], list[float], list[float], list[float], array]:
+        """Draw one realization and the standard normals of ``n_frequencies`` frequencies.
+
+        Normals are drawn in the same order as an unbatched evaluation (tilt and phase
+        jitter per source, then measurement noise, frequency by frequency), since
+        ``rng.gauss(0, s)`` equals ``0 + z * s`` for the underlying standard draw.
+        """
+        n_sources = _sample_count(mean_count, overdispersion_k, rng)
+        common_phase = rng.uniform(0.0, 2.0 * math.pi)
+        source_distances = [
+            _sample_distance(self.config.region_radius_m, rng) for _ in range(n_sources)
+        ]
+        sigma_ln = 0.30 + 0.12 * (1.0 - self.config.coherence)
+        mu_ln = math.log(max(self.config.base_current_a, 1e-9)) - 0.5 * sigma_ln * sigma_ln
+        source_base_amplitudes = [
+            min(
+                max(rng.lognormvariate(mu_ln, sigma_ln), 1e-6),
+                max(self.config.base_current_a, 1e-6) * 25.0,
+            )
+            for _ in range(n_sources)
+        ]
+        for idx in range(n_sources):
+            if rng.random() < 0.03:
+                source_base_amplitudes[idx] *= 1.0 + rng.paretovariate(3.5)
+        kappa = 0.35 + 18.0 * self.config.coherence
+        source_phase_offsets = [rng.vonmisesvariate(common_phase, kappa) for _ in range(n_sources)]
+        source_admittances = [
+            max(self.config.admittance_s * rng.lognormvariate(-0.03, 0.28), 1e-6)
+            for _ in range(n_sources)
+        ]
+        normals = _standard_normals(n_frequencies * (2 * n_sources + add_noise), rng)
+        return (
+            source_distances,
+            source_base_amplitudes,
+            source_phase_offsets,
+            source_admittances,
+            normals,
+        )
@@ -0,0 +1,164 @@
+"""Micro-benchmarks for hot-path kernel and sampling routines."""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from typing import Callable
+
+from .._optional import optional_numpy
+from ..core.intensity import PlanarIntensity, RadialIntensity
+from ..core.kernel import ExponentialKernel
+from ..core.poisson import sample_poisson, sample_poisson_batch
+from ..models import StatisticsFrame
+
+_np = optional_numpy()  # Optional array backend for the batched comparison.
+
+
+def _best_of(repeats: int, func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(max(repeats, 1)):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_kernel_plan(
+    kernel: ExponentialKernel | None = None,
+    frequencies_khz: list[float] | None = None,
+    n_sources: int = 2000,
+    region_radius_m: float = 500.0,
+    repeats: int = 3,
+    seed: int = 7,
+) -> StatisticsFrame:
+    """Compare per-source cost of ``kernel.impedance`` against a reused ``kernel.plan``."""
+    if n_sources <= 0:
+        raise ValueError("n_sources must be positive.")
+    model = kernel or ExponentialKernel(alpha=0.8, resonance_scale=0.05)
+    freqs = list(frequencies_khz or [2.0, 30.0, 150.0])
+    rng = random.Random(seed)
+    distances = [region_radius_m * rng.random() ** 0.5 for _ in range(n_sources)]
+
+    rows: StatisticsFrame = []
+    for frequency in freqs:
+        direct_s = _best_of(
+            repeats, lambda: [model.impedance(frequency, distance) for distance in distances]
+        )
+        planned_s = _best_of(repeats, lambda: model.plan(frequency).impedances(distances))
+        rows.append(
+            {
+                "frequency_khz": frequency,
+                "n_sources": n_sources,
+                "direct_ns_per_source": 1e9 * direct_s / n_sources,
+                "planned_ns_per_source": 1e9 * planned_s / n_sources,
+                "speedup": direct_s / max(planned_s, 1e-12),
+            }
+        )
+    return rows
+
+
+def _chunked_knuth_poisson(lam: float, rng: random.Random) -> int:
+    # The sampler formerly used by the population generators, kept as the baseline.
+    if lam <= 0:
+        return 0
+    if lam <= 40.0:
+        limit = math.exp(-lam)
+        k = 0
+        p = 1.0
+        while p > limit:
+            k += 1
+            p *= rng.random()
+        return max(k - 1, 0)
+    if lam <= 5_000.0:
+        whole = int(lam // 40.0)
+        remainder = lam - (whole * 40.0)
+        total = 0
+        for _ in range(whole):
+            total += _chunked_knuth_poisson(40.0, rng)
+        if remainder > 0:
+            total += _chunked_knuth_poisson(remainder, rng)
+        return total
+    draw = int(round(rng.gauss(lam, math.sqrt(lam))))
+    return max(draw, 0)
+
+
+def benchmark_poisson_sampler(
+    means: list[float] | None = None,
+    n_draws: int = 2000,
+    repeats: int = 3,
+    seed: int = 7,
+) -> StatisticsFrame:
+    """Compare the chunked Knuth loop with the shared PTRS sampler across means.
+
+    Also reports the sample means, and the batched numpy sampler when numpy is installed.
+    """
+    if n_draws <= 0:
+        raise ValueError("n_draws must be positive.")
+    rows: StatisticsFrame = []
+    for lam in means or [5.0, 40.0, 500.0, 5_000.0, 50_000.0]:
+        rng = random.Random(seed)
+        legacy: list[int] = []
+        ptrs: list[int] = []
+
+        def run_legacy() -> None:
+            legacy[:] = [_chunked_knuth_poisson(lam, rng) for _ in range(n_draws)]
+
+        def run_ptrs() -> None:
+            ptrs[:] = [sample_poisson(lam, rng) for _ in range(n_draws)]
+
+        legacy_s = _best_of(repeats, run_legacy)
+        ptrs_s = _best_of(repeats, run_ptrs)
+        row: dict[str, float | int | str] = {
+            "lambda": lam,
+            "n_draws": n_draws,
+            "legacy_us_per_draw": 1e6 * legacy_s / n_draws,
+            "ptrs_us_per_draw": 1e6 * ptrs_s / n_draws,
+            "speedup": legacy_s / max(ptrs_s, 1e-12),
+            "legacy_sample_mean": sum(legacy) / n_draws,
+            "ptrs_sample_mean": sum(ptrs) / n_draws,
+        }
+        if _np is not None:
+            generator = _np.random.default_rng(seed)
+            batch_s = _best_of(repeats, lambda: sample_poisson_batch(lam, generator, n_draws))
+            row["batch_us_per_draw"] = 1e6 * batch_s / n_draws
+        rows.append(row)
+    return rows
+
+
+def benchmark_intensity_samplers(
+    samplers: dict[str, RadialIntensity | PlanarIntensity],
+    region_radius_m: float = 500.0,
+    n_realizations: int = 20,
+    seed: int = 7,
+) -> StatisticsFrame:
+    """Report acceptance rate and throughput of inhomogeneous intensity samplers.
+
+    Counters are differences of each sampler's cumulative ``stats``; the first call for a
+    new region radius also times building its table or majorant.
+    """
+    if n_realizations <= 0:
+        raise ValueError("n_realizations must be positive.")
+    rows: StatisticsFrame = []
+    for name, sampler in samplers.items():
+        stats = sampler.stats
+        before = (stats.proposed, stats.accepted, stats.majorant_violations, stats.elapsed_s)
+        rng = random.Random(seed)
+        for _ in range(n_realizations):
+            sampler.sample_points(region_radius_m, rng)
+        proposed = stats.proposed - before[0]
+        accepted = stats.accepted - before[1]
+        elapsed_s = stats.elapsed_s - before[3]
+        rows.append(
+            {
+                "sampler": name,
+                "n_realizations": n_realizations,
+                "mean_points": accepted / n_realizations,
+                "proposals_per_point": proposed / accepted if accepted else 0.0,
+                "acceptance_rate": accepted / proposed if proposed else 0.0,
+                "majorant_violations": stats.majorant_violations - before[2],
+                "points_per_second": accepted / elapsed_s if elapsed_s > 0 else 0.0,
+            }
+        )
+    return rows
@@ -0,0 +1,200 @@
+"""Content-addressed on-disk store for deterministic kernel results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+
+from .config import AnalysisConfig
+
+_SCHEMA_VERSION = 1
+_SUFFIX = ".f64"
+_TMP_SUFFIX = ".tmp"
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Occupancy and counters of an on-disk array store."""
+
+    directory: str
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+def cache_key(namespace: str, payload: dict[str, Any]) -> str:
+    """Return the canonical content hash for a namespaced input payload."""
+    canonical = json.dumps(
+        {"schema": _SCHEMA_VERSION, "namespace": namespace, "payload": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ArrayStore:
+    """Size-capped LRU directory of float64 arrays keyed by input hash.
+
+    Each entry is a raw native-endian float64 file, so readers map it read-only instead
+    of copying (``numpy.memmap(path, dtype="float64")`` reads the same files). Entry
+    recency is tracked through file modification times, which keeps eviction consistent
+    across processes sharing one directory.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 512 * 1024 * 1024) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path_for(self, key: str) -> Path:
+        """Return the entry path for a cache key."""
+        return self.directory / key[:2] / f"{key}{_SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return [path for path in self.directory.glob(f"*/*{_SUFFIX}") if path.is_file()]
+
+    def _remove_orphans(self, max_age_s: float = 3600.0) -> int:
+        """Delete temporary files left by interrupted writes older than ``max_age_s``."""
+        if not self.directory.exists():
+            return 0
+        removed = 0
+        cutoff = time.time() - max_age_s
+        for path in self.directory.glob(f"*/*{_TMP_SUFFIX}"):
+            try:
+                if path.stat().st_mtime <= cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:  # pragma: no cover - removed concurrently
+                continue
+        return removed
+
+    def get(self, key: str) -> memoryview[float] | None:
+        """Return a read-only float64 view of an entry, or None on a miss."""
+        path = self.path_for(key)
+        view: memoryview[float]
+        try:
+            with path.open("rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                if size == 0:
+                    view = memoryview(array("d"))
+                else:
+                    mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                    view = memoryview(mapped).cast("d")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:  # pragma: no cover - entry evicted concurrently
+            pass
+        self.hits += 1
+        return view
+
+    def put(self, key: str, values: Sequence[float]) -> None:
+        """Write an entry atomically and evict least-recently-used entries over the cap."""
+        path = self.path_for(key)
+        self._write(path, values)
+        self._evict(keep=path)
+
+    def put_many(self, items: Iterable[tuple[str, Sequence[float]]]) -> int:
+        """Write several entries, then evict once; return how many were written."""
+        written = 0
+        for key, values in items:
+            self._write(self.path_for(key), values)
+            written += 1
+        if written:
+            self._evict()
+        return written
+
+    def _write(self, path: Path, values: Sequence[float]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}{_TMP_SUFFIX}")
+        with tmp.open("wb") as handle:
+            array("d", values).tofile(handle)
+        os.replace(tmp, path)
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        payload: dict[str, Any],
+        compute: Callable[[], Sequence[float]],
+    ) -> Sequence[float]:
+        """Return the cached array for ``payload`` or compute and store it."""
+        key = cache_key(namespace, payload)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        values = list(compute())
+        self.put(key, values)
+        return values
+
+    def _evict(self, keep: Path | None = None) -> None:
+        self._remove_orphans()
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover - concurrent eviction
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        entries.sort(key=lambda item: item[0])
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> CacheStats:
+        """Return entry count, bytes on disk and this process's counters."""
+        sizes: list[int] = []
+        for path in self._entries():
+            try:
+                sizes.append(path.stat().st_size)
+            except FileNotFoundError:  # pragma: no cover - concurrent eviction
+                continue
+        return CacheStats(
+            directory=str(self.directory),
+            entries=len(sizes),
+            total_bytes=sum(sizes),
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def clear(self) -> int:
+        """Remove all entries and temporary files; return how many entries were deleted."""
+        removed = 0
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+            removed += 1
+        self._remove_orphans(max_age_s=0.0)
+        return removed
+
+
+def open_store(config: AnalysisConfig) -> ArrayStore | None:
+    """Return the store configured by ``config.cache_dir``, or None when disabled."""
+    if not config.cache_dir:
+        return None
+    return ArrayStore(config.cache_dir, max_bytes=int(config.cache_max_mb * 1024 * 1024))
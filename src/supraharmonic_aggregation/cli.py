@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import argparse
 import json
+from dataclasses import asdict
 from pathlib import Path
 
 from .api import default_config, run_pipeline
-from .config import save_config
+from .cache import ArrayStore
+from .config import load_config, save_config
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -33,14 +35,44 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Write default configuration JSON to this path and exit.",
     )
+    subcommands = parser.add_subparsers(dest="command")
+    cache = subcommands.add_parser("cache", help="Inspect or clear the kernel result cache.")
+    cache.add_argument("action", choices=["stats", "clear"], help="Cache operation to run.")
+    cache.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Cache directory (defaults to cache_dir from --config).",
+    )
     return parser
 
 
+def _run_cache_command(args: argparse.Namespace) -> int:
+    cache_dir = args.cache_dir
+    cache_max_mb = default_config().cache_max_mb
+    if cache_dir is None:
+        config = load_config(args.config)
+        cache_dir = config.cache_dir
+        cache_max_mb = config.cache_max_mb
+    if not cache_dir:
+        print("No cache directory configured; pass --cache-dir or set cache_dir in --config.")
+        return 1
+    store = ArrayStore(cache_dir, max_bytes=int(cache_max_mb * 1024 * 1024))
+    if args.action == "clear":
+        print(json.dumps({"directory": cache_dir, "removed_entries": store.clear()}, indent=2))
+        return 0
+    print(json.dumps(asdict(store.stats()), indent=2))
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """Run CLI pipeline and return process status code."""
     parser = _build_parser()
     args = parser.parse_args(argv)
 
+    if args.command == "cache":
+        return _run_cache_command(args)
+
     if args.write_default_config:
         path = save_config(default_config(), args.write_default_config)
         print(f"Wrote default config: {path}")
@@ -22,6 +22,10 @@ class AnalysisConfig:
     threshold: float = 1.0
     threshold_rms_multiplier: float = 1.5
     monte_carlo_samples: int = 128
+    simulation_batch_size: int = 64
+    simulation_precision: str = "float64"
+    simulation_sampler: str = "python"
+    simulation_streams: str = "sequential"
     analytical_proxy_samples: int = 96
     measurement_noise_cv: float = 0.03
     measurement_bias: float = 0.0
@@ -29,6 +33,8 @@ class AnalysisConfig:
     review_ready_frequency_step_khz: float = 1.0
     seed: int = 7
     log_dir: str = "logs"
+    cache_dir: str | None = None
+    cache_max_mb: float = 512.0
     output_dir: str = "manuscript/artifacts"
 
     def validate(self) -> None:
@@ -51,6 +57,14 @@ class AnalysisConfig:
             raise ValueError("threshold must be positive.")
         if self.threshold_rms_multiplier <= 0:
             raise ValueError("threshold_rms_multiplier must be positive.")
+        if self.simulation_batch_size <= 0:
+            raise ValueError("simulation_batch_size must be positive.")
+        if self.simulation_precision not in ("float64", "float32"):
+            raise ValueError("simulation_precision must be 'float64' or 'float32'.")
+        if self.simulation_sampler not in ("python", "numpy", "qmc"):
+            raise ValueError("simulation_sampler must be 'python', 'numpy' or 'qmc'.")
+        if self.simulation_streams not in ("sequential", "keyed"):
+            raise ValueError("simulation_streams must be 'sequential' or 'keyed'.")
         if self.analytical_proxy_samples <= 0:
             raise ValueError("analytical_proxy_samples must be positive.")
         if self.measurement_noise_cv < 0:
@@ -61,6 +75,8 @@ class AnalysisConfig:
             raise ValueError("review_ready_min_samples must be positive.")
         if self.review_ready_frequency_step_khz <= 0:
             raise ValueError("review_ready_frequency_step_khz must be positive.")
+        if self.cache_max_mb <= 0:
+            raise ValueError("cache_max_mb must be positive.")
 
     def to_dict(self) -> dict[str, object]:
         """Return a dict representation."""
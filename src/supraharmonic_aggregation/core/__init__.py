@@ -1,15 +1,52 @@
 """Core model components."""
 
 from .aggregator import Source, SourcePopulation, SupraharmonicAggregator
+from .batch import PopulationBatch
+from .intensity import PlanarIntensity, RadialIntensity
 from .kernel import ExponentialKernel, PropagationKernel
-from .marks import SourceMark, generate_source_population
+from .mark_families import AmplitudeFamily, mark_family, register_mark_family
+from .marks import SourceColumns, SourceMark, generate_source_population
+from .point_process import (
+    MaternClusterProcess,
+    MaternHardCoreProcess,
+    PointProcess,
+    PoissonProcess,
+    StraussProcess,
+    ThomasProcess,
+    generate_process_population,
+)
+from .population_bank import PopulationBank, PopulationKey
+from .sampling import sample_population_batch
+from .tabulated import TabulatedKernel
+from .topology import CableType, FeederSegment, RadialFeederKernel
 
 __all__ = [
     "PropagationKernel",
     "ExponentialKernel",
+    "TabulatedKernel",
+    "CableType",
+    "FeederSegment",
+    "RadialFeederKernel",
     "SourceMark",
+    "SourceColumns",
     "Source",
     "SourcePopulation",
+    "PopulationBatch",
     "generate_source_population",
+    "AmplitudeFamily",
+    "mark_family",
+    "register_mark_family",
+    "sample_population_batch",
+    "PopulationBank",
+    "PopulationKey",
+    "PointProcess",
+    "PoissonProcess",
+    "ThomasProcess",
+    "MaternClusterProcess",
+    "MaternHardCoreProcess",
+    "StraussProcess",
+    "generate_process_population",
+    "RadialIntensity",
+    "PlanarIntensity",
     "SupraharmonicAggregator",
 ]
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import bisect
 import cmath
+import math
 from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Literal, Sequence
 
+from .._optional import optional_numpy
 from .kernel import PropagationKernel
 
+_np = optional_numpy()  # Optional array backend for the reduced-precision batch path.
+
+if TYPE_CHECKING:
+    from .batch import PopulationBatch
+    from .marks import SourceColumns
+    from .safeguard import SafeguardTelemetry
+
 
 @dataclass(slots=True)
 class Source:
@@ -17,14 +29,42 @@ class Source:
 
 
 SourcePopulation = list[Source]
+Precision = Literal["float64", "float32"]
+
+
+@dataclass(slots=True)
+class PrunedSpectrum:
+    """Spectrum of the retained near sources with an estimate of the skipped far tail."""
+
+    values: list[complex]
+    error_estimates_v: list[float]
+    pruned_fractions: list[float]
+
+
+def regularize_denominator(denominator: complex, floor: float) -> complex:
+    """Rescale ``denominator`` to magnitude ``floor`` if it is smaller, keeping its phase."""
+    magnitude = abs(denominator)
+    if magnitude >= floor:
+        return denominator
+    if magnitude <= 0.0:
+        return complex(floor, 0.0)
+    return denominator * (floor / magnitude)
 
 
 class SupraharmonicAggregator:
     """Compute aggregate complex voltage from source populations."""
 
-    def __init__(self, kernel: PropagationKernel, min_denominator_magnitude: float = 1e-6) -> None:
+    def __init__(
+        self,
+        kernel: PropagationKernel,
+        min_denominator_magnitude: float = 1e-6,
+        phasor_anchor_interval: int = 32,
+    ) -> None:
         self.kernel = kernel
         self.min_denominator_magnitude = max(min_denominator_magnitude, 1e-12)
+        # Spectra on uniform grids advance source phasors by a fixed rotation and
+        # re-evaluate them exactly every this many steps (1 disables the recurrence).
+        self.phasor_anchor_interval = max(int(phasor_anchor_interval), 1)
 
     @staticmethod
     def _resolve_mark_value(
@@ -38,17 +78,78 @@ class SupraharmonicAggregator:
             return float(method(frequency_khz))
         return float(getattr(mark, attr_name))
 
+    def _impedance_at(self, frequency_khz: float) -> Callable[[float], complex]:
+        # Kernels exposing plan() hoist their frequency-only terms once per call.
+        plan = getattr(self.kernel, "plan", None)
+        if callable(plan):
+            return plan(frequency_khz).impedance
+        return partial(self.kernel.impedance, frequency_khz)
+
+    def _kernel_rows(
+        self, frequencies_khz: Sequence[float], distances_m: Sequence[float]
+    ) -> list[list[complex]]:
+        grid = getattr(self.kernel, "impedance_grid", None)
+        if callable(grid):
+            return grid(frequencies_khz, distances_m)
+        rows: list[list[complex]] = []
+        for frequency in frequencies_khz:
+            impedance_at = self._impedance_at(frequency)
+            rows.append([impedance_at(distance) for distance in distances_m])
+        return rows
+
     def _regularize_denominator(self, denominator: complex) -> complex:
-        magnitude = abs(denominator)
-        if magnitude >= self.min_denominator_magnitude:
-            return denominator
-        if magnitude <= 0.0:
-            return complex(self.min_denominator_magnitude, 0.0)
-        return denominator * (self.min_denominator_magnitude / magnitude)
-
-    def aggregate_complex_voltage(self, frequency_khz: float, sources: SourcePopulation) -> complex:
-        """Aggregate complex source contributions at one frequency."""
+        return regularize_denominator(denominator, self.min_denominator_magnitude)
+
+    def aggregate_columns(self, frequency_khz: float, columns: SourceColumns) -> complex:
+        """Aggregate a columnar population at one frequency.
+
+        Marks are read from the columns without per-source attribute dispatch and, when
+        numpy is available, shaped and summed as arrays; the kernel row goes through
+        ``impedance_grid`` (numpy-backed when available).
+        """
+        impedances = self._kernel_rows([frequency_khz], columns.distance_m)[0]
+        floor = self.min_denominator_magnitude
+        if _np is not None:
+            currents, admittances = columns.shaped_arrays(frequency_khz)
+            z_tr = _np.asarray(impedances, dtype=complex)
+            denominators = 1 + admittances * z_tr
+            for idx in _np.flatnonzero(_np.abs(denominators) < floor):
+                denominators[idx] = self._regularize_denominator(complex(denominators[idx]))
+            return complex(_np.sum(z_tr * currents / denominators))
+        currents_list = columns.currents_at_frequency(frequency_khz)
+        admittances_list = columns.admittances_at_frequency(frequency_khz)
         total = 0j
+        for z_value, current, admittance in zip(impedances, currents_list, admittances_list):
+            denominator = 1 + admittance * z_value
+            if abs(denominator) < floor:
+                denominator = self._regularize_denominator(denominator)
+            total += (z_value * current) / denominator
+        return total
+
+    def aggregate_complex_voltage(
+        self, frequency_khz: float, sources: SourcePopulation | SourceColumns
+    ) -> complex:
+        """Aggregate complex source contributions at one frequency.
+
+        Columns are evaluated directly through :meth:`aggregate_columns`; populations of
+        plain SourceMarks are converted first, other mark types fall back to per-source
+        attribute dispatch. Callers evaluating several frequencies convert once with
+        :meth:`SourceColumns.from_population` and pass the columns, or use
+        :meth:`aggregate_spectrum`.
+        """
+        # Deferred import: marks imports Source from this module.
+        from .marks import SourceColumns
+
+        if isinstance(sources, SourceColumns):
+            return self.aggregate_columns(frequency_khz, sources)
+        columns = SourceColumns.from_population(sources)
+        if columns is None:
+            return self._aggregate_objects(frequency_khz, sources)
+        return self.aggregate_columns(frequency_khz, columns)
+
+    def _aggregate_objects(self, frequency_khz: float, sources: SourcePopulation) -> complex:
+        total = 0j
+        impedance_at = self._impedance_at(frequency_khz)
         for source in sources:
             amplitude = self._resolve_mark_value(
                 source.mark,
@@ -69,11 +170,498 @@ class SupraharmonicAggregator:
                 attr_name="admittance_s",
             )
             current = amplitude * cmath.exp(1j * phase)
-            z_tr = self.kernel.impedance(frequency_khz, source.distance_m)
+            z_tr = impedance_at(source.distance_m)
             denominator = self._regularize_denominator(1 + admittance * z_tr)
             total += (z_tr * current) / denominator
         return total
 
-    def aggregate_magnitude(self, frequency_khz: float, sources: SourcePopulation) -> float:
+    def aggregate_spectrum(
+        self,
+        frequencies_khz: Sequence[float],
+        sources: SourcePopulation | SourceColumns,
+        tile_size: int = 1024,
+    ) -> list[complex]:
+        """Aggregate one population at every frequency in a single pass.
+
+        Per-source invariants (log amplitude at the reference frequency, phase intercept)
+        are loaded once; sources are processed in tiles so the frequency x tile kernel
+        block stays bounded. On uniformly spaced frequencies each source phasor advances
+        by a constant rotation per step and the tilt stays in log space, with an exact
+        re-anchor every ``phasor_anchor_interval`` steps to bound drift. Agrees with
+        per-frequency aggregation to rounding.
+        """
+        from .marks import SourceColumns
+
+        freqs = list(frequencies_khz)
+        if isinstance(sources, SourceColumns):
+            columns = sources
+        else:
+            converted = SourceColumns.from_population(sources)
+            if converted is None:
+                return [self._aggregate_objects(frequency, sources) for frequency in freqs]
+            columns = converted
+        return self._segment_spectra(freqs, columns, [0, len(columns)], tile_size)[0]
+
+    def aggregate_spectrum_pruned(
+        self,
+        frequencies_khz: Sequence[float],
+        sources: SourcePopulation | SourceColumns,
+        tolerance_v: float,
+        envelope_points: int = 257,
+        envelope_safety: float = 1.05,
+        tile_size: int = 1024,
+        telemetry: SafeguardTelemetry | None = None,
+    ) -> PrunedSpectrum:
+        """Aggregate one population, skipping the far tail wherever it is estimated small.
+
+        Per frequency the kernel magnitude is sampled at ``envelope_points`` distances up
+        to the farthest source and turned into a non-increasing envelope ``E(d)`` (suffix
+        maximum over cells, times ``envelope_safety``). With sources sorted by distance,
+        the farthest are dropped while ``sum(A_i) * E(d) / max(1 - Y_max * E(d), floor)``
+        stays within ``tolerance_v``, where ``A_i`` bounds a source's current and
+        ``Y_max`` every shunt admittance over the whole frequency range. The envelope is
+        sampled, so ``error_estimates_v`` is an estimate rather than a guaranteed bound:
+        it holds only if the kernel does not peak between samples by more than
+        ``envelope_safety``. Raise ``envelope_points`` for kernels with sharp features.
+        """
+        from .marks import SourceColumns
+
+        if tolerance_v < 0:
+            raise ValueError("tolerance_v must be non-negative.")
+        if envelope_points < 2 or envelope_safety < 1.0:
+            raise ValueError("envelope_points must be >= 2 and envelope_safety >= 1.")
+        freqs = list(frequencies_khz)
+        if isinstance(sources, SourceColumns):
+            columns: SourceColumns | None = sources
+        else:
+            columns = SourceColumns.from_population(sources)
+        if columns is None:
+            raise ValueError("Pruning requires a population of plain SourceMarks.")
+        n_sources = len(columns)
+        if n_sources == 0 or not freqs:
+            if telemetry is not None:
+                telemetry.begin_realizations([0])
+            return PrunedSpectrum([0j] * len(freqs), [0.0] * len(freqs), [0.0] * len(freqs))
+
+        ordered = columns.take(sorted(range(n_sources), key=columns.distance_m.__getitem__))
+        f_lo = max(min(freqs), 1e-9)
+        f_hi = max(max(freqs), 1e-9)
+        # Power-law amplitudes and rolled-off admittances are monotone in frequency, so
+        # their extremes over the band sit at its edges.
+        log_lo = math.log(f_lo)
+        log_hi = math.log(f_hi)
+        amplitudes = [
+            max(
+                amplitude
+                * math.exp(tilt * (max(log_lo, log_hi) if tilt >= 0 else min(log_lo, log_hi)))
+                / max(f_ref, 1e-9) ** tilt,
+                1e-9,
+            )
+            for amplitude, tilt, f_ref in zip(
+                ordered.amplitude_a,
+                ordered.spectral_tilt_per_decade,
+                ordered.reference_frequency_khz,
+            )
+        ]
+        tail_amplitude = [0.0] * (n_sources + 1)
+        for idx in range(n_sources - 1, -1, -1):
+            tail_amplitude[idx] = tail_amplitude[idx + 1] + amplitudes[idx]
+        y_max = max(
+            admittance / (1.0 + rolloff * max(frequency - f_ref, 0.0))
+            for admittance, rolloff, f_ref in zip(
+                ordered.admittance_s,
+                ordered.admittance_rolloff_per_khz,
+                ordered.reference_frequency_khz,
+            )
+            for frequency in (f_lo, f_hi)
+        )
+
+        radius = max(ordered.distance_m[-1], 1e-9)
+        cells = envelope_points - 1
+        grid = [radius * idx / cells for idx in range(envelope_points)]
+        floor = self.min_denominator_magnitude
+        limits: list[int] = []
+        error_estimates: list[float] = []
+        for row in self._kernel_rows(freqs, grid):
+            magnitudes = [abs(value) for value in row]
+            envelope = [0.0] * cells
+            running = magnitudes[-1]
+            for cell in range(cells - 1, -1, -1):
+                running = max(running, magnitudes[cell])
+                envelope[cell] = running * envelope_safety
+
+            def tail_estimate(first: int) -> float:
+                """Estimated bound on the summed contribution of sources ``first`` onwards."""
+                cell = min(int(ordered.distance_m[first] / radius * cells), cells - 1)
+                magnitude = envelope[cell]
+                denominator = max(1.0 - y_max * magnitude, floor)
+                return tail_amplitude[first] * magnitude / denominator
+
+            # The estimate grows as the cut moves inwards, so the cut is a bisection.
+            lo, hi = 0, n_sources
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if tail_estimate(mid) <= tolerance_v:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            limits.append(lo)
+            error_estimates.append(tail_estimate(lo) if lo < n_sources else 0.0)
+
+        values = self._segment_spectra(
+            freqs, ordered, [0, n_sources], tile_size, telemetry, limits
+        )[0]
+        return PrunedSpectrum(
+            values=values,
+            error_estimates_v=error_estimates,
+            pruned_fractions=[(n_sources - keep) / n_sources for keep in limits],
+        )
+
+    def aggregate_batch(
+        self,
+        frequencies_khz: Sequence[float],
+        populations: PopulationBatch | Sequence[SourcePopulation],
+        tile_size: int = 1024,
+        precision: Precision = "float64",
+        telemetry: SafeguardTelemetry | None = None,
+    ) -> list[list[complex]]:
+        """Aggregate many realizations into a realizations x frequencies matrix.
+
+        Small realizations share kernel tiles, and per-realization sums are segmented
+        reductions over the flat columns. Each row equals :meth:`aggregate_spectrum` of
+        that realization with the same ``tile_size``, independent of how realizations
+        are grouped into batches.
+
+        ``precision="float32"`` evaluates marks and contributions in numpy
+        float32/complex64 with compensated per-realization sums; without numpy it falls
+        back to the float64 path.
+
+        A ``telemetry`` object receives the realizations in order and counts (and, if it
+        records, stores) every source whose denominator falls below its gate. Raw
+        records need the float64 path.
+        """
+        from .batch import PopulationBatch
+
+        if precision not in ("float64", "float32"):
+            raise ValueError(f"Unsupported precision: {precision}")
+        reduced = precision == "float32" and _np is not None
+        if telemetry is not None:
+            if telemetry.min_denominator_magnitude != self.min_denominator_magnitude:
+                raise ValueError("telemetry must use the aggregator's min_denominator_magnitude.")
+            if reduced and telemetry.record_below is not None:
+                raise ValueError("Recording raw denominators requires precision='float64'.")
+        freqs = list(frequencies_khz)
+        if isinstance(populations, PopulationBatch):
+            batch = populations
+        else:
+            converted = PopulationBatch.from_populations(populations)
+            if converted is None:
+                if telemetry is not None:
+                    raise ValueError("Safeguard telemetry requires plain SourceMark populations.")
+                return [
+                    self.aggregate_spectrum(freqs, population, tile_size)
+                    for population in populations
+                ]
+            batch = converted
+        if reduced:
+            return self._float32_spectra(
+                freqs, batch.columns, batch.offsets, tile_size, telemetry
+            ).tolist()
+        return self._segment_spectra(freqs, batch.columns, batch.offsets, tile_size, telemetry)
+
+    def source_contributions(
+        self,
+        frequencies_khz: Sequence[float],
+        sources: SourcePopulation | SourceColumns,
+        tile_size: int = 1024,
+    ) -> list[list[complex]]:
+        """Return each source's complex PCC contribution at every frequency.
+
+        Row ``i`` holds source ``i``; summing the rows matches :meth:`aggregate_spectrum`
+        to rounding. Contributions are linear in source current, which
+        lets callers apply switching or operating-point changes as row deltas.
+        """
+        from .marks import SourceColumns
+
+        freqs = list(frequencies_khz)
+        if isinstance(sources, SourceColumns):
+            columns = sources
+        else:
+            converted = SourceColumns.from_population(sources)
+            if converted is None:
+                return [
+                    [self._aggregate_objects(frequency, [source]) for frequency in freqs]
+                    for source in sources
+                ]
+            columns = converted
+        return self._segment_spectra(freqs, columns, list(range(len(columns) + 1)), tile_size)
+
+    @staticmethod
+    def _segment_tiles(
+        offsets: Sequence[int], tile_size: int
+    ) -> list[tuple[int, int, list[tuple[int, int, int]]]]:
+        """Group CSR segments into tiles of at most ``tile_size`` sources.
+
+        Segments longer than a tile are split into chunks aligned to their own start, so
+        the chunking (and rounding) of a segment never depends on its neighbours.
+        Returns ``(start, stop, [(segment, lo, hi), ...])`` with tile-relative bounds.
+        """
+        tile = max(int(tile_size), 1)
+        tiles: list[tuple[int, int, list[tuple[int, int, int]]]] = []
+        start = offsets[0]
+        pieces: list[tuple[int, int, int]] = []
+        for segment, (seg_start, seg_stop) in enumerate(zip(offsets, offsets[1:])):
+            if seg_stop == seg_start:
+                continue
+            if seg_stop - seg_start > tile:
+                if pieces:
+                    tiles.append((start, seg_start, pieces))
+                    pieces = []
+                for chunk in range(seg_start, seg_stop, tile):
+                    chunk_stop = min(chunk + tile, seg_stop)
+                    tiles.append((chunk, chunk_stop, [(segment, 0, chunk_stop - chunk)]))
+                start = seg_stop
+                continue
+            if pieces and seg_stop - start > tile:
+                tiles.append((start, seg_start, pieces))
+                pieces = []
+            if not pieces:
+                start = seg_start
+            pieces.append((segment, seg_start - start, seg_stop - start))
+        if pieces:
+            tiles.append((start, offsets[-1], pieces))
+        return tiles
+
+    def _phasor_steps(self, freqs: list[float]) -> list[float | None]:
+        """Return, per frequency, the uniform step to advance by, or None to re-anchor.
+
+        Each run of equal spacing adopts its own step: the first frequency after a
+        spacing change is re-anchored and the following ones advance by the new step.
+        """
+        steps: list[float | None] = [None] * len(freqs)
+        if len(freqs) < 3:
+            return steps
+        step = freqs[1] - freqs[0]
+        since_anchor = 0
+        for idx in range(1, len(freqs)):
+            since_anchor += 1
+            delta = freqs[idx] - freqs[idx - 1]
+            uniform = abs(delta - step) <= 1e-12 * abs(step)
+            if since_anchor < self.phasor_anchor_interval and uniform:
+                steps[idx] = step
+            else:
+                since_anchor = 0
+                step = delta
+        return steps
+
+    def _segment_spectra(
+        self,
+        freqs: list[float],
+        columns: SourceColumns,
+        offsets: Sequence[int],
+        tile_size: int,
+        telemetry: SafeguardTelemetry | None = None,
+        limits: Sequence[int] | None = None,
+    ) -> list[list[complex]]:
+        # ``limits[f]`` (optional) excludes sources at flat index >= limits[f] at frequency f.
+        log_freqs = [math.log(max(frequency, 1e-9)) for frequency in freqs]
+        floor = self.min_denominator_magnitude
+        regularize = self._regularize_denominator
+        exp = math.exp
+        rect = cmath.exp
+        totals = [[0j] * len(freqs) for _ in range(len(offsets) - 1)]
+        gate = floor
+        first = 0
+        if telemetry is not None:
+            gate = telemetry.gate
+            first = telemetry.begin_realizations(
+                [stop - start for start, stop in zip(offsets, offsets[1:])]
+            )
+        flagged: list[tuple[int, complex, complex]] = []
+        steps = self._phasor_steps(freqs)
+        for start, stop, pieces in self._segment_tiles(offsets, tile_size):
+            distances = columns.distance_m[start:stop]
+            if limits is None:
+                kernel_rows = self._kernel_rows(freqs, distances)
+            else:
+                if start >= max(limits, default=0):
+                    break
+                needed = [idx for idx, limit in enumerate(limits) if limit > start]
+                kernel_rows = [[] for _ in freqs]
+                for idx, row in zip(
+                    needed, self._kernel_rows([freqs[idx] for idx in needed], distances)
+                ):
+                    kernel_rows[idx] = row[: limits[idx] - start]
+            refs = columns.reference_frequency_khz[start:stop]
+            tilts = columns.spectral_tilt_per_decade[start:stop]
+            slopes = columns.phase_slope_rad_per_khz[start:stop]
+            rolloffs = columns.admittance_rolloff_per_khz[start:stop]
+            admittances = columns.admittance_s[start:stop]
+            log_amps = [
+                (math.log(amplitude) if amplitude > 0 else -math.inf)
+                - tilt * math.log(max(f_ref, 1e-9))
+                for amplitude, tilt, f_ref in zip(columns.amplitude_a[start:stop], tilts, refs)
+            ]
+            phase_intercepts = [
+                phase - slope * f_ref
+                for phase, slope, f_ref in zip(columns.phase_rad[start:stop], slopes, refs)
+            ]
+            rotors_by_step: dict[float, list[complex]] = {}
+            phasors: list[complex] = []
+            for freq_idx, frequency in enumerate(freqs):
+                step = steps[freq_idx]
+                if step is None:
+                    phasors = [
+                        rect(1j * (intercept + slope * frequency))
+                        for intercept, slope in zip(phase_intercepts, slopes)
+                    ]
+                else:
+                    rotors = rotors_by_step.get(step)
+                    if rotors is None:
+                        rotors = [rect(1j * (slope * step)) for slope in slopes]
+                        rotors_by_step[step] = rotors
+                    phasors = [phasor * rotor for phasor, rotor in zip(phasors, rotors)]
+                log_freq = log_freqs[freq_idx]
+                contributions: list[complex] = []
+                append = contributions.append
+                for z_tr, log_amp, tilt, phasor, admittance, rolloff, f_ref in zip(
+                    kernel_rows[freq_idx],
+                    log_amps,
+                    tilts,
+                    phasors,
+                    admittances,
+                    rolloffs,
+                    refs,
+                ):
+                    # Inline clamps: same results as max(), without the call overhead.
+                    amplitude = exp(log_amp + tilt * log_freq)
+                    if amplitude < 1e-9:
+                        amplitude = 1e-9
+                    delta = frequency - f_ref
+                    if delta < 0.0:
+                        delta = 0.0
+                    shunt = admittance / (1.0 + rolloff * delta)
+                    if shunt < 0.0:
+                        shunt = 0.0
+                    current = amplitude * phasor
+                    denominator = 1 + shunt * z_tr
+                    if abs(denominator) < gate:
+                        if telemetry is not None:
+                            flagged.append((len(contributions), z_tr * current, denominator))
+                        if abs(denominator) < floor:
+                            denominator = regularize(denominator)
+                    append((z_tr * current) / denominator)
+                # Segmented reduction: one running sum per realization slice of the tile.
+                for segment, lo, hi in pieces:
+                    total = 0j
+                    for value in contributions[lo:hi]:
+                        total += value
+                    totals[segment][freq_idx] += total
+                if flagged and telemetry is not None:
+                    self._report_flagged(telemetry, pieces, first, freq_idx, flagged)
+                    flagged = []
+        if telemetry is not None and telemetry.record_below is not None:
+            # Records are keyed in insertion order, so this batch's keys come last.
+            for realization, freq_idx in reversed(telemetry.records):
+                if realization < first:
+                    break
+                key = (realization, freq_idx)
+                telemetry.aggregates[key] = totals[realization - first][freq_idx]
+        return totals
+
+    @staticmethod
+    def _report_flagged(
+        telemetry: SafeguardTelemetry,
+        pieces: list[tuple[int, int, int]],
+        first: int,
+        freq_idx: int,
+        flagged: list[tuple[int, complex, complex]],
+    ) -> None:
+        highs = [hi for _, _, hi in pieces]
+        for local_idx, numerator, denominator in flagged:
+            segment = pieces[bisect.bisect_right(highs, local_idx)][0]
+            telemetry.observe(first + segment, freq_idx, numerator, denominator)
+
+    def _float32_spectra(  # type: ignore[no-untyped-def]
+        self, freqs, columns, offsets, tile_size, telemetry=None
+    ):
+        """Float32 counterpart of :meth:`_segment_spectra` returning a complex64 array.
+
+        The kernel is evaluated in double precision and rounded once; everything after
+        that is float32. A tile holding one (chunk of a) realization is reduced with
+        numpy's pairwise sum; tiles packing many small realizations advance a Kahan sum
+        for all of them one source position at a time.
+        """
+        f32 = _np.float32
+        freq_col = _np.asarray(freqs, dtype=f32)[:, None]
+        log_freq_col = _np.log(_np.maximum(freq_col, f32(1e-9)))
+        floor = f32(self.min_denominator_magnitude)
+        totals = _np.zeros((len(offsets) - 1, len(freqs)), dtype=_np.complex64)
+        first = 0
+        if telemetry is not None:
+            first = telemetry.begin_realizations(
+                [stop - start for start, stop in zip(offsets, offsets[1:])]
+            )
+        for start, stop, pieces in self._segment_tiles(offsets, tile_size):
+            z_tr = _np.asarray(
+                self._kernel_rows(freqs, columns.distance_m[start:stop]), dtype=_np.complex64
+            )
+            refs = _np.asarray(columns.reference_frequency_khz[start:stop], dtype=f32)
+            tilts = _np.asarray(columns.spectral_tilt_per_decade[start:stop], dtype=f32)
+            slopes = _np.asarray(columns.phase_slope_rad_per_khz[start:stop], dtype=f32)
+            rolloffs = _np.asarray(columns.admittance_rolloff_per_khz[start:stop], dtype=f32)
+            admittances = _np.asarray(columns.admittance_s[start:stop], dtype=f32)
+            amplitudes = _np.asarray(columns.amplitude_a[start:stop], dtype=f32)
+            with _np.errstate(divide="ignore"):
+                log_amps = _np.log(amplitudes) - tilts * _np.log(_np.maximum(refs, f32(1e-9)))
+            amplitude = _np.maximum(_np.exp(log_amps + tilts * log_freq_col), f32(1e-9))
+            phase = (_np.asarray(columns.phase_rad[start:stop], dtype=f32) - slopes * refs) + (
+                slopes * freq_col
+            )
+            current = _np.empty(phase.shape, dtype=_np.complex64)
+            current.real = amplitude * _np.cos(phase)
+            current.imag = amplitude * _np.sin(phase)
+            shunt = _np.maximum(
+                admittances / (1.0 + rolloffs * _np.maximum(freq_col - refs, f32(0.0))),
+                f32(0.0),
+            )
+            denominator = 1 + shunt * z_tr
+            magnitude = _np.abs(denominator)
+            small = magnitude < floor
+            if small.any():
+                if telemetry is not None:
+                    for segment, lo, hi in pieces:
+                        counts = small[:, lo:hi].sum(axis=1)
+                        row = telemetry.activations[first + segment]
+                        for freq_idx, count in enumerate(counts.tolist()):
+                            row[freq_idx] += count
+                scaled = denominator * (floor / _np.where(magnitude > 0, magnitude, f32(1.0)))
+                denominator = _np.where(
+                    small, _np.where(magnitude <= 0, floor + 0j, scaled), denominator
+                ).astype(_np.complex64)
+            contributions = (z_tr * current) / denominator
+
+            if len(pieces) == 1:
+                segment, lo, hi = pieces[0]
+                totals[segment] += contributions[:, lo:hi].sum(axis=1)
+                continue
+            segments = _np.asarray([piece[0] for piece in pieces])
+            lows = _np.asarray([piece[1] for piece in pieces])
+            counts = _np.asarray([piece[2] - piece[1] for piece in pieces])
+            sums = _np.zeros((len(pieces), len(freqs)), dtype=_np.complex64)
+            compensation = _np.zeros_like(sums)
+            for position in range(int(counts.max())):
+                active = counts > position
+                value = contributions[:, lows[active] + position].T - compensation[active]
+                running = sums[active]
+                updated = running + value
+                compensation[active] = (updated - running) - value
+                sums[active] = updated
+            totals[segments] += sums
+        return totals
+
+    def aggregate_magnitude(
+        self, frequency_khz: float, sources: SourcePopulation | SourceColumns
+    ) -> float:
         """Return absolute aggregate voltage magnitude."""
         return abs(self.aggregate_complex_voltage(frequency_khz, sources))
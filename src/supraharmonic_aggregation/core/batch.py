@@ -0,0 +1,92 @@
+"""Ragged batches of source populations packed into flat columns."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+from .aggregator import Source
+from .marks import SourceColumns, SourceMark
+
+
+@dataclass(slots=True)
+class PopulationBatch:
+    """Many realizations stored as one set of flat source columns.
+
+    Realization ``k`` owns sources ``offsets[k]:offsets[k + 1]`` (CSR layout), so
+    realizations with different Poisson counts, including empty ones, share one array
+    per mark field.
+    """
+
+    columns: SourceColumns
+    offsets: list[int]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def counts(self) -> list[int]:
+        """Return the number of sources in each realization."""
+        return [stop - start for start, stop in zip(self.offsets, self.offsets[1:])]
+
+    def realization(self, index: int) -> SourceColumns:
+        """Return the columns of one realization as an independent copy."""
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        columns = self.columns
+        return SourceColumns(
+            distance_m=columns.distance_m[start:stop],
+            amplitude_a=columns.amplitude_a[start:stop],
+            phase_rad=columns.phase_rad[start:stop],
+            admittance_s=columns.admittance_s[start:stop],
+            spectral_tilt_per_decade=columns.spectral_tilt_per_decade[start:stop],
+            phase_slope_rad_per_khz=columns.phase_slope_rad_per_khz[start:stop],
+            admittance_rolloff_per_khz=columns.admittance_rolloff_per_khz[start:stop],
+            reference_frequency_khz=columns.reference_frequency_khz[start:stop],
+        )
+
+    @classmethod
+    def from_populations(cls, populations: Sequence[Sequence[Source]]) -> "PopulationBatch | None":
+        """Pack populations in order, or return None if any mark is not a plain SourceMark."""
+        offsets = [0]
+        sources: list[Source] = []
+        for population in populations:
+            for source in population:
+                if type(source.mark) is not SourceMark:
+                    return None
+            sources.extend(population)
+            offsets.append(len(sources))
+        columns = SourceColumns.from_population(sources)
+        if columns is None:  # pragma: no cover - marks were checked above
+            return None
+        return cls(columns=columns, offsets=offsets)
+
+    @classmethod
+    def from_columns(cls, realizations: Sequence[SourceColumns]) -> "PopulationBatch":
+        """Concatenate per-realization columns in order."""
+        fields: list[list[float]] = [[] for _ in range(8)]
+        offsets = [0]
+        for columns in realizations:
+            for target, column in zip(
+                fields,
+                (
+                    columns.distance_m,
+                    columns.amplitude_a,
+                    columns.phase_rad,
+                    columns.admittance_s,
+                    columns.spectral_tilt_per_decade,
+                    columns.phase_slope_rad_per_khz,
+                    columns.admittance_rolloff_per_khz,
+                    columns.reference_frequency_khz,
+                ),
+            ):
+                target.extend(column)
+            offsets.append(offsets[-1] + len(columns))
+        return cls(columns=SourceColumns(*fields), offsets=offsets)
+
+
+def batch_ranges(n_samples: int, batch_size: int) -> list[tuple[int, int]]:
+    """Split ``range(n_samples)`` into consecutive ``[start, stop)`` batches."""
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive.")
+    return [
+        (start, min(start + batch_size, n_samples)) for start in range(0, n_samples, batch_size)
+    ]
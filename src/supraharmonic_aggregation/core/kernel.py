@@ -5,15 +5,150 @@ from __future__ import annotations
 import cmath
 import math
 from dataclasses import dataclass
-from typing import Protocol
-from typing import Literal
+from typing import Literal, Protocol, Sequence
+
+from .._optional import optional_numpy
+
+_np = optional_numpy()  # Optional array backend; the scalar cmath path remains the reference.
+
+KernelBackend = Literal["auto", "numpy", "python"]
 
 
 class PropagationKernel(Protocol):
     """Kernel protocol for transfer impedance models."""
 
     def impedance(self, frequency_khz: float, distance_m: float) -> complex:
-        """Return complex transfer impedance at frequency and distance."""
+        """Return complex transfer impedance at frequency and distance.
+
+        Kernels may additionally provide ``plan(frequency_khz)`` returning an object with
+        ``impedance(distance_m)``; the aggregator uses it to hoist per-frequency work.
+        """
+
+
+def line_constants(
+    frequency_hz: float,
+    r_ohm_per_km: float,
+    l_h_per_km: float,
+    c_f_per_km: float,
+    g_s_per_km: float,
+    skin_effect_coeff: float,
+    skin_effect_ref_hz: float,
+    dielectric_tan_delta: float,
+    alpha: float,
+) -> tuple[complex, complex]:
+    """Return (propagation per km, characteristic impedance) of an RLGC line."""
+    omega = 2.0 * math.pi * frequency_hz
+
+    skin_ref_hz = max(skin_effect_ref_hz, 1.0)
+    skin_mult = 1.0 + skin_effect_coeff * math.sqrt(frequency_hz / skin_ref_hz)
+    r_ac = max(r_ohm_per_km, 1e-12) * skin_mult
+    g_dielectric = omega * max(c_f_per_km, 0.0) * max(dielectric_tan_delta, 0.0)
+
+    series_impedance_per_km = complex(r_ac, omega * l_h_per_km)
+    shunt_admittance_per_km = complex(g_s_per_km + g_dielectric, omega * c_f_per_km)
+    propagation = cmath.sqrt(series_impedance_per_km * shunt_admittance_per_km) + complex(
+        alpha, 0.0
+    )
+    characteristic = cmath.sqrt(series_impedance_per_km / shunt_admittance_per_km)
+    return propagation, characteristic
+
+
+def resonance_gain(
+    frequency_hz: float,
+    resonance_scale: float,
+    resonance_center_hz: float | None,
+    resonance_width_hz: float | None,
+    l_h_per_km: float,
+    c_f_per_km: float,
+) -> float:
+    """Return the bounded Lorentzian resonance emphasis factor at one frequency.
+
+    The center defaults to the nominal LC resonance of the line and the width to 20% of
+    the center. Array-valued ``frequency_hz`` is supported for the numpy backend.
+    """
+    if resonance_scale <= 0:
+        return 1.0
+    lc = max(l_h_per_km * c_f_per_km, 1e-18)
+    nominal_f0_hz = 1.0 / (2.0 * math.pi * math.sqrt(lc))
+    f0_hz = nominal_f0_hz if resonance_center_hz is None else max(float(resonance_center_hz), 1.0)
+    width_hz = (
+        max(0.2 * f0_hz, 1.0) if resonance_width_hz is None else max(float(resonance_width_hz), 1.0)
+    )
+    detuning = (frequency_hz - f0_hz) / width_hz
+    return 1.0 + resonance_scale / (1.0 + detuning * detuning)
+
+
+def bound_impedance(value: complex) -> complex:
+    """Clamp a transfer impedance to a minimum magnitude of 1e-9 ohm."""
+    magnitude = max(abs(value), 1e-9)
+    if abs(value) <= 1e-12:
+        return complex(magnitude, 0.0)
+    return value * (magnitude / abs(value))
+
+
+def _line_input_impedance(
+    gamma: complex, zc: complex, length_km: float, z_term: complex
+) -> complex:
+    if length_km <= 1e-12:
+        return z_term
+    t = cmath.tanh(gamma * length_km)
+    denom = zc + z_term * t
+    if abs(denom) <= 1e-18:
+        return zc
+    return zc * (z_term + zc * t) / denom
+
+
+@dataclass(slots=True)
+class KernelPlan:
+    """Frequency-only terms of an ExponentialKernel, evaluated for many distances."""
+
+    frequency_khz: float
+    propagation: complex
+    characteristic: complex
+    z_source: complex
+    z_right_term: complex
+    feeder_length_km: float
+    gain: float
+
+    def base_impedance(self, distance_m: float) -> complex:
+        """Return the transfer impedance before resonance gain and magnitude bounding."""
+        distance_km = max(distance_m, 0.0) / 1000.0
+        propagation = self.propagation
+        characteristic = self.characteristic
+        z_source = self.z_source
+
+        total_len_km = max(self.feeder_length_km, distance_km)
+        left_len_km = min(distance_km, total_len_km)
+        right_len_km = max(total_len_km - left_len_km, 0.0)
+
+        zin_left = _line_input_impedance(propagation, characteristic, left_len_km, z_source)
+        zin_right = _line_input_impedance(
+            propagation, characteristic, right_len_km, self.z_right_term
+        )
+        zin_sum = zin_left + zin_right
+        if abs(zin_sum) <= 1e-18:
+            z_parallel = zin_left
+        else:
+            z_parallel = (zin_left * zin_right) / zin_sum
+
+        # ABCD relation for the left segment from source node to PCC:
+        # Vs = (A + B/Zs) * Vpcc  ->  Vpcc = Vs / (A + B/Zs)
+        a = cmath.cosh(propagation * left_len_km)
+        b = characteristic * cmath.sinh(propagation * left_len_km)
+        transfer_den = a + (b / z_source)
+        if abs(transfer_den) <= 1e-18:
+            transfer_den = complex(1e-18, 0.0)
+
+        return z_parallel / transfer_den
+
+    def impedance(self, distance_m: float) -> complex:
+        """Compute bounded complex transfer impedance for a source at distance d from PCC."""
+        return bound_impedance(self.base_impedance(distance_m) * self.gain)
+
+    def impedances(self, distances_m: Sequence[float]) -> list[complex]:
+        """Evaluate transfer impedance for each distance at this plan's frequency."""
+        impedance = self.impedance
+        return [impedance(distance) for distance in distances_m]
 
 
 @dataclass(slots=True)
@@ -36,85 +171,126 @@ class ExponentialKernel:
     dielectric_tan_delta: float = 0.015
     termination_mode: Literal["matched", "resistive"] = "matched"
 
-    @staticmethod
-    def _line_input_impedance(
-        gamma: complex, zc: complex, length_km: float, z_term: complex
-    ) -> complex:
-        if length_km <= 1e-12:
-            return z_term
-        t = cmath.tanh(gamma * length_km)
-        denom = zc + z_term * t
-        if abs(denom) <= 1e-18:
-            return zc
-        return zc * (z_term + zc * t) / denom
-
-    def _resonance_gain(self, frequency_hz: float) -> float:
-        if self.resonance_scale <= 0:
-            return 1.0
-        lc = max(self.l_h_per_km * self.c_f_per_km, 1e-18)
-        nominal_f0_hz = 1.0 / (2.0 * math.pi * math.sqrt(lc))
-        f0_hz = (
-            nominal_f0_hz
-            if self.resonance_center_hz is None
-            else max(float(self.resonance_center_hz), 1.0)
+    def _resonance_gain(self, frequency_hz):  # type: ignore[no-untyped-def]
+        return resonance_gain(
+            frequency_hz,
+            resonance_scale=self.resonance_scale,
+            resonance_center_hz=self.resonance_center_hz,
+            resonance_width_hz=self.resonance_width_hz,
+            l_h_per_km=self.l_h_per_km,
+            c_f_per_km=self.c_f_per_km,
+        )
+
+    def plan(self, frequency_khz: float) -> KernelPlan:
+        """Precompute the distance-independent terms of this kernel at one frequency."""
+        frequency_hz = max(frequency_khz, 1e-9) * 1000.0
+        propagation, characteristic = line_constants(
+            frequency_hz,
+            r_ohm_per_km=self.r_ohm_per_km,
+            l_h_per_km=self.l_h_per_km,
+            c_f_per_km=self.c_f_per_km,
+            g_s_per_km=self.g_s_per_km,
+            skin_effect_coeff=self.skin_effect_coeff,
+            skin_effect_ref_hz=self.skin_effect_ref_hz,
+            dielectric_tan_delta=self.dielectric_tan_delta,
+            alpha=self.alpha,
         )
-        width_hz = (
-            max(0.2 * f0_hz, 1.0)
-            if self.resonance_width_hz is None
-            else max(float(self.resonance_width_hz), 1.0)
+
+        if self.termination_mode == "matched":
+            # Matched termination suppresses standing-wave artifacts in benchmark views.
+            z_right_term = characteristic
+        else:
+            z_right_term = complex(max(self.load_impedance_ohm, 1e-9), 0.0)
+
+        return KernelPlan(
+            frequency_khz=frequency_khz,
+            propagation=propagation,
+            characteristic=characteristic,
+            z_source=complex(max(self.source_impedance_ohm, 1e-9), 0.0),
+            z_right_term=z_right_term,
+            feeder_length_km=self.feeder_length_km,
+            gain=self._resonance_gain(frequency_hz),
         )
-        detuning = (frequency_hz - f0_hz) / width_hz
-        return 1.0 + self.resonance_scale / (1.0 + detuning * detuning)
 
     def impedance(self, frequency_khz: float, distance_m: float) -> complex:
         """Compute bounded complex transfer impedance for a source at distance d from PCC."""
-        distance_km = max(distance_m, 0.0) / 1000.0
-        frequency_hz = max(frequency_khz, 1e-9) * 1000.0
+        return self.plan(frequency_khz).impedance(distance_m)
+
+    def impedance_grid(
+        self,
+        frequencies_khz: Sequence[float],
+        distances_m: Sequence[float],
+        backend: KernelBackend = "auto",
+    ) -> list[list[complex]]:
+        """Evaluate transfer impedance over a frequency x distance grid.
+
+        Returns one row per frequency with one value per distance. The ``numpy`` backend
+        evaluates the whole grid as array operations; ``python`` evaluates the scalar
+        reference through one plan per frequency. ``auto`` selects numpy when it is installed.
+        """
+        if backend == "numpy" and _np is None:
+            raise ImportError("numpy is required for backend='numpy'.")
+        if backend == "python" or (backend == "auto" and _np is None):
+            return [self.plan(frequency).impedances(distances_m) for frequency in frequencies_khz]
+        return self._impedance_grid_numpy(frequencies_khz, distances_m).tolist()
+
+    @staticmethod
+    def _line_input_impedance_array(gamma, zc, length_km, z_term):  # type: ignore[no-untyped-def]
+        t = _np.tanh(gamma * length_km)
+        denom = zc + z_term * t
+        safe_denom = _np.where(_np.abs(denom) <= 1e-18, 1.0, denom)
+        zin = _np.where(_np.abs(denom) <= 1e-18, zc, zc * (z_term + zc * t) / safe_denom)
+        return _np.where(length_km <= 1e-12, z_term, zin)
+
+    def _impedance_grid_numpy(self, frequencies_khz, distances_m):  # type: ignore[no-untyped-def]
+        # Frequency terms are column vectors and distance terms row vectors so that every
+        # expression below broadcasts to the (n_frequencies, n_distances) grid.
+        frequency_hz = (
+            _np.maximum(_np.asarray(frequencies_khz, dtype=float), 1e-9)[:, None] * 1000.0
+        )
+        distance_km = (_np.maximum(_np.asarray(distances_m, dtype=float), 0.0) / 1000.0)[None, :]
         omega = 2.0 * math.pi * frequency_hz
 
         skin_ref_hz = max(self.skin_effect_ref_hz, 1.0)
-        skin_mult = 1.0 + self.skin_effect_coeff * math.sqrt(frequency_hz / skin_ref_hz)
+        skin_mult = 1.0 + self.skin_effect_coeff * _np.sqrt(frequency_hz / skin_ref_hz)
         r_ac = max(self.r_ohm_per_km, 1e-12) * skin_mult
         g_dielectric = omega * max(self.c_f_per_km, 0.0) * max(self.dielectric_tan_delta, 0.0)
 
-        series_impedance_per_km = complex(r_ac, omega * self.l_h_per_km)
-        shunt_admittance_per_km = complex(self.g_s_per_km + g_dielectric, omega * self.c_f_per_km)
-        propagation = cmath.sqrt(series_impedance_per_km * shunt_admittance_per_km) + complex(
-            self.alpha, 0.0
-        )
-        characteristic = cmath.sqrt(series_impedance_per_km / shunt_admittance_per_km)
+        series_impedance_per_km = r_ac + 1j * (omega * self.l_h_per_km)
+        shunt_admittance_per_km = (self.g_s_per_km + g_dielectric) + 1j * (omega * self.c_f_per_km)
+        propagation = _np.sqrt(series_impedance_per_km * shunt_admittance_per_km) + self.alpha
+        characteristic = _np.sqrt(series_impedance_per_km / shunt_admittance_per_km)
 
-        total_len_km = max(self.feeder_length_km, distance_km)
-        left_len_km = min(distance_km, total_len_km)
-        right_len_km = max(total_len_km - left_len_km, 0.0)
+        total_len_km = _np.maximum(self.feeder_length_km, distance_km)
+        left_len_km = _np.minimum(distance_km, total_len_km)
+        right_len_km = _np.maximum(total_len_km - left_len_km, 0.0)
 
         z_source = complex(max(self.source_impedance_ohm, 1e-9), 0.0)
-        if self.termination_mode == "matched":
-            # Matched termination suppresses standing-wave artifacts in benchmark views.
-            z_right_term = characteristic
-        else:
-            z_right_term = complex(max(self.load_impedance_ohm, 1e-9), 0.0)
+        z_right_term = (
+            characteristic
+            if self.termination_mode == "matched"
+            else complex(max(self.load_impedance_ohm, 1e-9), 0.0)
+        )
 
-        zin_left = self._line_input_impedance(propagation, characteristic, left_len_km, z_source)
-        zin_right = self._line_input_impedance(
+        zin_left = self._line_input_impedance_array(
+            propagation, characteristic, left_len_km, z_source
+        )
+        zin_right = self._line_input_impedance_array(
             propagation, characteristic, right_len_km, z_right_term
         )
         zin_sum = zin_left + zin_right
-        if abs(zin_sum) <= 1e-18:
-            z_parallel = zin_left
-        else:
-            z_parallel = (zin_left * zin_right) / zin_sum
+        small_sum = _np.abs(zin_sum) <= 1e-18
+        z_parallel = _np.where(
+            small_sum, zin_left, (zin_left * zin_right) / _np.where(small_sum, 1.0, zin_sum)
+        )
 
-        # ABCD relation for the left segment from source node to PCC:
-        # Vs = (A + B/Zs) * Vpcc  ->  Vpcc = Vs / (A + B/Zs)
-        a = cmath.cosh(propagation * left_len_km)
-        b = characteristic * cmath.sinh(propagation * left_len_km)
+        a = _np.cosh(propagation * left_len_km)
+        b = characteristic * _np.sinh(propagation * left_len_km)
         transfer_den = a + (b / z_source)
-        if abs(transfer_den) <= 1e-18:
-            transfer_den = complex(1e-18, 0.0)
+        transfer_den = _np.where(_np.abs(transfer_den) <= 1e-18, 1e-18 + 0j, transfer_den)
 
         value = (z_parallel / transfer_den) * self._resonance_gain(frequency_hz)
-        magnitude = max(abs(value), 1e-9)
-        if abs(value) <= 1e-12:
-            return complex(magnitude, 0.0)
-        return value * (magnitude / abs(value))
+        abs_value = _np.abs(value)
+        magnitude = _np.maximum(abs_value, 1e-9)
+        scaled = value * (magnitude / _np.where(abs_value <= 1e-12, 1.0, abs_value))
+        return _np.where(abs_value <= 1e-12, magnitude + 0j, scaled)
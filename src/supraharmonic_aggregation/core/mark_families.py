@@ -0,0 +1,304 @@
+"""Registry of vectorized amplitude families driven by shared uniforms."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Protocol, Sequence
+
+from .._optional import optional_numpy
+from .marks import mark_parameters
+
+_np = optional_numpy()  # Optional array backend; sample_mark remains the scalar reference.
+
+
+class AmplitudeFamily(Protocol):
+    """Source amplitude distribution expressed as a map from uniforms to amperes.
+
+    ``u`` drives the body of the distribution and ``v`` any auxiliary choice (such as a
+    burst); families that need a single uniform ignore ``v``. Where the quantile
+    function is available the map is monotone in ``u``, so families fed the same
+    uniforms are comonotone and their differences have low variance.
+    """
+
+    def amplitudes(self, u, v):  # type: ignore[no-untyped-def]
+        """Return amplitudes for arrays of uniforms ``u`` and ``v`` in ``[0, 1)``."""
+
+
+# Wichura's AS241 rational approximations, as in ``statistics.NormalDist.inv_cdf``,
+# with coefficients from the highest power down.
+_AS241_CENTRAL = (
+    (
+        2.5090809287301226727e3,
+        3.3430575583588128105e4,
+        6.7265770927008700853e4,
+        4.5921953931549871457e4,
+        1.3731693765509461125e4,
+        1.9715909503065514427e3,
+        1.3314166789178437745e2,
+        3.3871328727963666080e0,
+    ),
+    (
+        5.2264952788528545610e3,
+        2.8729085735721942674e4,
+        3.9307895800092710610e4,
+        2.1213794301586595867e4,
+        5.3941960214247511077e3,
+        6.8718700749205790830e2,
+        4.2313330701600911252e1,
+        1.0,
+    ),
+)
+_AS241_INTERMEDIATE = (
+    (
+        7.7454501427834140764e-4,
+        2.2723844989269184583e-2,
+        2.4178072517745061177e-1,
+        1.2704582524523683826e0,
+        3.6478483247632046050e0,
+        5.7694972214606914055e0,
+        4.6303378461565452959e0,
+        1.4234371107496835773e0,
+    ),
+    (
+        1.0507500716444168432e-9,
+        5.4759380849953449460e-4,
+        1.5198666563616457197e-2,
+        1.4810397642748007459e-1,
+        6.8976733498510000455e-1,
+        1.6763848301838038494e0,
+        2.0531916266377588219e0,
+        1.0,
+    ),
+)
+_AS241_TAIL = (
+    (
+        2.0103343992922881327e-7,
+        2.7115555687434875782e-5,
+        1.2426609473880784386e-3,
+        2.6532189526576123093e-2,
+        2.9656057182850489123e-1,
+        1.7848265399172913358e0,
+        5.4637849111641143699e0,
+        6.6579046435011037772e0,
+    ),
+    (
+        2.0442631033899397856e-15,
+        1.4215117583164458887e-7,
+        1.8463183175100546818e-5,
+        7.8686913114561325910e-4,
+        1.4875361290850614853e-2,
+        1.3692988092273580531e-1,
+        5.9983220655588793769e-1,
+        1.0,
+    ),
+)
+
+
+def normal_ppf(u):  # type: ignore[no-untyped-def]
+    """Return standard normal quantiles of an array of probabilities (AS241)."""
+    if _np is None:
+        raise ImportError("numpy is required for vectorized mark families.")
+    p = _np.clip(_np.asarray(u, dtype=float), 1e-300, 1.0 - 2.0**-53)
+    q = p - 0.5
+    central = _np.abs(q) <= 0.425
+    r = 0.180625 - q * q
+    x = q * _np.polyval(_AS241_CENTRAL[0], r) / _np.polyval(_AS241_CENTRAL[1], r)
+    s = _np.sqrt(-_np.log(_np.where(q < 0.0, p, 1.0 - p)))
+    intermediate = s - 1.6
+    tail = s - 5.0
+    outer = _np.where(
+        s <= 5.0,
+        _np.polyval(_AS241_INTERMEDIATE[0], intermediate)
+        / _np.polyval(_AS241_INTERMEDIATE[1], intermediate),
+        _np.polyval(_AS241_TAIL[0], tail) / _np.polyval(_AS241_TAIL[1], tail),
+    )
+    return _np.where(central, x, _np.where(q < 0.0, -outer, outer))
+
+
+def _gamma_p(a: float, x: float) -> float:
+    """Regularized lower incomplete gamma function P(a, x)."""
+    if x <= 0.0:
+        return 0.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1.0:
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-16:
+            n += 1.0
+            term *= x / n
+            total += term
+        return min(total * math.exp(log_prefix), 1.0)
+    # Lentz's continued fraction for the upper function Q(a, x).
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, 10_000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-16:
+            break
+    return max(1.0 - math.exp(log_prefix) * h, 0.0)
+
+
+@lru_cache(maxsize=64)
+def _gamma_table(shape: float, points: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Return (CDF, log x) nodes of a unit-scale gamma distribution."""
+    lower = 1e-6
+    upper = shape + 40.0 * math.sqrt(shape) + 40.0
+    step = math.log(upper / lower) / (points - 1)
+    logs = [math.log(lower) + idx * step for idx in range(points)]
+    cdf = [_gamma_p(shape, math.exp(value)) for value in logs]
+    return tuple(cdf), tuple(logs)
+
+
+@dataclass(frozen=True, slots=True)
+class LognormalBurstFamily:
+    """The default mark amplitudes: a lognormal body times an occasional Pareto burst.
+
+    ``u`` is the lognormal quantile. ``v < burst_probability`` selects a burst and is
+    rescaled to the uniform of the Pareto factor, matching
+    :func:`~supraharmonic_aggregation.core.marks.sample_mark` in distribution.
+    """
+
+    mu_ln: float
+    sigma_ln: float
+    burst_probability: float = 0.06
+    burst_shape: float = 3.0
+
+    def amplitudes(self, u, v):  # type: ignore[no-untyped-def]
+        body = _np.exp(self.mu_ln + self.sigma_ln * normal_ppf(u))
+        v = _np.asarray(v, dtype=float)
+        burst = v < self.burst_probability
+        rescaled = _np.where(burst, v / self.burst_probability, 0.0)
+        factor = 1.0 + (1.0 - rescaled) ** (-1.0 / self.burst_shape)
+        return _np.where(burst, body * factor, body)
+
+
+@dataclass(frozen=True, slots=True)
+class LognormalFamily:
+    """Lognormal amplitudes without bursts."""
+
+    mu_ln: float
+    sigma_ln: float
+
+    def amplitudes(self, u, v):  # type: ignore[no-untyped-def]
+        return _np.exp(self.mu_ln + self.sigma_ln * normal_ppf(u))
+
+
+@dataclass(frozen=True, slots=True)
+class GammaFamily:
+    """Gamma amplitudes by a tabulated quantile function.
+
+    The unit-scale CDF is evaluated at ``table_points`` log-spaced abscissae and
+    inverted by linear interpolation in ``log x``; below the table the leading term
+    ``x^k / Gamma(k + 1)`` of the CDF is inverted in closed form.
+    """
+
+    shape: float
+    scale: float
+    table_points: int = 2049
+
+    def amplitudes(self, u, v):  # type: ignore[no-untyped-def]
+        if self.shape <= 0 or self.scale <= 0:
+            raise ValueError("shape and scale must be positive.")
+        cdf, logs = _gamma_table(float(self.shape), self.table_points)
+        u = _np.asarray(u, dtype=float)
+        tabulated = _np.exp(_np.interp(u, cdf, logs))
+        lower_tail = (_np.maximum(u, 1e-300) * math.gamma(self.shape + 1.0)) ** (1.0 / self.shape)
+        return self.scale * _np.where(u < cdf[0], lower_tail, tabulated)
+
+
+@dataclass(frozen=True, slots=True)
+class WeibullFamily:
+    """Weibull amplitudes by their closed-form quantile function."""
+
+    shape: float
+    scale: float
+
+    def amplitudes(self, u, v):  # type: ignore[no-untyped-def]
+        if self.shape <= 0 or self.scale <= 0:
+            raise ValueError("shape and scale must be positive.")
+        return self.scale * (-_np.log1p(-_np.asarray(u, dtype=float))) ** (1.0 / self.shape)
+
+
+@dataclass(frozen=True, slots=True)
+class EmpiricalFamily:
+    """Amplitudes resampled from measured values by their interpolated quantiles."""
+
+    values: tuple[float, ...]
+
+    def amplitudes(self, u, v):  # type: ignore[no-untyped-def]
+        if not self.values:
+            raise ValueError("values must not be empty.")
+        ordered = _np.sort(_np.asarray(self.values, dtype=float))
+        grid = _np.linspace(0.0, 1.0, len(ordered))
+        return _np.interp(_np.asarray(u, dtype=float), grid, ordered)
+
+
+MarkFamilyFactory = Callable[..., AmplitudeFamily]
+
+
+def _lognormal_burst(coherence: float, base_current_a: float) -> AmplitudeFamily:
+    _, mu_ln, sigma_ln = mark_parameters(coherence, base_current_a)
+    return LognormalBurstFamily(mu_ln, sigma_ln)
+
+
+def _lognormal(coherence: float, base_current_a: float) -> AmplitudeFamily:
+    _, mu_ln, sigma_ln = mark_parameters(coherence, base_current_a)
+    return LognormalFamily(mu_ln, sigma_ln)
+
+
+def _gamma(coherence: float, base_current_a: float, shape: float = 2.0) -> AmplitudeFamily:
+    return GammaFamily(shape, max(base_current_a, 1e-9) / shape)
+
+
+def _weibull(coherence: float, base_current_a: float, shape: float = 1.5) -> AmplitudeFamily:
+    return WeibullFamily(shape, max(base_current_a, 1e-9) / math.gamma(1.0 + 1.0 / shape))
+
+
+def _empirical(
+    coherence: float, base_current_a: float, values: Sequence[float] = ()
+) -> AmplitudeFamily:
+    return EmpiricalFamily(tuple(float(value) for value in values))
+
+
+_REGISTRY: dict[str, MarkFamilyFactory] = {
+    "lognormal_burst": _lognormal_burst,
+    "lognormal": _lognormal,
+    "gamma": _gamma,
+    "weibull": _weibull,
+    "empirical": _empirical,
+}
+
+
+def register_mark_family(name: str, factory: MarkFamilyFactory, replace: bool = False) -> None:
+    """Register ``factory(coherence, base_current_a, **params)`` under ``name``."""
+    if name in _REGISTRY and not replace:
+        raise ValueError(f"Mark family already registered: {name}")
+    _REGISTRY[name] = factory
+
+
+def mark_family_names() -> list[str]:
+    """Return registered family names in registration order."""
+    return list(_REGISTRY)
+
+
+def mark_family(
+    name: str, coherence: float, base_current_a: float, **params: Any
+) -> AmplitudeFamily:
+    """Build a registered family; lognormal, gamma and Weibull have mean ``base_current_a``."""
+    factory = _REGISTRY.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown mark family: {name}")
+    return factory(coherence, base_current_a, **params)
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import cmath
 import math
 import random
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any, Iterable, Sequence
 
+from .._optional import optional_numpy
 from .aggregator import Source
+from .poisson import sample_poisson
+
+_np = optional_numpy()  # Optional array backend for the columnar mark shaping.
 
 
 @dataclass(slots=True)
@@ -42,29 +47,133 @@ class SourceMark:
         return max(self.admittance_s / scale, 0.0)
 
 
-def _sample_poisson(lam: float, rng: random.Random) -> int:
-    """Sample from Poisson distribution without hard clipping."""
-    if lam <= 0:
-        return 0
-    if lam <= 40.0:
-        limit = math.exp(-lam)
-        k = 0
-        p = 1.0
-        while p > limit:
-            k += 1
-            p *= rng.random()
-        return max(k - 1, 0)
-    if lam <= 5_000.0:
-        whole = int(lam // 40.0)
-        remainder = lam - (whole * 40.0)
-        total = 0
-        for _ in range(whole):
-            total += _sample_poisson(40.0, rng)
-        if remainder > 0:
-            total += _sample_poisson(remainder, rng)
-        return total
-    draw = int(round(rng.gauss(lam, math.sqrt(lam))))
-    return max(draw, 0)
+@dataclass(slots=True)
+class SourceColumns:
+    """Column-wise copy of a population whose marks are plain SourceMarks.
+
+    Column ``i`` of every field (a plain Python list) describes source ``i``; the
+    frequency shaping below mirrors :class:`SourceMark` source by source. Building the
+    columns walks the whole population, so callers evaluating several frequencies
+    convert once and pass the columns instead of the population.
+    """
+
+    distance_m: list[float]
+    amplitude_a: list[float]
+    phase_rad: list[float]
+    admittance_s: list[float]
+    spectral_tilt_per_decade: list[float]
+    phase_slope_rad_per_khz: list[float]
+    admittance_rolloff_per_khz: list[float]
+    reference_frequency_khz: list[float]
+
+    def __len__(self) -> int:
+        return len(self.distance_m)
+
+    @classmethod
+    def from_population(cls, sources: Sequence[Source]) -> "SourceColumns | None":
+        """Return columns for ``sources``, or None if any mark is not a plain SourceMark."""
+        marks: list[SourceMark] = []
+        for source in sources:
+            mark = source.mark
+            if type(mark) is not SourceMark:
+                return None
+            marks.append(mark)
+        return cls(
+            distance_m=[source.distance_m for source in sources],
+            amplitude_a=[mark.amplitude_a for mark in marks],
+            phase_rad=[mark.phase_rad for mark in marks],
+            admittance_s=[mark.admittance_s for mark in marks],
+            spectral_tilt_per_decade=[mark.spectral_tilt_per_decade for mark in marks],
+            phase_slope_rad_per_khz=[mark.phase_slope_rad_per_khz for mark in marks],
+            admittance_rolloff_per_khz=[mark.admittance_rolloff_per_khz for mark in marks],
+            reference_frequency_khz=[mark.reference_frequency_khz for mark in marks],
+        )
+
+    def take(self, indices: Sequence[int]) -> "SourceColumns":
+        """Return a copy holding the sources at ``indices``, in that order."""
+        return SourceColumns(
+            *(
+                [column[idx] for idx in indices]
+                for column in (
+                    self.distance_m,
+                    self.amplitude_a,
+                    self.phase_rad,
+                    self.admittance_s,
+                    self.spectral_tilt_per_decade,
+                    self.phase_slope_rad_per_khz,
+                    self.admittance_rolloff_per_khz,
+                    self.reference_frequency_khz,
+                )
+            )
+        )
+
+    def currents_at_frequency(self, frequency_khz: float) -> list[complex]:
+        """Return shaped complex source currents at one frequency."""
+        if _np is not None:
+            return self.shaped_arrays(frequency_khz)[0].tolist()
+        frequency = max(frequency_khz, 1e-9)
+        exp = cmath.exp
+        return [
+            max(amplitude * ((frequency / max(f_ref, 1e-9)) ** tilt), 1e-9)
+            * exp(1j * (phase + slope * (frequency_khz - f_ref)))
+            for amplitude, phase, tilt, slope, f_ref in zip(
+                self.amplitude_a,
+                self.phase_rad,
+                self.spectral_tilt_per_decade,
+                self.phase_slope_rad_per_khz,
+                self.reference_frequency_khz,
+            )
+        ]
+
+    def admittances_at_frequency(self, frequency_khz: float) -> list[float]:
+        """Return rolled-off shunt admittances at one frequency."""
+        if _np is not None:
+            return self.shaped_arrays(frequency_khz)[1].tolist()
+        return [
+            max(admittance / (1.0 + rolloff * max(frequency_khz - f_ref, 0.0)), 0.0)
+            for admittance, rolloff, f_ref in zip(
+                self.admittance_s, self.admittance_rolloff_per_khz, self.reference_frequency_khz
+            )
+        ]
+
+    def shaped_arrays(self, frequency_khz: float) -> tuple[Any, Any]:
+        """Return (complex currents, admittances) at one frequency as numpy arrays.
+
+        Same shaping as :meth:`currents_at_frequency` and
+        :meth:`admittances_at_frequency`, evaluated column-wise; requires numpy.
+        """
+        if _np is None:
+            raise RuntimeError("shaped_arrays requires numpy.")
+        f_ref = _np.asarray(self.reference_frequency_khz, dtype=float)
+        ratio = max(frequency_khz, 1e-9) / _np.maximum(f_ref, 1e-9)
+        amplitude = _np.maximum(
+            _np.asarray(self.amplitude_a, dtype=float)
+            * ratio ** _np.asarray(self.spectral_tilt_per_decade, dtype=float),
+            1e-9,
+        )
+        phase = _np.asarray(self.phase_rad, dtype=float) + _np.asarray(
+            self.phase_slope_rad_per_khz, dtype=float
+        ) * (frequency_khz - f_ref)
+        currents = amplitude * _np.exp(1j * phase)
+        admittances = _np.maximum(
+            _np.asarray(self.admittance_s, dtype=float)
+            / (
+                1.0
+                + _np.asarray(self.admittance_rolloff_per_khz, dtype=float)
+                * _np.maximum(frequency_khz - f_ref, 0.0)
+            ),
+            0.0,
+        )
+        return currents, admittances
+
+
+def mark_parameters(coherence: float, base_current_a: float) -> tuple[float, float, float]:
+    """Return (von Mises concentration, lognormal mu, lognormal sigma) of the mark model."""
+    coherence_clamped = min(max(coherence, 0.0), 1.0)
+    concentration = 0.2 + 26.0 * coherence_clamped
+    sigma_ln = 0.35 + 0.15 * (1.0 - coherence_clamped)
+    mu_ln = math.log(max(base_current_a, 1e-9)) - 0.5 * sigma_ln * sigma_ln
+    return concentration, mu_ln, sigma_ln
 
 
 def sample_mark(
@@ -75,12 +184,8 @@ def sample_mark(
     common_phase: float,
 ) -> SourceMark:
     """Sample one source mark with heavy-tailed amplitudes and spectral variability."""
-    coherence_clamped = min(max(coherence, 0.0), 1.0)
-    concentration = 0.2 + 26.0 * coherence_clamped
+    concentration, mu_ln, sigma_ln = mark_parameters(coherence, base_current_a)
     phase = rng.vonmisesvariate(common_phase, concentration)
-
-    sigma_ln = 0.35 + 0.15 * (1.0 - coherence_clamped)
-    mu_ln = math.log(max(base_current_a, 1e-9)) - 0.5 * sigma_ln * sigma_ln
     amplitude = rng.lognormvariate(mu_ln, sigma_ln)
     if rng.random() < 0.06:
         amplitude *= 1.0 + rng.paretovariate(3.0)
@@ -109,7 +214,7 @@ def generate_source_population(
 ) -> list[Source]:
     """Generate a PPP-like source set in a bounded circular region."""
     area_km2 = math.pi * (region_radius_m / 1000.0) ** 2
-    n_sources = _sample_poisson(density * area_km2, rng)
+    n_sources = sample_poisson(density * area_km2, rng)
     common_phase = rng.uniform(0.0, 2.0 * math.pi)
     population: list[Source] = []
     for _ in range(n_sources):
@@ -0,0 +1,290 @@
+"""Clustered and repulsive point processes for source placement in a disc."""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Protocol
+
+from .aggregator import Source
+from .marks import sample_mark
+from .poisson import sample_poisson
+
+Point = tuple[float, float]
+
+
+class PointProcess(Protocol):
+    """Sampler of source locations in a disc centred on the point of common coupling.
+
+    Stationary processes below also expose ``intensity``, their mean number of points
+    per km^2 ignoring edge effects.
+    """
+
+    def sample_points(self, region_radius_m: float, rng: random.Random) -> list[Point]:
+        """Return (x, y) locations in metres inside the disc of ``region_radius_m``."""
+
+
+def _uniform_disc(count: int, radius_m: float, rng: random.Random) -> list[Point]:
+    points: list[Point] = []
+    for _ in range(count):
+        radius = radius_m * math.sqrt(rng.random())
+        angle = 2.0 * math.pi * rng.random()
+        points.append((radius * math.cos(angle), radius * math.sin(angle)))
+    return points
+
+
+def _disc_count(density: float, radius_m: float, rng: random.Random) -> int:
+    return sample_poisson(density * math.pi * (radius_m / 1000.0) ** 2, rng)
+
+
+class _GridHash:
+    """Square-cell spatial hash for fixed-radius neighbour queries.
+
+    With cells as wide as the query radius, neighbours lie in the 3 x 3 block around a
+    point's cell, so each query touches O(1) points at bounded density.
+    """
+
+    def __init__(self, cell_m: float) -> None:
+        self.cell_m = cell_m
+        self.cells: dict[tuple[int, int], list[int]] = {}
+
+    def key(self, point: Point) -> tuple[int, int]:
+        return (math.floor(point[0] / self.cell_m), math.floor(point[1] / self.cell_m))
+
+    def add(self, index: int, point: Point) -> None:
+        self.cells.setdefault(self.key(point), []).append(index)
+
+    def remove(self, index: int, point: Point) -> None:
+        self.cells[self.key(point)].remove(index)
+
+    def near(self, point: Point) -> list[int]:
+        cx, cy = self.key(point)
+        found: list[int] = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                found.extend(self.cells.get((cx + dx, cy + dy), ()))
+        return found
+
+
+@dataclass(slots=True)
+class PoissonProcess:
+    """Homogeneous Poisson process with ``density`` points per km^2."""
+
+    density: float
+
+    @property
+    def intensity(self) -> float:
+        return self.density
+
+    def sample_points(self, region_radius_m: float, rng: random.Random) -> list[Point]:
+        return _uniform_disc(_disc_count(self.density, region_radius_m, rng), region_radius_m, rng)
+
+
+def _cluster_points(
+    parent_density: float,
+    mean_offspring: float,
+    reach_m: float,
+    region_radius_m: float,
+    rng: random.Random,
+    offset,  # type: ignore[no-untyped-def]
+) -> list[Point]:
+    # Parents are drawn in the disc dilated by the cluster reach so that clusters centred
+    # just outside the region still contribute; offspring outside the region are dropped.
+    outer = region_radius_m + reach_m
+    limit = region_radius_m * region_radius_m
+    points: list[Point] = []
+    for px, py in _uniform_disc(_disc_count(parent_density, outer, rng), outer, rng):
+        for _ in range(sample_poisson(mean_offspring, rng)):
+            dx, dy = offset(rng)
+            x, y = px + dx, py + dy
+            if x * x + y * y <= limit:
+                points.append((x, y))
+    return points
+
+
+@dataclass(slots=True)
+class ThomasProcess:
+    """Thomas cluster process: Gaussian offspring (``sigma_m`` per axis) around parents."""
+
+    parent_density: float
+    mean_offspring: float
+    sigma_m: float
+
+    @property
+    def intensity(self) -> float:
+        return self.parent_density * self.mean_offspring
+
+    def sample_points(self, region_radius_m: float, rng: random.Random) -> list[Point]:
+        sigma = self.sigma_m
+        return _cluster_points(
+            self.parent_density,
+            self.mean_offspring,
+            4.0 * sigma,
+            region_radius_m,
+            rng,
+            lambda r: (r.gauss(0.0, sigma), r.gauss(0.0, sigma)),
+        )
+
+
+@dataclass(slots=True)
+class MaternClusterProcess:
+    """Matérn cluster process: offspring uniform in a disc of ``cluster_radius_m``."""
+
+    parent_density: float
+    mean_offspring: float
+    cluster_radius_m: float
+
+    @property
+    def intensity(self) -> float:
+        return self.parent_density * self.mean_offspring
+
+    def sample_points(self, region_radius_m: float, rng: random.Random) -> list[Point]:
+        return _cluster_points(
+            self.parent_density,
+            self.mean_offspring,
+            self.cluster_radius_m,
+            region_radius_m,
+            rng,
+            lambda r: _uniform_disc(1, self.cluster_radius_m, r)[0],
+        )
+
+
+@dataclass(slots=True)
+class MaternHardCoreProcess:
+    """Matérn hard-core process of type II thinned from a Poisson ``density`` proposal.
+
+    Every proposal gets a uniform age and is deleted if an older proposal lies within
+    ``hard_core_m``. Proposals are drawn in the disc dilated by ``hard_core_m`` so that
+    thinning near the boundary sees its outside neighbours.
+    """
+
+    density: float
+    hard_core_m: float
+
+    @property
+    def intensity(self) -> float:
+        area = math.pi * (self.hard_core_m / 1000.0) ** 2
+        expected = self.density * area
+        if expected <= 0:
+            return self.density
+        return (1.0 - math.exp(-expected)) / area
+
+    def sample_points(self, region_radius_m: float, rng: random.Random) -> list[Point]:
+        outer = region_radius_m + self.hard_core_m
+        proposals = _uniform_disc(_disc_count(self.density, outer, rng), outer, rng)
+        if self.hard_core_m <= 0:
+            kept = proposals
+        else:
+            ages = [rng.random() for _ in proposals]
+            grid = _GridHash(self.hard_core_m)
+            for index, point in enumerate(proposals):
+                grid.add(index, point)
+            r2 = self.hard_core_m * self.hard_core_m
+            kept = []
+            for index, (x, y) in enumerate(proposals):
+                age = ages[index]
+                if not any(
+                    ages[other] < age
+                    and (proposals[other][0] - x) ** 2 + (proposals[other][1] - y) ** 2 < r2
+                    for other in grid.near((x, y))
+                ):
+                    kept.append((x, y))
+        limit = region_radius_m * region_radius_m
+        return [(x, y) for x, y in kept if x * x + y * y <= limit]
+
+
+@dataclass(slots=True)
+class StraussProcess:
+    """Strauss process sampled by Metropolis-Hastings birth-death moves.
+
+    The unnormalized density is ``beta^n * gamma^s`` with ``s`` the number of pairs
+    closer than ``interaction_radius_m``; ``gamma=0`` is a hard core and ``gamma=1`` a
+    Poisson process. The chain starts from a Poisson sample and runs ``sweeps`` times
+    the expected point count in moves; neighbour counts use a spatial hash, so each move
+    costs O(1) at bounded density. ``intensity`` reports ``beta``, an upper bound.
+    """
+
+    beta: float
+    interaction_radius_m: float
+    gamma: float
+    sweeps: int = 50
+
+    @property
+    def intensity(self) -> float:
+        return self.beta
+
+    def sample_points(self, region_radius_m: float, rng: random.Random) -> list[Point]:
+        if not 0.0 <= self.gamma <= 1.0:
+            raise ValueError("gamma must lie in [0, 1].")
+        radius = self.interaction_radius_m
+        r2 = radius * radius
+        area_term = self.beta * math.pi * (region_radius_m / 1000.0) ** 2
+        positions = dict(enumerate(PoissonProcess(self.beta).sample_points(region_radius_m, rng)))
+        if radius <= 0 or self.gamma == 1.0:
+            return list(positions.values())
+        grid = _GridHash(radius)
+        for index, point in positions.items():
+            grid.add(index, point)
+        order = list(positions)
+        slot = {index: pos for pos, index in enumerate(order)}
+        next_index = len(order)
+
+        def neighbours(point: Point, skip: int) -> int:
+            x, y = point
+            return sum(
+                1
+                for other in grid.near(point)
+                if other != skip
+                and (positions[other][0] - x) ** 2 + (positions[other][1] - y) ** 2 < r2
+            )
+
+        def weight(count: int) -> float:
+            if count == 0:
+                return 1.0
+            return 0.0 if self.gamma == 0.0 else self.gamma**count
+
+        for _ in range(max(self.sweeps, 1) * max(int(math.ceil(area_term)), 1)):
+            n = len(order)
+            if rng.random() < 0.5:
+                point = _uniform_disc(1, region_radius_m, rng)[0]
+                ratio = area_term * weight(neighbours(point, -1)) / (n + 1)
+                if rng.random() < ratio:
+                    positions[next_index] = point
+                    grid.add(next_index, point)
+                    slot[next_index] = n
+                    order.append(next_index)
+                    next_index += 1
+            elif n:
+                index = order[int(rng.random() * n)]
+                point = positions[index]
+                retained = area_term * weight(neighbours(point, index))
+                if retained == 0.0 or rng.random() * retained < n:
+                    grid.remove(index, point)
+                    del positions[index]
+                    last = order.pop()
+                    if last != index:
+                        order[slot[index]] = last
+                        slot[last] = slot[index]
+                    del slot[index]
+        return [positions[index] for index in order]
+
+
+def generate_process_population(
+    process: PointProcess,
+    region_radius_m: float,
+    coherence: float,
+    base_current_a: float,
+    admittance_s: float,
+    rng: random.Random,
+) -> list[Source]:
+    """Place sources with ``process`` and draw their marks as in the PPP generator."""
+    points = process.sample_points(region_radius_m, rng)
+    common_phase = rng.uniform(0.0, 2.0 * math.pi)
+    return [
+        Source(
+            distance_m=math.hypot(x, y),
+            mark=sample_mark(rng, coherence, base_current_a, admittance_s, common_phase),
+        )
+        for x, y in points
+    ]
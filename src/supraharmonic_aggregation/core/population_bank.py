@@ -0,0 +1,180 @@
+"""Memory-budgeted bank of sampled populations for replay across kernel sweeps."""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Any
+
+from ..cache import ArrayStore, cache_key
+from .marks import SourceColumns
+
+_COLUMNS = tuple(field.name for field in fields(SourceColumns))
+_NAMESPACE = "population"
+
+
+@dataclass(frozen=True, slots=True)
+class PopulationKey:
+    """Everything that determines the sampled populations of a run.
+
+    Kernel parameters and frequencies are deliberately absent: runs that only change
+    them draw identical populations. ``batch_size`` matters only for the sequential numpy
+    sampler, whose streams depend on how realizations are grouped.
+    """
+
+    seed: int
+    density: float
+    region_radius_m: float
+    coherence: float
+    base_current_a: float
+    admittance_s: float
+    sampler: str = "python"
+    streams: str = "sequential"
+    batch_size: int | None = None
+
+    def payload(self, index: int) -> dict[str, Any]:
+        """Return the content-hash payload of realization ``index``."""
+        return {
+            "seed": self.seed,
+            "density": float(self.density),
+            "region_radius_m": float(self.region_radius_m),
+            "coherence": float(self.coherence),
+            "base_current_a": float(self.base_current_a),
+            "admittance_s": float(self.admittance_s),
+            "sampler": self.sampler,
+            "streams": self.streams,
+            "batch_size": self.batch_size,
+            "index": index,
+        }
+
+
+@dataclass(slots=True)
+class PopulationBankStats:
+    """Occupancy and counters of a population bank."""
+
+    resident_entries: int
+    resident_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    loads: int
+    spills: int
+    evictions: int
+
+
+def _pack(columns: SourceColumns) -> array:
+    packed = array("d")
+    for name in _COLUMNS:
+        packed.extend(getattr(columns, name))
+    return packed
+
+
+def _unpack(packed: array) -> SourceColumns:
+    n = len(packed) // len(_COLUMNS)
+    return SourceColumns(
+        *(packed[idx * n : (idx + 1) * n].tolist() for idx in range(len(_COLUMNS)))
+    )
+
+
+class PopulationBank:
+    """LRU cache of per-realization source columns under a memory budget.
+
+    Entries are packed into one float64 array per realization (the eight
+    :class:`~supraharmonic_aggregation.core.marks.SourceColumns` fields back to back),
+    so ``max_bytes`` bounds the resident payload exactly. Entries evicted from memory
+    are spilled to ``store`` when one is given and loaded back on a later lookup; the
+    on-disk layout is that of :class:`~supraharmonic_aggregation.cache.ArrayStore`, so
+    spilled populations are shared by processes using the same directory.
+    :meth:`flush` spills resident entries without evicting them.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, store: ArrayStore | None = None):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+        self.max_bytes = int(max_bytes)
+        self.store = store
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.spills = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[PopulationKey, int], array] = OrderedDict()
+
+    def contains(self, key: PopulationKey, index: int) -> bool:
+        """Return whether realization ``index`` is resident or spilled, without counting."""
+        if (key, index) in self._entries:
+            return True
+        if self.store is None:
+            return False
+        return self.store.path_for(cache_key(_NAMESPACE, key.payload(index))).exists()
+
+    def get(self, key: PopulationKey, index: int) -> SourceColumns | None:
+        """Return a fresh copy of realization ``index``, or None on a miss."""
+        slot = (key, index)
+        packed = self._entries.get(slot)
+        if packed is not None:
+            self._entries.move_to_end(slot)
+            self.hits += 1
+            return _unpack(packed)
+        if self.store is not None:
+            view = self.store.get(cache_key(_NAMESPACE, key.payload(index)))
+            if view is not None:
+                packed = array("d")
+                packed.frombytes(view.cast("B"))
+                self.loads += 1
+                self.hits += 1
+                self._insert(slot, packed)
+                return _unpack(packed)
+        self.misses += 1
+        return None
+
+    def put(self, key: PopulationKey, index: int, columns: SourceColumns) -> None:
+        """Store realization ``index`` and evict least-recently-used entries over budget."""
+        self._insert((key, index), _pack(columns))
+
+    def _insert(self, slot: tuple[PopulationKey, int], packed: array) -> None:
+        previous = self._entries.pop(slot, None)
+        if previous is not None:
+            self.resident_bytes -= previous.itemsize * len(previous)
+        self._entries[slot] = packed
+        self.resident_bytes += packed.itemsize * len(packed)
+        spilled: list[tuple[str, array]] = []
+        while self.resident_bytes > self.max_bytes and self._entries:
+            (old_key, old_index), old = self._entries.popitem(last=False)
+            self.resident_bytes -= old.itemsize * len(old)
+            self.evictions += 1
+            if self.store is not None:
+                spilled.append((cache_key(_NAMESPACE, old_key.payload(old_index)), old))
+        if spilled and self.store is not None:
+            self.spills += self.store.put_many(spilled)
+
+    def flush(self) -> int:
+        """Spill every resident entry to the store and return how many were written."""
+        if self.store is None:
+            return 0
+        written = self.store.put_many(
+            (cache_key(_NAMESPACE, key.payload(index)), packed)
+            for (key, index), packed in self._entries.items()
+        )
+        self.spills += written
+        return written
+
+    def stats(self) -> PopulationBankStats:
+        """Return resident occupancy and this bank's counters."""
+        return PopulationBankStats(
+            resident_entries=len(self._entries),
+            resident_bytes=self.resident_bytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            loads=self.loads,
+            spills=self.spills,
+            evictions=self.evictions,
+        )
+
+    def clear(self) -> None:
+        """Drop resident entries; spilled entries stay in the store."""
+        self._entries.clear()
+        self.resident_bytes = 0
@@ -0,0 +1,270 @@
+"""Scrambled Sobol points and quasi-Monte Carlo source populations."""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Sequence
+
+from .._optional import optional_numpy
+from .batch import PopulationBatch
+from .mark_families import LognormalBurstFamily, normal_ppf
+from .marks import SourceColumns, mark_parameters
+from .vonmises import von_mises_table
+
+_np = optional_numpy()  # Optional array backend; the pseudo-random samplers remain the reference.
+
+SOBOL_BITS = 32
+# Realization dimensions: source count and common phase, then per source slot.
+LEADING_DIMENSIONS = 2
+SLOT_DIMENSIONS = 6
+
+
+def _prime_factors(value: int) -> list[int]:
+    factors: list[int] = []
+    candidate = 2
+    while candidate * candidate <= value:
+        if value % candidate == 0:
+            factors.append(candidate)
+            while value % candidate == 0:
+                value //= candidate
+        candidate += 1
+    if value > 1:
+        factors.append(value)
+    return factors
+
+
+def _power_of_x(exponent: int, modulus: int) -> int:
+    """Return ``x^exponent mod modulus`` over GF(2), polynomials as bit masks."""
+    degree = modulus.bit_length() - 1
+    result, base = 1, 2 ^ modulus if degree == 1 else 2
+    while exponent:
+        if exponent & 1:
+            result = _gf2_mulmod(result, base, modulus, degree)
+        base = _gf2_mulmod(base, base, modulus, degree)
+        exponent >>= 1
+    return result
+
+
+def _gf2_mulmod(left: int, right: int, modulus: int, degree: int) -> int:
+    product = 0
+    while right:
+        if right & 1:
+            product ^= left
+        right >>= 1
+        left <<= 1
+        if left >> degree & 1:
+            left ^= modulus
+    return product
+
+
+@lru_cache(maxsize=8)
+def primitive_polynomials(count: int) -> tuple[int, ...]:
+    """Return the first ``count`` primitive polynomials over GF(2) by degree, then value.
+
+    Polynomials are bit masks (``0b111`` is ``x^2 + x + 1``). ``p`` of degree ``d`` is
+    primitive when ``x`` has multiplicative order ``2^d - 1`` modulo ``p``.
+    """
+    found: list[int] = []
+    degree = 1
+    while len(found) < count:
+        order = (1 << degree) - 1
+        factors = _prime_factors(order)
+        for poly in range((1 << degree) | 1, 1 << (degree + 1), 2):
+            if _power_of_x(order, poly) == 1 and all(
+                _power_of_x(order // factor, poly) != 1 for factor in factors
+            ):
+                found.append(poly)
+                if len(found) == count:
+                    break
+        degree += 1
+    return tuple(found)
+
+
+@lru_cache(maxsize=8)
+def sobol_direction_numbers(dimensions: int) -> tuple[tuple[int, ...], ...]:
+    """Return ``SOBOL_BITS`` direction numbers per dimension, most significant first.
+
+    Dimension 0 is the van der Corput sequence. Dimension ``j > 0`` uses the ``j``-th
+    primitive polynomial with odd initial direction numbers drawn from a fixed seed, so
+    every one-dimensional projection is a (0, 1)-sequence. Scrambling randomizes the
+    remaining structure.
+    """
+    directions = [tuple(1 << (SOBOL_BITS - 1 - k) for k in range(SOBOL_BITS))]
+    for dim, poly in enumerate(primitive_polynomials(max(dimensions - 1, 0)), start=1):
+        degree = poly.bit_length() - 1
+        rng = random.Random(dim)
+        m = [1] + [2 * rng.randrange(1 << (k - 1)) + 1 for k in range(2, degree + 1)]
+        for k in range(degree, SOBOL_BITS):
+            value = m[k - degree] ^ (m[k - degree] << degree)
+            for bit in range(1, degree):
+                if poly >> (degree - bit) & 1:
+                    value ^= m[k - bit] << bit
+            m.append(value)
+        directions.append(tuple(m[k] << (SOBOL_BITS - 1 - k) for k in range(SOBOL_BITS)))
+    return tuple(directions[:dimensions])
+
+
+@dataclass(frozen=True, slots=True)
+class SobolEngine:
+    """Sobol points with Matoušek linear matrix scrambling and a digital shift.
+
+    ``seed=None`` gives the unscrambled sequence. Any seed gives a randomized QMC point
+    set whose points are each uniform on the unit cube, so independent seeds yield
+    independent unbiased replicates. Point ``i`` is computed directly from the bits of
+    ``i``, so any index range can be generated alone.
+    """
+
+    dimensions: int
+    directions: Any  # uint64 array, dimensions x SOBOL_BITS
+    shift: Any  # uint64 array, one digital shift per dimension
+
+    @classmethod
+    def create(cls, dimensions: int, seed: int | None = None) -> "SobolEngine":
+        if _np is None:
+            raise ImportError("numpy is required for Sobol points.")
+        if dimensions <= 0:
+            raise ValueError("dimensions must be positive.")
+        columns = _np.asarray(sobol_direction_numbers(dimensions), dtype=_np.uint64)
+        if seed is None:
+            return cls(dimensions, columns, _np.zeros(dimensions, dtype=_np.uint64))
+        generator = _np.random.default_rng(seed)
+        weights = _np.uint64(1) << _np.arange(SOBOL_BITS - 1, -1, -1, dtype=_np.uint64)
+        # bits[d, row, k] is bit ``row`` (most significant first) of direction number k.
+        bits = (
+            columns[:, None, :]
+            >> _np.arange(SOBOL_BITS - 1, -1, -1, dtype=_np.uint64)[None, :, None]
+        ) & _np.uint64(1)
+        # Lower-triangular binary matrices with unit diagonal, one per dimension; float
+        # products are exact at these sizes and use BLAS.
+        lower = _np.tril(generator.integers(0, 2, size=(dimensions, SOBOL_BITS, SOBOL_BITS)), -1)
+        lower = lower + _np.eye(SOBOL_BITS, dtype=lower.dtype)
+        scrambled_bits = (lower.astype(float) @ bits.astype(float)).astype(_np.uint64) & 1
+        scrambled = (scrambled_bits * weights[None, :, None]).sum(axis=1, dtype=_np.uint64)
+        shift = generator.integers(0, 1 << SOBOL_BITS, size=dimensions, dtype=_np.uint64)
+        return cls(dimensions, scrambled, shift)
+
+    def points(self, start: int, stop: int):  # type: ignore[no-untyped-def]
+        """Return points ``start..stop-1`` as a ``(stop - start, dimensions)`` array."""
+        if not 0 <= start <= stop <= 1 << SOBOL_BITS:
+            raise ValueError(f"Point range must lie in [0, 2^{SOBOL_BITS}].")
+        index = _np.arange(start, stop, dtype=_np.uint64)
+        digits = _np.tile(self.shift, (stop - start, 1))
+        for bit in range(max(stop - 1, 0).bit_length()):
+            selected = ((index >> _np.uint64(bit)) & _np.uint64(1)).astype(bool)
+            digits[selected] ^= self.directions[:, bit]
+        return (digits.astype(float) + 0.5) * 2.0**-SOBOL_BITS
+
+
+@lru_cache(maxsize=64)
+def _poisson_cdf(lam: float) -> tuple[float, ...]:
+    k_max = int(lam + 12.0 * math.sqrt(lam) + 30.0)
+    log_lam = math.log(lam)
+    cdf: list[float] = []
+    total = 0.0
+    for k in range(k_max + 1):
+        total += math.exp(k * log_lam - lam - math.lgamma(k + 1.0))
+        cdf.append(total)
+    return tuple(cdf)
+
+
+def poisson_ppf(lam: float, u):  # type: ignore[no-untyped-def]
+    """Return the smallest ``k`` with ``P(N <= k) >= u`` for ``N ~ Poisson(lam)``.
+
+    ``u`` may be an array; the CDF is tabulated up to ``lam + 12 sqrt(lam) + 30``.
+    """
+    u = _np.asarray(u, dtype=float)
+    if lam <= 0:
+        return _np.zeros(u.shape, dtype=_np.int64)
+    cdf = _np.asarray(_poisson_cdf(float(lam)))
+    return _np.minimum(_np.searchsorted(cdf, u, side="left"), len(cdf) - 1)
+
+
+def qmc_dimensions(sources: int) -> int:
+    """Return the Sobol dimension of a realization with ``sources`` QMC source slots."""
+    return LEADING_DIMENSIONS + SLOT_DIMENSIONS * sources
+
+
+def qmc_population_batch(
+    points,  # type: ignore[no-untyped-def]
+    density: float,
+    region_radius_m: float,
+    coherence: float,
+    base_current_a: float,
+    admittance_s: float,
+    paddings: Sequence,  # type: ignore[type-arg]
+) -> PopulationBatch:
+    """Map QMC points to populations distributed as the PPP generator's, one per row.
+
+    Dimension 0 sets the Poisson count by inverse CDF and dimension 1 the common phase.
+    Source slot ``j`` then takes ``SLOT_DIMENSIONS`` dimensions for the uniforms of its
+    distance, phase, lognormal amplitude, burst, spectral tilt and phase slope.
+    Distances are built as ascending order statistics, so slot 0 is the nearest source
+    and the lowest dimensions drive the largest contributions. Sources beyond the
+    available slots and the admittance rolloff draw from ``paddings[k]``, one numpy
+    ``Generator`` per row. Every row maps alone, so populations do not depend on how
+    rows are batched.
+    """
+    if _np is None:
+        raise ImportError("numpy is required for QMC populations.")
+    points = _np.atleast_2d(_np.asarray(points, dtype=float))
+    if len(paddings) != len(points):
+        raise ValueError("paddings must hold one generator per point.")
+    slots = (points.shape[1] - LEADING_DIMENSIONS) // SLOT_DIMENSIONS
+    area_km2 = math.pi * (region_radius_m / 1000.0) ** 2
+    counts = poisson_ppf(density * area_km2, points[:, 0]).tolist()
+    common_phases = 2.0 * math.pi * points[:, 1]
+
+    blocks = []
+    ordered = []
+    extras = []
+    for point, n_sources, padding in zip(points, counts, paddings):
+        quasi = min(n_sources, slots)
+        block = _np.concatenate(
+            [
+                point[LEADING_DIMENSIONS : LEADING_DIMENSIONS + SLOT_DIMENSIONS * quasi].reshape(
+                    quasi, SLOT_DIMENSIONS
+                ),
+                padding.random((n_sources - quasi, SLOT_DIMENSIONS)),
+            ]
+        )
+        blocks.append(block)
+        # Ascending uniform order statistics: log(1 - U_(k)) is a running sum of
+        # log(1 - V_k) / (n - k + 1), an exact transform of independent uniforms.
+        remaining = n_sources - _np.arange(n_sources)
+        ordered.append(-_np.expm1(_np.cumsum(_np.log1p(-block[:, 0]) / remaining)))
+        extras.append(padding.random(n_sources))
+    uniforms = _np.concatenate(blocks) if blocks else _np.zeros((0, SLOT_DIMENSIONS))
+    rolloff_uniforms = _np.concatenate(extras) if extras else _np.zeros(0)
+    distance = region_radius_m * _np.sqrt(_np.concatenate(ordered) if ordered else rolloff_uniforms)
+
+    concentration, mu_ln, sigma_ln = mark_parameters(coherence, base_current_a)
+    table = von_mises_table(concentration)
+    cdf = _np.asarray(table.cdf)
+    angles = _np.asarray(table.angles)
+    u_phase = uniforms[:, 1]
+    idx = _np.clip(_np.searchsorted(cdf, u_phase, side="right") - 1, 0, len(cdf) - 2)
+    lower = cdf[idx]
+    span = cdf[idx + 1] - lower
+    weight = _np.divide(u_phase - lower, span, out=_np.zeros_like(span), where=span > 0)
+    angle = angles[idx] + weight * (angles[idx + 1] - angles[idx])
+    phase = _np.mod(_np.repeat(common_phases, counts) + angle, 2.0 * math.pi)
+
+    amplitude = LognormalBurstFamily(mu_ln, sigma_ln).amplitudes(uniforms[:, 2], uniforms[:, 3])
+    amplitude = _np.clip(amplitude, 1e-6, max(base_current_a, 1e-6) * 40.0)
+    total = len(uniforms)
+    offsets = [0]
+    offsets.extend(_np.cumsum(counts, dtype=_np.int64).tolist())
+    columns = SourceColumns(
+        distance_m=distance.tolist(),
+        amplitude_a=amplitude.tolist(),
+        phase_rad=phase.tolist(),
+        admittance_s=[max(admittance_s, 0.0)] * total,
+        spectral_tilt_per_decade=(0.30 * normal_ppf(uniforms[:, 4])).tolist(),
+        phase_slope_rad_per_khz=(0.025 * normal_ppf(uniforms[:, 5])).tolist(),
+        admittance_rolloff_per_khz=(0.0005 + 0.0035 * rolloff_uniforms).tolist(),
+        reference_frequency_khz=[30.0] * total,
+    )
+    return PopulationBatch(columns=columns, offsets=offsets)
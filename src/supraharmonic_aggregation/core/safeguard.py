@@ -0,0 +1,95 @@
+"""Telemetry for the ``1 + Y*Z`` denominator safeguard."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .aggregator import regularize_denominator
+
+RecordKey = tuple[int, int]
+
+
+@dataclass(slots=True)
+class SafeguardTelemetry:
+    """Activation counters and optional raw records of the denominator safeguard.
+
+    ``activations[r][f]`` counts sources of realization ``r`` whose denominator was
+    rescaled at frequency index ``f``. With ``record_below`` set, the numerator
+    ``Z*I`` and raw denominator of every source with ``|1 + Y*Z| < record_below`` are
+    kept together with the aggregate of its realization, so voltages for any safeguard
+    threshold from ``min_denominator_magnitude`` up to ``record_below`` follow without
+    resampling populations.
+    """
+
+    frequencies_khz: list[float]
+    min_denominator_magnitude: float
+    record_below: float | None = None
+    source_counts: list[int] = field(default_factory=list)
+    activations: list[list[int]] = field(default_factory=list)
+    records: dict[RecordKey, list[tuple[complex, complex]]] = field(default_factory=dict)
+    aggregates: dict[RecordKey, complex] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.record_below is not None and self.record_below < self.min_denominator_magnitude:
+            raise ValueError("record_below must be at least min_denominator_magnitude.")
+
+    @property
+    def gate(self) -> float:
+        """Denominator magnitude below which a source must be reported."""
+        return max(self.min_denominator_magnitude, self.record_below or 0.0)
+
+    def begin_realizations(self, source_counts: list[int]) -> int:
+        """Register a batch of realizations and return the index of the first one."""
+        first = len(self.source_counts)
+        self.source_counts.extend(source_counts)
+        self.activations.extend([0] * len(self.frequencies_khz) for _ in source_counts)
+        return first
+
+    def observe(
+        self, realization: int, frequency_index: int, numerator: complex, denominator: complex
+    ) -> None:
+        """Count (and record) one source whose denominator fell below :attr:`gate`."""
+        if abs(denominator) < self.min_denominator_magnitude:
+            self.activations[realization][frequency_index] += 1
+        if self.record_below is not None and abs(denominator) < self.record_below:
+            self.records.setdefault((realization, frequency_index), []).append(
+                (numerator, denominator)
+            )
+
+    def activation_rate(self) -> list[float]:
+        """Return the fraction of all sources rescaled, per frequency."""
+        total = sum(self.source_counts)
+        return [
+            sum(row[idx] for row in self.activations) / total if total else 0.0
+            for idx in range(len(self.frequencies_khz))
+        ]
+
+    def realization_activation_fraction(self) -> list[float]:
+        """Return the fraction of realizations with at least one rescaling, per frequency."""
+        n_realizations = len(self.activations)
+        return [
+            sum(1 for row in self.activations if row[idx]) / n_realizations
+            if n_realizations
+            else 0.0
+            for idx in range(len(self.frequencies_khz))
+        ]
+
+    def check_threshold(self, threshold: float) -> None:
+        """Raise ValueError unless recorded denominators cover ``threshold``."""
+        if self.record_below is None:
+            raise ValueError("telemetry must record raw denominators (record_below).")
+        if not self.min_denominator_magnitude <= threshold <= self.record_below:
+            raise ValueError(
+                f"threshold must lie in [min_denominator_magnitude, record_below]: {threshold}"
+            )
+
+    def voltage_at(self, key: RecordKey, threshold: float) -> complex:
+        """Recompute a recorded aggregate as if the safeguard used ``threshold``."""
+        self.check_threshold(threshold)
+        floor = self.min_denominator_magnitude
+        total = self.aggregates[key]
+        for numerator, denominator in self.records[key]:
+            total += numerator / regularize_denominator(
+                denominator, threshold
+            ) - numerator / regularize_denominator(denominator, floor)
+        return total
@@ -0,0 +1,272 @@
+"""Tabulated transfer-impedance kernel with adaptive distance tables."""
+
+from __future__ import annotations
+
+import bisect
+import cmath
+import math
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, field
+from typing import Sequence
+
+from ..cache import ArrayStore
+from .kernel import ExponentialKernel
+
+TableKey = tuple[object, ...]
+
+
+@dataclass(slots=True)
+class TableCacheInfo:
+    """Hit/miss counters and occupancy of the distance-table cache."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+@dataclass(slots=True)
+class DistanceTable:
+    """Per-frequency transfer impedance sampled over [0, region radius].
+
+    Values are interpolated linearly in log-magnitude and unwrapped phase between
+    adaptively placed distance nodes.
+    """
+
+    frequency_khz: float
+    distances_m: list[float]
+    log_magnitudes: list[float]
+    phases_rad: list[float]
+    max_relative_error: float
+
+    def to_values(self) -> list[float]:
+        """Flatten this table into a float array for the on-disk store."""
+        return [
+            self.frequency_khz,
+            self.max_relative_error,
+            *self.distances_m,
+            *self.log_magnitudes,
+            *self.phases_rad,
+        ]
+
+    @classmethod
+    def from_values(cls, values: Sequence[float]) -> "DistanceTable":
+        """Rebuild a table flattened by :meth:`to_values`."""
+        n_nodes = (len(values) - 2) // 3
+        return cls(
+            frequency_khz=values[0],
+            distances_m=list(values[2 : 2 + n_nodes]),
+            log_magnitudes=list(values[2 + n_nodes : 2 + 2 * n_nodes]),
+            phases_rad=list(values[2 + 2 * n_nodes :]),
+            max_relative_error=values[1],
+        )
+
+    def impedance(self, distance_m: float) -> complex:
+        """Interpolate transfer impedance at a distance inside the table range."""
+        nodes = self.distances_m
+        idx = bisect.bisect_right(nodes, distance_m) - 1
+        if idx < 0:
+            idx = 0
+        elif idx >= len(nodes) - 1:
+            idx = len(nodes) - 2
+        left = nodes[idx]
+        width = nodes[idx + 1] - left
+        weight = (distance_m - left) / width if width > 0 else 0.0
+        log_mag = self.log_magnitudes[idx] + weight * (
+            self.log_magnitudes[idx + 1] - self.log_magnitudes[idx]
+        )
+        phase = self.phases_rad[idx] + weight * (self.phases_rad[idx + 1] - self.phases_rad[idx])
+        return cmath.rect(math.exp(log_mag), phase)
+
+
+class _TableCache:
+    """Bounded LRU mapping from kernel parameter tuples to distance tables."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._tables: OrderedDict[TableKey, DistanceTable] = OrderedDict()
+
+    def get(self, key: TableKey) -> DistanceTable | None:
+        table = self._tables.get(key)
+        if table is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._tables.move_to_end(key)
+        return table
+
+    def put(self, key: TableKey, table: DistanceTable) -> None:
+        self._tables[key] = table
+        self._tables.move_to_end(key)
+        while len(self._tables) > self.maxsize:
+            self._tables.popitem(last=False)
+
+    def info(self) -> TableCacheInfo:
+        return TableCacheInfo(
+            hits=self.hits, misses=self.misses, size=len(self._tables), maxsize=self.maxsize
+        )
+
+    def clear(self) -> None:
+        self._tables.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_TABLE_CACHE = _TableCache(maxsize=512)
+
+
+def _relative_error(approx: complex, exact: complex) -> float:
+    return abs(approx - exact) / max(abs(exact), 1e-30)
+
+
+def _unwrap_towards(phase: float, reference: float) -> float:
+    return phase + 2.0 * math.pi * round((reference - phase) / (2.0 * math.pi))
+
+
+def build_distance_table(
+    kernel: ExponentialKernel,
+    frequency_khz: float,
+    region_radius_m: float,
+    relative_tolerance: float = 1e-4,
+    initial_intervals: int = 32,
+    max_nodes: int = 4097,
+) -> DistanceTable:
+    """Sample one frequency of ``kernel`` over distance with adaptive bisection.
+
+    Intervals are split until the exact midpoint value is reproduced by interpolation
+    within ``relative_tolerance``. The feeder-length knee is always a node, so the
+    refinement concentrates where the left/right segment split changes regime.
+    """
+    if region_radius_m <= 0:
+        raise ValueError("region_radius_m must be positive.")
+    if relative_tolerance <= 0:
+        raise ValueError("relative_tolerance must be positive.")
+    initial_intervals = max(int(initial_intervals), 1)
+
+    breakpoints = {
+        region_radius_m * idx / initial_intervals for idx in range(initial_intervals + 1)
+    }
+    knee_m = kernel.feeder_length_km * 1000.0
+    if 0.0 < knee_m < region_radius_m:
+        breakpoints.add(knee_m)
+    nodes = sorted(breakpoints)
+
+    samples: dict[float, tuple[float, float]] = {}
+
+    def sample(distance_m: float, reference_phase: float | None = None) -> tuple[float, float]:
+        value = kernel.impedance(frequency_khz, distance_m)
+        phase = cmath.phase(value)
+        if reference_phase is not None:
+            phase = _unwrap_towards(phase, reference_phase)
+        entry = (math.log(max(abs(value), 1e-300)), phase)
+        samples[distance_m] = entry
+        return entry
+
+    previous_phase: float | None = None
+    for node in nodes:
+        previous_phase = sample(node, previous_phase)[1]
+
+    max_error = 0.0
+    pending = [(nodes[idx], nodes[idx + 1]) for idx in range(len(nodes) - 1)]
+    pending.reverse()
+    while pending:
+        left, right = pending.pop()
+        middle = 0.5 * (left + right)
+        left_log, left_phase = samples[left]
+        right_log, right_phase = samples[right]
+        approx = cmath.rect(
+            math.exp(0.5 * (left_log + right_log)), 0.5 * (left_phase + right_phase)
+        )
+        mid_log, mid_phase = sample(middle, 0.5 * (left_phase + right_phase))
+        error = _relative_error(approx, cmath.rect(math.exp(mid_log), mid_phase))
+        if error > relative_tolerance and len(samples) < max_nodes and middle > left:
+            # Process the left half first so that phases unwrap in distance order.
+            pending.append((middle, right))
+            pending.append((left, middle))
+        else:
+            max_error = max(max_error, error)
+
+    distances = sorted(samples)
+    return DistanceTable(
+        frequency_khz=frequency_khz,
+        distances_m=distances,
+        log_magnitudes=[samples[distance][0] for distance in distances],
+        phases_rad=[samples[distance][1] for distance in distances],
+        max_relative_error=max_error,
+    )
+
+
+@dataclass(slots=True)
+class TabulatedKernel:
+    """PropagationKernel backed by cached per-frequency distance tables.
+
+    The first lookup at a frequency builds a table from ``base``; later lookups are a
+    bisection plus one interpolation. Distances outside [0, region_radius_m] fall back
+    to the exact base kernel. With a ``store``, tables also persist across processes.
+    """
+
+    base: ExponentialKernel
+    region_radius_m: float
+    relative_tolerance: float = 1e-4
+    initial_intervals: int = 32
+    max_nodes: int = 4097
+    store: ArrayStore | None = None
+    _tables: dict[float, DistanceTable] = field(default_factory=dict, init=False, repr=False)
+
+    def _cache_key(self, frequency_khz: float) -> TableKey:
+        return (
+            astuple(self.base),
+            float(frequency_khz),
+            float(self.region_radius_m),
+            float(self.relative_tolerance),
+            int(self.initial_intervals),
+            int(self.max_nodes),
+        )
+
+    def table(self, frequency_khz: float) -> DistanceTable:
+        """Return the distance table for one frequency, building it on a cache miss."""
+        table = self._tables.get(frequency_khz)
+        if table is not None:
+            return table
+        key = self._cache_key(frequency_khz)
+        table = _TABLE_CACHE.get(key)
+        if table is None:
+            table = self._build_table(frequency_khz, key)
+            _TABLE_CACHE.put(key, table)
+        self._tables[frequency_khz] = table
+        return table
+
+    def _build_table(self, frequency_khz: float, key: TableKey) -> DistanceTable:
+        def compute() -> list[float]:
+            return build_distance_table(
+                self.base,
+                frequency_khz,
+                self.region_radius_m,
+                relative_tolerance=self.relative_tolerance,
+                initial_intervals=self.initial_intervals,
+                max_nodes=self.max_nodes,
+            ).to_values()
+
+        if self.store is None:
+            return DistanceTable.from_values(compute())
+        return DistanceTable.from_values(
+            self.store.get_or_compute("distance_table", {"key": list(key)}, compute)
+        )
+
+    def impedance(self, frequency_khz: float, distance_m: float) -> complex:
+        """Return interpolated complex transfer impedance at frequency and distance."""
+        if distance_m < 0.0 or distance_m > self.region_radius_m:
+            return self.base.impedance(frequency_khz, distance_m)
+        return self.table(frequency_khz).impedance(distance_m)
+
+    @staticmethod
+    def cache_info() -> TableCacheInfo:
+        """Return hit/miss counters of the shared table cache."""
+        return _TABLE_CACHE.info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop all cached tables and reset counters."""
+        _TABLE_CACHE.clear()
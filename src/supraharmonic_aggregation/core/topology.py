@@ -0,0 +1,219 @@
+"""Radial feeder topology kernel built from cascaded ABCD line segments."""
+
+from __future__ import annotations
+
+import bisect
+import cmath
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from .kernel import line_constants
+
+
+@dataclass(frozen=True, slots=True)
+class CableType:
+    """Per-km RLGC parameters of one cable type."""
+
+    r_ohm_per_km: float = 0.35
+    l_h_per_km: float = 0.45e-3
+    c_f_per_km: float = 120e-9
+    g_s_per_km: float = 0.0
+    skin_effect_coeff: float = 0.18
+    skin_effect_ref_hz: float = 2000.0
+    dielectric_tan_delta: float = 0.015
+    alpha: float = 0.0
+
+    def line_constants(self, frequency_hz: float) -> tuple[complex, complex]:
+        """Return (propagation per km, characteristic impedance) at one frequency."""
+        return line_constants(
+            frequency_hz,
+            r_ohm_per_km=self.r_ohm_per_km,
+            l_h_per_km=self.l_h_per_km,
+            c_f_per_km=self.c_f_per_km,
+            g_s_per_km=self.g_s_per_km,
+            skin_effect_coeff=self.skin_effect_coeff,
+            skin_effect_ref_hz=self.skin_effect_ref_hz,
+            dielectric_tan_delta=self.dielectric_tan_delta,
+            alpha=self.alpha,
+        )
+
+
+@dataclass(slots=True)
+class FeederSegment:
+    """Line segment from ``parent`` towards ``node``, optionally loaded at ``node``."""
+
+    node: str
+    parent: str
+    length_m: float
+    cable: CableType = field(default_factory=CableType)
+    load_impedance_ohm: float | None = None
+
+
+@dataclass(slots=True)
+class RadialFeederPlan:
+    """Node-to-PCC transfer impedances of a radial feeder at one frequency."""
+
+    frequency_khz: float
+    nodes: list[str]
+    path_distances_m: list[float]
+    transfer_impedances: list[complex]
+    _order: list[int] = field(default_factory=list, repr=False)
+    _sorted_distances: list[float] = field(default_factory=list, repr=False)
+    _index: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self._index = {node: idx for idx, node in enumerate(self.nodes)}
+        self._order = sorted(range(len(self.nodes)), key=self.path_distances_m.__getitem__)
+        self._sorted_distances = [self.path_distances_m[idx] for idx in self._order]
+
+    def node_impedance(self, node: str) -> complex:
+        """Return the transfer impedance from ``node`` to the PCC."""
+        return self.transfer_impedances[self._index[node]]
+
+    def impedance(self, distance_m: float) -> complex:
+        """Return the transfer impedance of the node nearest in path distance."""
+        position = bisect.bisect_left(self._sorted_distances, distance_m)
+        if position >= len(self._order):
+            position = len(self._order) - 1
+        elif position > 0 and (
+            distance_m - self._sorted_distances[position - 1]
+            <= self._sorted_distances[position] - distance_m
+        ):
+            position -= 1
+        return self.transfer_impedances[self._order[position]]
+
+    def impedances(self, distances_m: Sequence[float]) -> list[complex]:
+        """Evaluate :meth:`impedance` for each distance."""
+        impedance = self.impedance
+        return [impedance(distance) for distance in distances_m]
+
+
+class RadialFeederKernel:
+    """PropagationKernel for radial trees of mixed cable segments.
+
+    The PCC is modelled as a shunt source impedance; each node may carry a shunt load.
+    For every frequency one leaf-to-root pass folds subtrees into driving-point
+    admittances and one root-to-leaf pass multiplies per-segment voltage ratios, so
+    every node reuses the cascade product of its parent (O(nodes) per frequency).
+    Transfer impedances follow from reciprocity: the PCC voltage per ampere injected at
+    a node equals the node voltage per ampere injected at the PCC.
+
+    ``impedance(frequency_khz, distance_m)`` maps a source to the node whose path
+    distance from the PCC is nearest, so point-process populations can be aggregated
+    against a topology unchanged. Plans are cached per frequency (the most recent
+    ``max_plans``), so aggregating a population costs one tree pass per frequency.
+    """
+
+    def __init__(
+        self,
+        segments: Sequence[FeederSegment],
+        pcc_node: str = "pcc",
+        source_impedance_ohm: float = 0.03,
+        max_plans: int = 256,
+    ) -> None:
+        if max_plans <= 0:
+            raise ValueError("max_plans must be positive.")
+        self.max_plans = max_plans
+        self._plans: OrderedDict[float, RadialFeederPlan] = OrderedDict()
+        self.pcc_node = pcc_node
+        self.source_impedance_ohm = source_impedance_ohm
+        self.segments = list(segments)
+        by_node: dict[str, FeederSegment] = {}
+        children: dict[str, list[str]] = {pcc_node: []}
+        for segment in self.segments:
+            if segment.node == pcc_node or segment.node in by_node:
+                raise ValueError(f"Duplicate or invalid feeder node: {segment.node}")
+            if segment.length_m < 0:
+                raise ValueError(f"Segment length must be non-negative: {segment.node}")
+            by_node[segment.node] = segment
+            children.setdefault(segment.node, [])
+        for segment in self.segments:
+            if segment.parent not in children:
+                raise ValueError(f"Unknown parent node {segment.parent!r} for {segment.node}")
+            children[segment.parent].append(segment.node)
+
+        # Breadth-first order guarantees parents precede children.
+        order: list[str] = []
+        frontier = deque([pcc_node])
+        while frontier:
+            node = frontier.popleft()
+            order.append(node)
+            frontier.extend(children[node])
+        if len(order) != len(self.segments) + 1:
+            raise ValueError("Feeder segments must form a tree rooted at the PCC node.")
+
+        self._segments = [by_node[node] for node in order[1:]]
+        self._index = {node: idx for idx, node in enumerate(order)}
+        self._parent_index = [-1] + [self._index[seg.parent] for seg in self._segments]
+        self.nodes = order
+        distances = [0.0]
+        for segment, parent_idx in zip(self._segments, self._parent_index[1:]):
+            distances.append(distances[parent_idx] + segment.length_m)
+        self.path_distances_m = distances
+
+    def _node_transfer(self, frequency_khz: float) -> list[complex]:
+        frequency_hz = max(frequency_khz, 1e-9) * 1000.0
+        constants: dict[CableType, tuple[complex, complex]] = {}
+        n_nodes = len(self.nodes)
+        abcd: list[tuple[complex, complex, complex, complex]] = [(1 + 0j, 0j, 0j, 1 + 0j)]
+        for segment in self._segments:
+            if segment.cable not in constants:
+                constants[segment.cable] = segment.cable.line_constants(frequency_hz)
+            gamma, zc = constants[segment.cable]
+            theta = gamma * (segment.length_m / 1000.0)
+            cosh = cmath.cosh(theta)
+            sinh = cmath.sinh(theta)
+            abcd.append((cosh, zc * sinh, sinh / zc, cosh))
+
+        # Leaf-to-root: admittance looking into each node's subtree (incl. its load).
+        downstream = [0j] * n_nodes
+        for idx in range(n_nodes - 1, 0, -1):
+            segment = self._segments[idx - 1]
+            if segment.load_impedance_ohm is not None:
+                downstream[idx] += 1.0 / complex(max(segment.load_impedance_ohm, 1e-9), 0.0)
+            a, b, c, d = abcd[idx]
+            y_load = downstream[idx]
+            downstream[self._parent_index[idx]] += (c + d * y_load) / (a + b * y_load)
+
+        y_pcc = downstream[0] + 1.0 / complex(max(self.source_impedance_ohm, 1e-9), 0.0)
+        ratios = [1.0 / y_pcc] + [0j] * (n_nodes - 1)
+        # Root-to-leaf: each node reuses its parent's cascaded voltage ratio.
+        for idx in range(1, n_nodes):
+            a, b, _, _ = abcd[idx]
+            ratios[idx] = ratios[self._parent_index[idx]] / (a + b * downstream[idx])
+
+        bounded: list[complex] = []
+        for value in ratios:
+            magnitude = abs(value)
+            if magnitude <= 1e-12:
+                bounded.append(complex(max(magnitude, 1e-9), 0.0))
+            else:
+                bounded.append(value * (max(magnitude, 1e-9) / magnitude))
+        return bounded
+
+    def plan(self, frequency_khz: float) -> RadialFeederPlan:
+        """Return all node-to-PCC transfer impedances at one frequency (cached)."""
+        key = float(frequency_khz)
+        cached = self._plans.get(key)
+        if cached is not None:
+            self._plans.move_to_end(key)
+            return cached
+        plan = RadialFeederPlan(
+            frequency_khz=frequency_khz,
+            nodes=list(self.nodes),
+            path_distances_m=list(self.path_distances_m),
+            transfer_impedances=self._node_transfer(frequency_khz),
+        )
+        self._plans[key] = plan
+        if len(self._plans) > self.max_plans:
+            self._plans.popitem(last=False)
+        return plan
+
+    def transfer_impedances(self, frequencies_khz: Sequence[float]) -> list[list[complex]]:
+        """Return one row per frequency with the transfer impedance of every node."""
+        return [list(self.plan(frequency).transfer_impedances) for frequency in frequencies_khz]
+
+    def impedance(self, frequency_khz: float, distance_m: float) -> complex:
+        """Return the transfer impedance of the node nearest to ``distance_m``."""
+        return self.plan(frequency_khz).impedance(distance_m)
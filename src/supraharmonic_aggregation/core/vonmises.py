@@ -0,0 +1,55 @@
+"""Tabulated von Mises inverse CDF for common-random-number phase draws."""
+
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True, slots=True)
+class VonMisesTable:
+    """Inverse CDF of a zero-mean von Mises angle on ``[-pi, pi]``.
+
+    The density is integrated with the trapezoid rule on ``points`` equally spaced
+    angles, and :meth:`ppf` inverts the piecewise-linear CDF by bisection. Unlike
+    ``random.vonmisesvariate``, one uniform always maps to one angle, monotonically, so
+    the same uniforms can be reused across concentrations.
+    """
+
+    kappa: float
+    angles: tuple[float, ...]
+    cdf: tuple[float, ...]
+
+    @classmethod
+    def build(cls, kappa: float, points: int = 2049) -> "VonMisesTable":
+        if kappa < 0:
+            raise ValueError("kappa must be non-negative.")
+        if points < 3:
+            raise ValueError("points must be at least 3.")
+        step = 2.0 * math.pi / (points - 1)
+        angles = [-math.pi + idx * step for idx in range(points)]
+        # exp(kappa * (cos - 1)) keeps the density at most 1 for any concentration.
+        density = [math.exp(kappa * (math.cos(angle) - 1.0)) for angle in angles]
+        cumulative = [0.0]
+        for left, right in zip(density, density[1:]):
+            cumulative.append(cumulative[-1] + 0.5 * (left + right) * step)
+        total = cumulative[-1]
+        cdf = [value / total for value in cumulative]
+        cdf[-1] = 1.0
+        return cls(kappa=kappa, angles=tuple(angles), cdf=tuple(cdf))
+
+    def ppf(self, u: float) -> float:
+        """Return the angle whose CDF value is ``u`` (``0 <= u <= 1``)."""
+        cdf = self.cdf
+        idx = min(max(bisect.bisect_right(cdf, u) - 1, 0), len(cdf) - 2)
+        lower, upper = cdf[idx], cdf[idx + 1]
+        weight = (u - lower) / (upper - lower) if upper > lower else 0.0
+        return self.angles[idx] + weight * (self.angles[idx + 1] - self.angles[idx])
+
+
+@lru_cache(maxsize=256)
+def von_mises_table(kappa: float, points: int = 2049) -> VonMisesTable:
+    """Return a cached :class:`VonMisesTable`."""
+    return VonMisesTable.build(kappa, points)
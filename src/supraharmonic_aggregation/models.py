@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, MutableSequence
+
+if TYPE_CHECKING:
+    from .core.safeguard import SafeguardTelemetry
 
 
 StatisticsFrame = list[dict[str, float | int | str]]
@@ -29,10 +32,22 @@ class IntegrabilityReport:
 
 @dataclass(slots=True)
 class MonteCarloResult:
-    """Monte Carlo simulation outputs."""
+    """Monte Carlo simulation outputs.
+
+    Float32 runs store samples as ``array('f')`` buffers and attach an accuracy report
+    comparing a float64 subsample. ``safeguard`` carries denominator-safeguard counters
+    (and raw records when requested) in realization order. Pruned runs attach a
+    per-frequency ``pruning_report`` of realized error estimates and pruned fractions.
+    Quasi-Monte Carlo runs attach a ``qmc_report`` of replicate-based standard errors.
+    """
 
-    per_frequency_samples: dict[str, list[float]]
+    per_frequency_samples: dict[str, MutableSequence[float]]
     statistics_frame: StatisticsFrame
+    precision: str = "float64"
+    accuracy_report: StatisticsFrame | None = None
+    safeguard: SafeguardTelemetry | None = None
+    pruning_report: StatisticsFrame | None = None
+    qmc_report: StatisticsFrame | None = None
 
 
 @dataclass(slots=True)
@@ -60,8 +75,14 @@ class RunBundle:
         """Serialize this run bundle to a JSON-compatible dict."""
         payload = asdict(self)
         payload["monte_carlo"] = {
-            "per_frequency_samples": self.monte_carlo.per_frequency_samples,
+            "per_frequency_samples": {
+                key: list(values) for key, values in self.monte_carlo.per_frequency_samples.items()
+            },
             "statistics_frame": self.monte_carlo.statistics_frame,
+            "precision": self.monte_carlo.precision,
+            "accuracy_report": self.monte_carlo.accuracy_report,
+            "pruning_report": self.monte_carlo.pruning_report,
+            "qmc_report": self.monte_carlo.qmc_report,
         }
         payload["benchmark"] = {"rows": self.benchmark.rows}
         return payload
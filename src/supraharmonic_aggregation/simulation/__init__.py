@@ -1,6 +1,33 @@
 """Simulation utilities."""
 
+from .coherence_sweep import CoherenceSweepResult, CoherenceSweepRunner
+from .density_sweep import DensitySweepResult, DensitySweepRunner
+from .mark_family_sweep import MarkFamilySweepResult, MarkFamilySweepRunner
 from .monte_carlo import MonteCarloRunner
+from .resonance_sweep import (
+    ResonanceSetting,
+    ResonanceSweepResult,
+    ResonanceSweepRunner,
+    resonance_settings_grid,
+)
 from .synthetic_data import SyntheticDataGenerator, SyntheticDataset
+from .time_series import SwitchingModel, SwitchingTimeSeriesRunner, TimeSeriesResult
 
-__all__ = ["MonteCarloRunner", "SyntheticDataGenerator", "SyntheticDataset"]
+__all__ = [
+    "CoherenceSweepResult",
+    "CoherenceSweepRunner",
+    "DensitySweepResult",
+    "DensitySweepRunner",
+    "MarkFamilySweepResult",
+    "MarkFamilySweepRunner",
+    "MonteCarloRunner",
+    "ResonanceSetting",
+    "ResonanceSweepResult",
+    "ResonanceSweepRunner",
+    "resonance_settings_grid",
+    "SyntheticDataGenerator",
+    "SyntheticDataset",
+    "SwitchingModel",
+    "SwitchingTimeSeriesRunner",
+    "TimeSeriesResult",
+]
@@ -0,0 +1,181 @@
+"""Mark-distribution sweeps that share one spatial draw across amplitude families."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+from ..analysis.tail import build_statistics_frame
+from .._optional import optional_numpy
+from ..config import AnalysisConfig
+from ..core.aggregator import SupraharmonicAggregator
+from ..core.batch import PopulationBatch, batch_ranges
+from ..core.kernel import ExponentialKernel
+from ..core.mark_families import AmplitudeFamily, mark_family
+from ..core.marks import SourceColumns, mark_parameters
+from ..core.poisson import sample_poisson_batch
+from ..core.sampling import default_generator
+from ..core.streams import STREAM_MODES, stream_generator
+from ..models import StatisticsFrame
+
+_np = optional_numpy()  # Optional array backend required by the vectorized families.
+
+
+@dataclass(slots=True)
+class MarkFamilySweepResult:
+    """Per-family magnitude samples and summary statistics."""
+
+    families: list[str]
+    per_family_samples: list[dict[str, list[float]]]
+    statistics_frame: StatisticsFrame
+
+
+@dataclass(slots=True)
+class _SpatialDraw:
+    columns: SourceColumns
+    amplitude_uniforms: Any
+    auxiliary_uniforms: Any
+
+
+class MarkFamilySweepRunner:
+    """Evaluate several amplitude families against one spatial draw per realization.
+
+    Every realization fixes source count, distances, phases, spectral marks and two
+    uniforms per source; each family maps the uniforms to amplitudes through
+    :meth:`~supraharmonic_aggregation.core.mark_families.AmplitudeFamily.amplitudes`
+    and the clip of :func:`~supraharmonic_aggregation.core.marks.sample_mark`. Unit
+    amplitude contributions are computed once per batch of
+    ``config.simulation_batch_size`` realizations, so each extra family costs one
+    vectorized amplitude map and one segmented sum per batch instead of a full Monte
+    Carlo run. Samples do not depend on the batch size.
+
+    Draws come from a numpy ``Generator``: one seeded with ``seed`` for sequential
+    streams, or the keyed ``(seed, k, "population")`` stream of realization ``k``.
+    """
+
+    def __init__(
+        self, config: AnalysisConfig, seed: int | None = None, streams: str | None = None
+    ) -> None:
+        self.config = config
+        self.seed = config.seed if seed is None else seed
+        self.streams = config.simulation_streams if streams is None else streams
+
+    def families(
+        self, families: Sequence[str] | Mapping[str, AmplitudeFamily]
+    ) -> dict[str, AmplitudeFamily]:
+        """Resolve registered family names with the configured coherence and current."""
+        if isinstance(families, Mapping):
+            return dict(families)
+        return {
+            name: mark_family(name, self.config.coherence, self.config.base_current_a)
+            for name in families
+        }
+
+    def run(
+        self,
+        n_samples: int,
+        families: Sequence[str] | Mapping[str, AmplitudeFamily],
+        frequencies_khz: list[float] | None = None,
+    ) -> MarkFamilySweepResult:
+        """Run the sweep and summarize every (family, frequency) pair."""
+        if _np is None:
+            raise ImportError("numpy is required for mark-family sweeps.")
+        self.config.validate()
+        if n_samples <= 0:
+            raise ValueError("n_samples must be positive.")
+        if not families:
+            raise ValueError("families must not be empty.")
+        if self.streams not in STREAM_MODES:
+            raise ValueError(f"Unsupported streams: {self.streams}")
+        resolved = self.families(families)
+        freqs = list(frequencies_khz or self.config.frequencies_khz)
+        generator = default_generator(self.seed) if self.streams == "sequential" else None
+        kernel = ExponentialKernel(
+            alpha=self.config.kernel_alpha, resonance_scale=self.config.resonance_scale
+        )
+        aggregator = SupraharmonicAggregator(kernel)
+        per_family_samples: list[dict[str, list[float]]] = [
+            {str(freq): [] for freq in freqs} for _ in resolved
+        ]
+
+        for start, stop in batch_ranges(n_samples, self.config.simulation_batch_size):
+            draws = [
+                self._draw_spatial(
+                    generator
+                    if generator is not None
+                    else stream_generator(self.seed, index, "population")
+                )
+                for index in range(start, stop)
+            ]
+            batch = PopulationBatch.from_columns([draw.columns for draw in draws])
+            counts = _np.asarray(batch.counts())
+            starts = _np.asarray(batch.offsets[:-1])
+            # One zero row keeps reduceat in range when trailing realizations are empty.
+            transfers = _np.zeros((len(batch.columns) + 1, len(freqs)), dtype=complex)
+            if len(batch.columns):
+                transfers[:-1] = aggregator.source_contributions(freqs, batch.columns)
+            u = _np.concatenate([draw.amplitude_uniforms for draw in draws])
+            v = _np.concatenate([draw.auxiliary_uniforms for draw in draws])
+            for family, samples in zip(resolved.values(), per_family_samples):
+                weights = _np.append(self._amplitudes(family, u, v), 0.0)
+                totals = _np.add.reduceat(weights[:, None] * transfers, starts, axis=0)
+                totals[counts == 0] = 0.0
+                for frequency, column in zip(freqs, _np.abs(totals).T.tolist()):
+                    samples[str(frequency)].extend(column)
+
+        rows: StatisticsFrame = []
+        for name, samples in zip(resolved, per_family_samples):
+            for row in build_statistics_frame(
+                freqs,
+                samples,
+                threshold=self.config.threshold,
+                threshold_rms_multiplier=self.config.threshold_rms_multiplier,
+            ):
+                rows.append({"mark_family": name, **row})
+        return MarkFamilySweepResult(
+            families=list(resolved),
+            per_family_samples=per_family_samples,
+            statistics_frame=rows,
+        )
+
+    def population(self, index: int, family: str | AmplitudeFamily) -> SourceColumns:
+        """Return realization ``index`` of a keyed-stream sweep under one family."""
+        if self.streams != "keyed":
+            raise ValueError("Random access to realizations requires streams='keyed'.")
+        if isinstance(family, str):
+            family = self.families([family])[family]
+        draw = self._draw_spatial(stream_generator(self.seed, index, "population"))
+        columns = draw.columns
+        columns.amplitude_a = self._amplitudes(
+            family, draw.amplitude_uniforms, draw.auxiliary_uniforms
+        ).tolist()
+        return columns
+
+    def _amplitudes(self, family: AmplitudeFamily, u: Any, v: Any) -> Any:
+        cap = max(self.config.base_current_a, 1e-6) * 40.0
+        values = family.amplitudes(u, v)
+        return _np.clip(_np.asarray(values, dtype=float), 1e-6, cap)
+
+    def _draw_spatial(self, generator) -> _SpatialDraw:  # type: ignore[no-untyped-def]
+        """Draw the family-independent part of one population with unit amplitudes."""
+        radius = self.config.region_radius_m
+        area_km2 = math.pi * (radius / 1000.0) ** 2
+        n_sources = int(sample_poisson_batch(self.config.density * area_km2, generator))
+        common_phase = generator.uniform(0.0, 2.0 * math.pi)
+        kappa, _, _ = mark_parameters(self.config.coherence, self.config.base_current_a)
+        distance = radius * _np.sqrt(generator.random(n_sources))
+        phase = _np.mod(generator.vonmises(common_phase, kappa, size=n_sources), 2.0 * math.pi)
+        amplitude_uniforms = generator.random(n_sources)
+        auxiliary_uniforms = generator.random(n_sources)
+        columns = SourceColumns(
+            distance_m=distance.tolist(),
+            amplitude_a=[1.0] * n_sources,
+            phase_rad=phase.tolist(),
+            admittance_s=[max(self.config.admittance_s, 0.0)] * n_sources,
+            spectral_tilt_per_decade=generator.normal(0.0, 0.30, size=n_sources).tolist(),
+            phase_slope_rad_per_khz=generator.normal(0.0, 0.025, size=n_sources).tolist(),
+            admittance_rolloff_per_khz=generator.uniform(0.0005, 0.004, size=n_sources).tolist(),
+            reference_frequency_khz=[30.0] * n_sources,
+        )
+        return _SpatialDraw(columns, amplitude_uniforms, auxiliary_uniforms)
@@ -2,47 +2,424 @@
 
 from __future__ import annotations
 
+import math
 import random
+from array import array
+from typing import Mapping, MutableSequence, Sequence
 
 from ..analysis.tail import adaptive_threshold, compute_tail_metrics
 from ..config import AnalysisConfig
-from ..core.aggregator import SupraharmonicAggregator
+from ..core.aggregator import Precision, SourcePopulation, SupraharmonicAggregator
+from ..core.batch import PopulationBatch, batch_ranges
 from ..core.kernel import ExponentialKernel
-from ..core.marks import generate_source_population
-from ..models import MonteCarloResult
+from ..core.marks import SourceColumns, generate_source_population
+from ..core.population_bank import PopulationBank, PopulationKey
+from ..core.qmc import SobolEngine, qmc_dimensions, qmc_population_batch
+from ..core.sampling import (
+    default_generator,
+    sample_population_batch,
+    sample_population_columns,
+)
+from ..core.streams import STREAM_MODES, stream_generator, stream_rng, stream_seed
+from ..core.safeguard import SafeguardTelemetry
+from ..models import MonteCarloResult, StatisticsFrame
+
+
+def precision_accuracy_report(
+    frequencies_khz: list[float],
+    reference_samples: dict[str, list[float]],
+    reduced_samples: dict[str, list[float]],
+    tolerance: float,
+) -> StatisticsFrame:
+    """Compare paired float64/float32 magnitudes realization by realization."""
+    rows: StatisticsFrame = []
+    for frequency in frequencies_khz:
+        key = str(frequency)
+        reference = reference_samples[key]
+        reduced = reduced_samples[key]
+        errors = [abs(low - high) / max(abs(high), 1e-30) for high, low in zip(reference, reduced)]
+        ref_mean = sum(reference) / len(reference) if reference else 0.0
+        red_mean = sum(reduced) / len(reduced) if reduced else 0.0
+        max_error = max(errors, default=0.0)
+        rows.append(
+            {
+                "frequency_khz": frequency,
+                "subsample_size": len(errors),
+                "max_relative_error": max_error,
+                "mean_relative_error": sum(errors) / len(errors) if errors else 0.0,
+                "mean_abs_v_float64": ref_mean,
+                "mean_abs_v_float32": red_mean,
+                "mean_relative_bias": (red_mean - ref_mean) / max(abs(ref_mean), 1e-30),
+                "tolerance": tolerance,
+                "within_tolerance": int(max_error <= tolerance),
+            }
+        )
+    return rows
+
+
+def qmc_replicate_report(
+    frequencies_khz: list[float],
+    per_frequency_samples: Mapping[str, Sequence[float]],
+    replicates: int,
+) -> StatisticsFrame:
+    """Summarize interleaved QMC replicates: replicate-mean statistics and their errors.
+
+    Sample ``k`` belongs to replicate ``k % replicates``. Mean, RMS and p95 are computed
+    per replicate; each row reports their average and its standard error, the sample
+    standard deviation across replicates over ``sqrt(replicates)``.
+    """
+    rows: StatisticsFrame = []
+    for frequency in frequencies_khz:
+        values = per_frequency_samples[str(frequency)]
+        estimates: dict[str, list[float]] = {"mean_abs_v": [], "rms_abs_v": [], "p95_abs_v": []}
+        for replicate in range(replicates):
+            chunk = list(values[replicate::replicates])
+            if not chunk:
+                continue
+            estimates["mean_abs_v"].append(sum(chunk) / len(chunk))
+            estimates["rms_abs_v"].append(math.sqrt(sum(v * v for v in chunk) / len(chunk)))
+            estimates["p95_abs_v"].append(compute_tail_metrics(chunk, (95,)).percentiles[95])
+        row: dict[str, float | int | str] = {
+            "frequency_khz": frequency,
+            "replicates": len(estimates["mean_abs_v"]),
+        }
+        for name, series in estimates.items():
+            count = len(series)
+            center = sum(series) / count if count else 0.0
+            spread = (
+                math.sqrt(sum((value - center) ** 2 for value in series) / (count - 1))
+                if count > 1
+                else 0.0
+            )
+            row[name] = center
+            row[f"{name}_std_error"] = spread / math.sqrt(count) if count else 0.0
+        rows.append(row)
+    return rows
 
 
 class MonteCarloRunner:
-    """Run stochastic simulation with deterministic seed controls."""
+    """Run stochastic simulation with deterministic seed controls.
+
+    Realizations are drawn in seed order and aggregated ``batch_size`` at a time
+    (default ``config.simulation_batch_size``); samples do not depend on the batch size.
+    ``sampler="numpy"`` draws each batch with
+    :func:`~supraharmonic_aggregation.core.sampling.sample_population_batch` on a PCG64
+    generator seeded with ``seed``: same distributions, different streams.
 
-    def __init__(self, config: AnalysisConfig, seed: int | None = None) -> None:
+    ``sampler="qmc"`` drives each realization from one point of a scrambled Sobol
+    sequence (:mod:`~supraharmonic_aggregation.core.qmc`): the source count, the common
+    phase and the distance, phase and amplitude of the ``qmc_sources`` nearest sources
+    take one dimension each; further sources and the remaining marks use keyed
+    pseudo-random padding. Realization ``k`` is point ``k // qmc_replicates`` of
+    replicate ``k % qmc_replicates``, each replicate an independent scrambling, so
+    realizations are random access whatever ``streams`` says and
+    ``MonteCarloResult.qmc_report`` estimates standard errors from the spread between
+    replicates. Sobol balance is best when ``n_samples / qmc_replicates`` is a power of
+    two.
+
+    ``streams="keyed"`` draws realization ``k`` from its own stream keyed by
+    ``(seed, k, "population")`` instead of one sequential stream, so any realization can
+    be regenerated alone with :meth:`population` and results do not depend on how the
+    run is chunked.
+
+    ``precision="float32"`` aggregates in complex64 and keeps samples in ``array('f')``
+    buffers. Up to ``accuracy_subsample`` evenly spaced realizations are re-aggregated in
+    float64 and summarized in ``MonteCarloResult.accuracy_report``.
+
+    Denominator-safeguard activations are always counted. ``record_denominators_below``
+    additionally keeps raw records so that
+    :func:`~supraharmonic_aggregation.analysis.safeguard.sweep_safeguard_thresholds` can
+    re-evaluate any threshold up to that value without resampling.
+
+    ``prune_tolerance_v`` skips far sources whose estimated combined contribution stays
+    within that many volts per realization and frequency (float64 only); the realized
+    error estimates and pruned fractions are summarized in
+    ``MonteCarloResult.pruning_report``.
+
+    A ``population_bank`` replays populations sampled by earlier runs with the same
+    seed, density, region, marks, sampler and streams, so sweeps that only change the
+    kernel or the frequencies skip sampling. Keyed runs look realizations up one by one
+    and sample only the misses; sequential runs replay only when every realization is
+    banked, since a gap would leave the shared stream in the wrong state. The sequential
+    numpy sampler draws whole batches at once, so it banks and replays only realizations
+    of full ``batch_size`` batches.
+    """
+
+    def __init__(
+        self,
+        config: AnalysisConfig,
+        seed: int | None = None,
+        batch_size: int | None = None,
+        precision: Precision | None = None,
+        accuracy_subsample: int = 256,
+        accuracy_tolerance: float = 1e-4,
+        record_denominators_below: float | None = None,
+        prune_tolerance_v: float | None = None,
+        sampler: str | None = None,
+        streams: str | None = None,
+        population_bank: PopulationBank | None = None,
+        qmc_replicates: int = 8,
+        qmc_sources: int = 32,
+    ) -> None:
         self.config = config
         self.seed = config.seed if seed is None else seed
+        self.batch_size = config.simulation_batch_size if batch_size is None else batch_size
+        self.precision = config.simulation_precision if precision is None else precision
+        self.accuracy_subsample = accuracy_subsample
+        self.accuracy_tolerance = accuracy_tolerance
+        self.record_denominators_below = record_denominators_below
+        self.prune_tolerance_v = prune_tolerance_v
+        self.sampler = config.simulation_sampler if sampler is None else sampler
+        self.streams = config.simulation_streams if streams is None else streams
+        self.population_bank = population_bank
+        self.qmc_replicates = qmc_replicates
+        self.qmc_sources = qmc_sources
+        self._sobol_engines: dict[int, SobolEngine] = {}
+
+    def population_key(self) -> PopulationKey:
+        """Return the bank key of this runner's populations."""
+        return PopulationKey(
+            seed=self.seed,
+            density=self.config.density,
+            region_radius_m=self.config.region_radius_m,
+            coherence=self.config.coherence,
+            base_current_a=self.config.base_current_a,
+            admittance_s=self.config.admittance_s,
+            sampler=(
+                f"qmc:{self.qmc_replicates}:{self.qmc_sources}"
+                if self.sampler == "qmc"
+                else self.sampler
+            ),
+            streams=self.streams,
+            batch_size=(
+                self.batch_size
+                if self.sampler == "numpy" and self.streams == "sequential"
+                else None
+            ),
+        )
+
+    def population(self, index: int) -> SourcePopulation | SourceColumns:
+        """Regenerate realization ``index`` of a keyed-stream run without replaying others."""
+        if self.sampler == "qmc":
+            return self._qmc_batch(index, index + 1).realization(0)
+        if self.streams != "keyed":
+            raise ValueError("Random access to realizations requires streams='keyed'.")
+        if self.sampler == "numpy":
+            return self._keyed_columns(index)
+        return self._keyed_population(index)
+
+    def _keyed_columns(self, index: int) -> SourceColumns:
+        return sample_population_columns(
+            density=self.config.density,
+            region_radius_m=self.config.region_radius_m,
+            coherence=self.config.coherence,
+            base_current_a=self.config.base_current_a,
+            admittance_s=self.config.admittance_s,
+            generator=stream_generator(self.seed, index, "population"),
+        )
+
+    def _keyed_population(self, index: int) -> SourcePopulation:
+        return generate_source_population(
+            density=self.config.density,
+            region_radius_m=self.config.region_radius_m,
+            coherence=self.config.coherence,
+            base_current_a=self.config.base_current_a,
+            admittance_s=self.config.admittance_s,
+            rng=stream_rng(self.seed, index, "population"),
+        )
+
+    def _sobol_engine(self, replicate: int) -> SobolEngine:
+        engine = self._sobol_engines.get(replicate)
+        if engine is None:
+            engine = SobolEngine.create(
+                qmc_dimensions(self.qmc_sources), stream_seed(self.seed, replicate, "sobol")
+            )
+            self._sobol_engines[replicate] = engine
+        return engine
+
+    def _qmc_batch(self, start: int, stop: int) -> PopulationBatch:
+        """Return QMC realizations ``start..stop-1``, one Sobol range per replicate."""
+        if self.qmc_replicates < 2 or self.qmc_sources < 0:
+            raise ValueError("qmc_replicates must be >= 2 and qmc_sources non-negative.")
+        replicates = self.qmc_replicates
+        ranges = {}
+        for replicate in range(replicates):
+            first = -(-(start - replicate) // replicates)
+            last = -(-(stop - replicate) // replicates)
+            if last > first:
+                ranges[replicate] = (first, self._sobol_engine(replicate).points(first, last))
+        rows = []
+        for index in range(start, stop):
+            point, replicate = divmod(index, replicates)
+            first, points = ranges[replicate]
+            rows.append(points[point - first])
+        return qmc_population_batch(
+            rows,
+            density=self.config.density,
+            region_radius_m=self.config.region_radius_m,
+            coherence=self.config.coherence,
+            base_current_a=self.config.base_current_a,
+            admittance_s=self.config.admittance_s,
+            paddings=[
+                stream_generator(self.seed, index, "qmc_padding") for index in range(start, stop)
+            ],
+        )
+
+    def _banked_columns(self, key: PopulationKey, index: int) -> SourceColumns:
+        bank = self.population_bank
+        assert bank is not None  # only called while replaying from a bank
+        columns = bank.get(key, index)
+        if columns is not None:
+            return columns
+        if self.sampler != "qmc" and self.streams != "keyed":
+            raise RuntimeError(
+                f"Banked realization {index} was evicted from the store during replay."
+            )
+        if self.sampler == "qmc":
+            columns = self._qmc_batch(index, index + 1).realization(0)
+        elif self.sampler == "numpy":
+            columns = self._keyed_columns(index)
+        else:
+            converted = SourceColumns.from_population(self._keyed_population(index))
+            assert converted is not None  # sampled marks are plain SourceMarks
+            columns = converted
+        bank.put(key, index, columns)
+        return columns
 
     def run(self, n_samples: int) -> MonteCarloResult:
         """Run Monte Carlo simulations and summarize per-frequency outputs."""
         self.config.validate()
+        prune_tolerance_v = self.prune_tolerance_v
+        if prune_tolerance_v is not None and self.precision != "float64":
+            raise ValueError("prune_tolerance_v requires float64 precision.")
+        if self.sampler not in ("python", "numpy", "qmc"):
+            raise ValueError(f"Unsupported sampler: {self.sampler}")
+        if self.streams not in STREAM_MODES:
+            raise ValueError(f"Unsupported streams: {self.streams}")
+        qmc = self.sampler == "qmc"
+        keyed = self.streams == "keyed" or qmc
+        bank = self.population_bank
+        bank_key = self.population_key()
+        # Sequential numpy draws depend on the batch length, so only full batches are
+        # banked or replayed.
+        whole_batches = self.sampler != "numpy" or keyed or n_samples % self.batch_size == 0
+        replay = bank is not None and (
+            keyed
+            or whole_batches
+            and all(bank.contains(bank_key, index) for index in range(n_samples))
+        )
         rng = random.Random(self.seed)
+        generator = None
+        if self.sampler == "numpy" and not keyed:
+            generator = default_generator(self.seed)
         kernel = ExponentialKernel(
             alpha=self.config.kernel_alpha, resonance_scale=self.config.resonance_scale
         )
         aggregator = SupraharmonicAggregator(kernel)
-        per_frequency_samples: dict[str, list[float]] = {
-            str(freq): [] for freq in self.config.frequencies_khz
+        frequencies = self.config.frequencies_khz
+        telemetry = SafeguardTelemetry(
+            frequencies_khz=list(frequencies),
+            min_denominator_magnitude=aggregator.min_denominator_magnitude,
+            record_below=self.record_denominators_below,
+        )
+        reduced = self.precision == "float32"
+        per_frequency_samples: dict[str, MutableSequence[float]] = {
+            str(freq): array("f") if reduced else [] for freq in frequencies
         }
+        stride = max(1, math.ceil(n_samples / max(self.accuracy_subsample, 1)))
+        reference_samples: dict[str, list[float]] = {str(freq): [] for freq in frequencies}
+        reduced_samples: dict[str, list[float]] = {str(freq): [] for freq in frequencies}
+        error_estimates: list[list[float]] = [[] for _ in frequencies]
+        pruned_fractions: list[list[float]] = [[] for _ in frequencies]
+        populations: PopulationBatch | Sequence[SourcePopulation]
+        realizations: Sequence[SourcePopulation | SourceColumns]
 
-        for _ in range(n_samples):
-            population = generate_source_population(
-                density=self.config.density,
-                region_radius_m=self.config.region_radius_m,
-                coherence=self.config.coherence,
-                base_current_a=self.config.base_current_a,
-                admittance_s=self.config.admittance_s,
-                rng=rng,
-            )
-            for frequency in self.config.frequencies_khz:
-                value = aggregator.aggregate_magnitude(frequency, population)
-                per_frequency_samples[str(frequency)].append(value)
+        for start, stop in batch_ranges(n_samples, self.batch_size):
+            if replay:
+                columns = [self._banked_columns(bank_key, index) for index in range(start, stop)]
+                populations = PopulationBatch.from_columns(columns)
+                realizations = columns
+            elif qmc:
+                populations = batch = self._qmc_batch(start, stop)
+                realizations = [batch.realization(idx) for idx in range(len(batch))]
+            elif keyed and self.sampler == "numpy":
+                columns = [self._keyed_columns(index) for index in range(start, stop)]
+                populations = PopulationBatch.from_columns(columns)
+                realizations = columns
+            elif keyed:
+                sampled = [self._keyed_population(index) for index in range(start, stop)]
+                populations = realizations = sampled
+            elif generator is not None:
+                batch = sample_population_batch(
+                    stop - start,
+                    density=self.config.density,
+                    region_radius_m=self.config.region_radius_m,
+                    coherence=self.config.coherence,
+                    base_current_a=self.config.base_current_a,
+                    admittance_s=self.config.admittance_s,
+                    generator=generator,
+                )
+                populations = batch
+                realizations = [batch.realization(idx) for idx in range(len(batch))]
+            else:
+                sampled = [
+                    generate_source_population(
+                        density=self.config.density,
+                        region_radius_m=self.config.region_radius_m,
+                        coherence=self.config.coherence,
+                        base_current_a=self.config.base_current_a,
+                        admittance_s=self.config.admittance_s,
+                        rng=rng,
+                    )
+                    for _ in range(start, stop)
+                ]
+                populations = realizations = sampled
+            full_batch = generator is None or stop - start == self.batch_size
+            if bank is not None and not replay and full_batch:
+                for index, realization in zip(range(start, stop), realizations):
+                    banked = (
+                        realization
+                        if isinstance(realization, SourceColumns)
+                        else SourceColumns.from_population(realization)
+                    )
+                    assert banked is not None  # sampled marks are plain SourceMarks
+                    bank.put(bank_key, index, banked)
+            if prune_tolerance_v is not None:
+                spectra = []
+                for population in realizations:
+                    pruned = aggregator.aggregate_spectrum_pruned(
+                        frequencies, population, prune_tolerance_v, telemetry=telemetry
+                    )
+                    spectra.append(pruned.values)
+                    for idx, (estimate, fraction) in enumerate(
+                        zip(pruned.error_estimates_v, pruned.pruned_fractions)
+                    ):
+                        error_estimates[idx].append(estimate)
+                        pruned_fractions[idx].append(fraction)
+            else:
+                spectra = aggregator.aggregate_batch(
+                    frequencies,
+                    populations,
+                    precision=self.precision,  # type: ignore[arg-type]
+                    telemetry=telemetry,
+                )
+            for spectrum in spectra:
+                for frequency, value in zip(frequencies, spectrum):
+                    per_frequency_samples[str(frequency)].append(abs(value))
+            if reduced and self.accuracy_subsample > 0:
+                picks = [
+                    idx - start
+                    for idx in range(start, stop)
+                    if idx % stride == 0 and idx // stride < self.accuracy_subsample
+                ]
+                exact = [
+                    aggregator.aggregate_spectrum(frequencies, realizations[pick]) for pick in picks
+                ]
+                for pick, spectrum in zip(picks, exact):
+                    for frequency, value in zip(frequencies, spectrum):
+                        key = str(frequency)
+                        reference_samples[key].append(abs(value))
+                        reduced_samples[key].append(per_frequency_samples[key][start + pick])
 
         statistics_frame: list[dict[str, float | int | str]] = []
         for frequency in self.config.frequencies_khz:
@@ -74,7 +451,38 @@ class MonteCarloRunner:
                 }
             )
 
+        accuracy_report = None
+        if reduced:
+            accuracy_report = precision_accuracy_report(
+                frequencies, reference_samples, reduced_samples, self.accuracy_tolerance
+            )
+        pruning_report: StatisticsFrame | None = None
+        if prune_tolerance_v is not None:
+            pruning_report = [
+                {
+                    "frequency_khz": frequency,
+                    "tolerance_v": prune_tolerance_v,
+                    "max_error_estimate_v": max(estimates, default=0.0),
+                    "mean_error_estimate_v": (
+                        sum(estimates) / len(estimates) if estimates else 0.0
+                    ),
+                    "mean_pruned_fraction": (sum(fractions) / len(fractions) if fractions else 0.0),
+                }
+                for frequency, estimates, fractions in zip(
+                    frequencies, error_estimates, pruned_fractions
+                )
+            ]
+        qmc_report = None
+        if qmc:
+            qmc_report = qmc_replicate_report(
+                frequencies, per_frequency_samples, self.qmc_replicates
+            )
         return MonteCarloResult(
             per_frequency_samples=per_frequency_samples,
             statistics_frame=statistics_frame,
+            precision=self.precision,
+            accuracy_report=accuracy_report,
+            safeguard=telemetry,
+            pruning_report=pruning_report,
+            qmc_report=qmc_report,
         )
@@ -8,12 +8,14 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from ..analysis.analytical import compute_analytical_statistics
-from ..analysis.tail import adaptive_threshold, compute_tail_metrics
+from ..analysis.tail import build_statistics_frame
 from ..benchmark.compare import compare_with_feeder_benchmark
 from ..config import AnalysisConfig
 from ..core.aggregator import SupraharmonicAggregator
+from ..core.batch import batch_ranges
 from ..core.kernel import ExponentialKernel
 from ..core.marks import amplitudes, generate_source_population
+from ..core.streams import STREAM_MODES, stream_rng
 from ..models import StatisticsFrame
 
 
@@ -53,48 +55,25 @@ def _write_csv(path: Path, rows: list[dict[str, float | int | str]]) -> None:
         writer.writerows(rows)
 
 
-def _build_statistics(
-    frequencies_khz: list[float],
-    per_frequency_samples: dict[str, list[float]],
-    threshold: float | None,
-    threshold_rms_multiplier: float,
-) -> StatisticsFrame:
-    rows: StatisticsFrame = []
-    for frequency in frequencies_khz:
-        key = str(frequency)
-        values = per_frequency_samples[key]
-        mean_abs_v = sum(values) / len(values) if values else 0.0
-        var_v = sum((value - mean_abs_v) ** 2 for value in values) / len(values) if values else 0.0
-        rms_abs_v = (mean_abs_v**2 + var_v) ** 0.5
-        tail_threshold = adaptive_threshold(
-            floor_threshold=threshold or 0.0,
-            rms_abs_v=rms_abs_v,
-            multiplier=threshold_rms_multiplier,
-        )
-        tail = compute_tail_metrics(values, threshold=tail_threshold)
-        rows.append(
-            {
-                "frequency_khz": frequency,
-                "mean_abs_v": mean_abs_v,
-                "var_v": var_v,
-                "rms_abs_v": rms_abs_v,
-                "p90_abs_v": tail.percentiles.get(90, 0.0),
-                "p95_abs_v": tail.percentiles.get(95, 0.0),
-                "p99_abs_v": tail.percentiles.get(99, 0.0),
-                "exceedance_probability": tail.exceedance_probability or 0.0,
-                "exceedance_threshold_v": tail_threshold,
-                "sample_size": tail.sample_size,
-            }
-        )
-    return rows
-
-
 class SyntheticDataGenerator:
-    """Generate synthetic observations aligned to package physics/statistics."""
+    """Generate synthetic observations aligned to package physics/statistics.
 
-    def __init__(self, config: AnalysisConfig, seed: int | None = None) -> None:
+    With ``streams="keyed"`` sample ``k`` draws its population and measurement noise
+    from streams keyed by ``(seed, k, purpose)``; populations then coincide with those
+    of a keyed :class:`~supraharmonic_aggregation.simulation.monte_carlo.MonteCarloRunner`.
+    """
+
+    def __init__(
+        self,
+        config: AnalysisConfig,
+        seed: int | None = None,
+        batch_size: int | None = None,
+        streams: str | None = None,
+    ) -> None:
         self.config = config
         self.seed = config.seed if seed is None else seed
+        self.batch_size = config.simulation_batch_size if batch_size is None else batch_size
+        self.streams = config.simulation_streams if streams is None else streams
 
     def generate(
         self,
@@ -108,6 +87,9 @@ class SyntheticDataGenerator:
         sample_count = self.config.monte_carlo_samples if n_samples is None else n_samples
         if sample_count <= 0:
             raise ValueError("n_samples must be positive.")
+        if self.streams not in STREAM_MODES:
+            raise ValueError(f"Unsupported streams: {self.streams}")
+        keyed = self.streams == "keyed"
 
         rng = random.Random(self.seed)
         kernel = ExponentialKernel(
@@ -118,44 +100,59 @@ class SyntheticDataGenerator:
         per_frequency_samples: dict[str, list[float]] = {str(freq): [] for freq in frequencies}
         observations: list[SyntheticObservation] = []
 
-        for sample_id in range(sample_count):
-            population = generate_source_population(
-                density=self.config.density,
-                region_radius_m=self.config.region_radius_m,
-                coherence=self.config.coherence,
-                base_current_a=self.config.base_current_a,
-                admittance_s=self.config.admittance_s,
-                rng=rng,
-            )
-            source_count = len(population)
-            source_amplitudes = amplitudes(population)
-            mean_source_amplitude = (
-                sum(source_amplitudes) / len(source_amplitudes) if source_amplitudes else 0.0
-            )
+        add_noise = include_measurement_noise and self.config.measurement_noise_cv > 0
+        for start, stop in batch_ranges(sample_count, self.batch_size):
+            populations = []
+            noise_draws: list[list[float]] = []
+            for sample_id in range(start, stop):
+                population = generate_source_population(
+                    density=self.config.density,
+                    region_radius_m=self.config.region_radius_m,
+                    coherence=self.config.coherence,
+                    base_current_a=self.config.base_current_a,
+                    admittance_s=self.config.admittance_s,
+                    rng=stream_rng(self.seed, sample_id, "population") if keyed else rng,
+                )
+                populations.append(population)
+                # Standard normals are drawn in the unbatched order and scaled once the
+                # latent voltage is known; rng.gauss(0, s) equals 0 + z * s exactly.
+                noise_rng = stream_rng(self.seed, sample_id, "measurement_noise") if keyed else rng
+                noise_draws.append(
+                    [noise_rng.gauss(0.0, 1.0) for _ in frequencies] if add_noise else []
+                )
+            spectra = aggregator.aggregate_batch(frequencies, populations)
 
-            for frequency in frequencies:
-                complex_voltage = aggregator.aggregate_complex_voltage(frequency, population)
-                latent_abs_v = abs(complex_voltage)
-                observed_abs_v = latent_abs_v
-                if include_measurement_noise and self.config.measurement_noise_cv > 0:
-                    observed_abs_v = latent_abs_v * (1.0 + self.config.measurement_bias)
-                    observed_abs_v += rng.gauss(
-                        0.0, self.config.measurement_noise_cv * max(latent_abs_v, 1e-6)
-                    )
-                    observed_abs_v = max(observed_abs_v, 0.0)
-                per_frequency_samples[str(frequency)].append(observed_abs_v)
-                row: SyntheticObservation = {
-                    "sample_id": sample_id,
-                    "frequency_khz": frequency,
-                    "source_count": source_count,
-                    "mean_source_amplitude_a": mean_source_amplitude,
-                    "abs_v": observed_abs_v,
-                    "latent_abs_v": latent_abs_v,
-                }
-                if include_complex:
-                    row["real_v"] = complex_voltage.real
-                    row["imag_v"] = complex_voltage.imag
-                observations.append(row)
+            for offset, (population, spectrum, noise) in enumerate(
+                zip(populations, spectra, noise_draws)
+            ):
+                sample_id = start + offset
+                source_count = len(population)
+                source_amplitudes = amplitudes(population)
+                mean_source_amplitude = (
+                    sum(source_amplitudes) / len(source_amplitudes) if source_amplitudes else 0.0
+                )
+                for freq_idx, (frequency, complex_voltage) in enumerate(zip(frequencies, spectrum)):
+                    latent_abs_v = abs(complex_voltage)
+                    observed_abs_v = latent_abs_v
+                    if add_noise:
+                        observed_abs_v = latent_abs_v * (1.0 + self.config.measurement_bias)
+                        observed_abs_v += 0.0 + noise[freq_idx] * (
+                            self.config.measurement_noise_cv * max(latent_abs_v, 1e-6)
+                        )
+                        observed_abs_v = max(observed_abs_v, 0.0)
+                    per_frequency_samples[str(frequency)].append(observed_abs_v)
+                    row: SyntheticObservation = {
+                        "sample_id": sample_id,
+                        "frequency_khz": frequency,
+                        "source_count": source_count,
+                        "mean_source_amplitude_a": mean_source_amplitude,
+                        "abs_v": observed_abs_v,
+                        "latent_abs_v": latent_abs_v,
+                    }
+                    if include_complex:
+                        row["real_v"] = complex_voltage.real
+                        row["imag_v"] = complex_voltage.imag
+                    observations.append(row)
 
         analysis_config = self.config
         if frequencies != self.config.frequencies_khz:
@@ -165,7 +162,7 @@ class SyntheticDataGenerator:
                     "frequencies_khz": frequencies,
                 }
             )
-        statistics_frame = _build_statistics(
+        statistics_frame = build_statistics_frame(
             frequencies,
             per_frequency_samples,
             threshold=self.config.threshold,
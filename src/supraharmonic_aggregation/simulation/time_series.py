@@ -0,0 +1,269 @@
+"""Time-series simulation of switching sources with incremental aggregation."""
+
+from __future__ import annotations
+
+import heapq
+import random
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from ..analysis.tail import compute_tail_metrics
+from ..config import AnalysisConfig
+from ..core.aggregator import SourcePopulation, SupraharmonicAggregator
+from ..core.kernel import ExponentialKernel
+from ..core.marks import generate_source_population
+from ..models import StatisticsFrame
+
+_TOGGLE = 0
+_OPERATING_POINT = 1
+
+
+@dataclass(slots=True)
+class SwitchingModel:
+    """Stochastic on/off and operating-point behaviour of individual converters.
+
+    On and off holding times are exponential. Operating-point changes arrive as a
+    Poisson process per source and redraw a unit-mean lognormal current scale.
+    """
+
+    mean_on_s: float = 3600.0
+    mean_off_s: float = 1800.0
+    mean_operating_point_change_s: float = 900.0
+    operating_point_sigma: float = 0.25
+
+    def validate(self) -> None:
+        """Raise ValueError on invalid holding times or spread."""
+        if self.mean_on_s <= 0 or self.mean_off_s <= 0:
+            raise ValueError("mean_on_s and mean_off_s must be positive.")
+        if self.mean_operating_point_change_s <= 0:
+            raise ValueError("mean_operating_point_change_s must be positive.")
+        if self.operating_point_sigma < 0:
+            raise ValueError("operating_point_sigma must be non-negative.")
+
+    @property
+    def on_probability(self) -> float:
+        """Stationary probability that a source is switched on."""
+        return self.mean_on_s / (self.mean_on_s + self.mean_off_s)
+
+    def draw_operating_point(self, rng: random.Random) -> float:
+        """Draw a current scale factor with unit mean."""
+        sigma = self.operating_point_sigma
+        return rng.lognormvariate(-0.5 * sigma * sigma, sigma)
+
+
+@dataclass(slots=True)
+class TimeSeriesResult:
+    """Per-interval statistics, final state and incremental-update diagnostics."""
+
+    population: SourcePopulation
+    statistics_frame: StatisticsFrame
+    final_voltages: list[complex]
+    final_scales: list[float]
+    event_count: int
+    resync_count: int
+    max_resync_drift: float
+
+
+@dataclass(slots=True)
+class _RunState:
+    population: SourcePopulation = field(default_factory=list)
+    sums: list[complex] = field(default_factory=list)
+    effective: list[float] = field(default_factory=list)
+    event_count: int = 0
+    resync_count: int = 0
+    max_resync_drift: float = 0.0
+
+
+def _exact_sums(
+    contributions: list[list[complex]], effective: list[float], n_frequencies: int
+) -> tuple[list[complex], list[float]]:
+    sums = [0j] * n_frequencies
+    scales = [0.0] * n_frequencies
+    for scale, row in zip(effective, contributions):
+        if scale == 0.0:
+            continue
+        for idx, value in enumerate(row):
+            term = scale * value
+            sums[idx] += term
+            scales[idx] += abs(term)
+    return sums, scales
+
+
+class SwitchingTimeSeriesRunner:
+    """Simulate one feeder over time as converters switch and change operating point.
+
+    One population is drawn and every source's per-frequency contribution is computed
+    once. Contributions are linear in source current, so the aggregate is a running
+    per-frequency sum and each switching event costs a single O(frequencies) delta.
+    |V| is sampled every ``step_s`` and summarized per ``interval_s`` while the run
+    streams, so only one interval of samples is held at a time. Running sums are rebuilt
+    exactly every ``resync_every_events`` events to bound accumulated rounding.
+    """
+
+    def __init__(
+        self,
+        config: AnalysisConfig,
+        seed: int | None = None,
+        model: SwitchingModel | None = None,
+    ) -> None:
+        self.config = config
+        self.seed = config.seed if seed is None else seed
+        self.model = model or SwitchingModel()
+
+    def stream(
+        self,
+        duration_s: float,
+        interval_s: float = 600.0,
+        step_s: float = 1.0,
+        frequencies_khz: list[float] | None = None,
+        resync_every_events: int = 50_000,
+    ) -> Iterator[dict[str, float | int | str]]:
+        """Yield one statistics row per (interval, frequency) as the series advances."""
+        return self._stream(
+            _RunState(), duration_s, interval_s, step_s, frequencies_khz, resync_every_events
+        )
+
+    def run(
+        self,
+        duration_s: float,
+        interval_s: float = 600.0,
+        step_s: float = 1.0,
+        frequencies_khz: list[float] | None = None,
+        resync_every_events: int = 50_000,
+    ) -> TimeSeriesResult:
+        """Run the whole series and collect the streamed rows."""
+        state = _RunState()
+        rows = list(
+            self._stream(
+                state, duration_s, interval_s, step_s, frequencies_khz, resync_every_events
+            )
+        )
+        return TimeSeriesResult(
+            population=state.population,
+            statistics_frame=rows,
+            final_voltages=list(state.sums),
+            final_scales=list(state.effective),
+            event_count=state.event_count,
+            resync_count=state.resync_count,
+            max_resync_drift=state.max_resync_drift,
+        )
+
+    def _stream(
+        self,
+        state: _RunState,
+        duration_s: float,
+        interval_s: float,
+        step_s: float,
+        frequencies_khz: list[float] | None,
+        resync_every_events: int,
+    ) -> Iterator[dict[str, float | int | str]]:
+        self.config.validate()
+        self.model.validate()
+        if duration_s <= 0 or interval_s <= 0 or step_s <= 0:
+            raise ValueError("duration_s, interval_s and step_s must be positive.")
+        if resync_every_events <= 0:
+            raise ValueError("resync_every_events must be positive.")
+        freqs = list(frequencies_khz or self.config.frequencies_khz)
+        n_freqs = len(freqs)
+        model = self.model
+        rng = random.Random(self.seed)
+        kernel = ExponentialKernel(
+            alpha=self.config.kernel_alpha, resonance_scale=self.config.resonance_scale
+        )
+        aggregator = SupraharmonicAggregator(kernel)
+        population = generate_source_population(
+            density=self.config.density,
+            region_radius_m=self.config.region_radius_m,
+            coherence=self.config.coherence,
+            base_current_a=self.config.base_current_a,
+            admittance_s=self.config.admittance_s,
+            rng=rng,
+        )
+        contributions = aggregator.source_contributions(freqs, population)
+        n_sources = len(population)
+        scales = [model.draw_operating_point(rng) for _ in range(n_sources)]
+        switched_on = [rng.random() < model.on_probability for _ in range(n_sources)]
+        effective = [scale if on else 0.0 for scale, on in zip(scales, switched_on)]
+        sums, _ = _exact_sums(contributions, effective, n_freqs)
+        state.population = population
+        state.sums = sums
+        state.effective = effective
+
+        rate_op = 1.0 / model.mean_operating_point_change_s
+        events: list[tuple[float, int, int]] = []
+        for idx, on in enumerate(switched_on):
+            holding = model.mean_on_s if on else model.mean_off_s
+            events.append((rng.expovariate(1.0 / holding), idx, _TOGGLE))
+            events.append((rng.expovariate(rate_op), idx, _OPERATING_POINT))
+        heapq.heapify(events)
+
+        n_steps = max(int(round(duration_s / step_s)), 1)
+        steps_per_interval = max(int(round(interval_s / step_s)), 1)
+        buffers: list[list[float]] = [[] for _ in freqs]
+        active_total = 0
+        interval_events = 0
+        since_resync = 0
+        interval_index = 0
+        active = sum(1 for value in effective if value != 0.0)
+        for step in range(1, n_steps + 1):
+            now = step * step_s
+            while events and events[0][0] <= now:
+                time_s, idx, kind = heapq.heappop(events)
+                if kind == _TOGGLE:
+                    switched_on[idx] = not switched_on[idx]
+                    holding = model.mean_on_s if switched_on[idx] else model.mean_off_s
+                    heapq.heappush(events, (time_s + rng.expovariate(1.0 / holding), idx, kind))
+                else:
+                    scales[idx] = model.draw_operating_point(rng)
+                    heapq.heappush(events, (time_s + rng.expovariate(rate_op), idx, kind))
+                new_value = scales[idx] if switched_on[idx] else 0.0
+                delta = new_value - effective[idx]
+                if delta != 0.0:
+                    if effective[idx] == 0.0:
+                        active += 1
+                    elif new_value == 0.0:
+                        active -= 1
+                    effective[idx] = new_value
+                    for freq_idx, value in enumerate(contributions[idx]):
+                        sums[freq_idx] += delta * value
+                state.event_count += 1
+                interval_events += 1
+                since_resync += 1
+                if since_resync >= resync_every_events:
+                    exact, magnitude_scale = _exact_sums(contributions, effective, n_freqs)
+                    for freq_idx in range(n_freqs):
+                        drift = abs(sums[freq_idx] - exact[freq_idx]) / max(
+                            magnitude_scale[freq_idx], 1e-30
+                        )
+                        state.max_resync_drift = max(state.max_resync_drift, drift)
+                        sums[freq_idx] = exact[freq_idx]
+                    state.resync_count += 1
+                    since_resync = 0
+
+            for buffer, value in zip(buffers, sums):
+                buffer.append(abs(value))
+            active_total += active
+            if step % steps_per_interval == 0 or step == n_steps:
+                count = len(buffers[0])
+                start_s = interval_index * steps_per_interval * step_s
+                for frequency, values in zip(freqs, buffers):
+                    mean_abs_v = sum(values) / count
+                    mean_square = sum(value * value for value in values) / count
+                    tail = compute_tail_metrics(values, percentiles=(95,))
+                    yield {
+                        "interval_index": interval_index,
+                        "start_s": start_s,
+                        "end_s": now,
+                        "frequency_khz": frequency,
+                        "mean_abs_v": mean_abs_v,
+                        "rms_abs_v": mean_square**0.5,
+                        "p95_abs_v": tail.percentiles.get(95, 0.0),
+                        "max_abs_v": max(values),
+                        "sample_size": count,
+                        "event_count": interval_events,
+                        "mean_active_sources": active_total / count,
+                    }
+                buffers = [[] for _ in freqs]
+                active_total = 0
+                interval_events = 0
+                interval_index += 1
@@ -24,3 +24,12 @@ def test_cli_pipeline_writes_logs(tmp_path: Path) -> None:
     # Quickstart config writes logs under default path if not overridden.
     # Accept either global default logs path or local output logs path.
     assert Path("logs").exists() or logs_root.exists()
+
+
+@pytest.mark.pipeline
+def test_cli_cache_stats_and_clear(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    cache_dir = tmp_path / "cache"
+    assert main(["cache", "stats", "--cache-dir", str(cache_dir)]) == 0
+    assert '"entries": 0' in capsys.readouterr().out
+    assert main(["cache", "clear", "--cache-dir", str(cache_dir)]) == 0
+    assert '"removed_entries": 0' in capsys.readouterr().out
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import random
+from dataclasses import dataclass
+
 import pytest
 
 from supraharmonic_aggregation.core.aggregator import Source, SupraharmonicAggregator
 from supraharmonic_aggregation.core.kernel import ExponentialKernel
-from supraharmonic_aggregation.core.marks import SourceMark
+from supraharmonic_aggregation.core.marks import (
+    SourceColumns,
+    SourceMark,
+    generate_source_population,
+)
 
 
 @pytest.mark.unit
@@ -37,3 +44,115 @@ def test_aggregator_regularizes_near_singular_denominator() -> None:
     value = aggregator.aggregate_complex_voltage(10.0, [source])
     assert isinstance(value, complex)
     assert abs(value) > 0.0
+
+
+@pytest.mark.unit
+def test_columnar_path_matches_object_path_for_sampled_population() -> None:
+    rng = random.Random(3)
+    population = generate_source_population(
+        density=400.0,
+        region_radius_m=400.0,
+        coherence=0.3,
+        base_current_a=1.0,
+        admittance_s=0.01,
+        rng=rng,
+    )
+    columns = SourceColumns.from_population(population)
+    assert columns is not None and len(columns) == len(population)
+    aggregator = SupraharmonicAggregator(ExponentialKernel(alpha=0.8, resonance_scale=0.05))
+    for frequency in (2.0, 30.0, 150.0):
+        expected = aggregator._aggregate_objects(frequency, population)
+        assert aggregator.aggregate_complex_voltage(frequency, population) == pytest.approx(
+            expected, rel=1e-12
+        )
+        assert aggregator.aggregate_columns(frequency, columns) == pytest.approx(
+            expected, rel=1e-12
+        )
+
+
+@dataclass
+class _AttributeMark:
+    amplitude_a: float
+    phase_rad: float
+    admittance_s: float
+
+
+@pytest.mark.unit
+def test_custom_marks_fall_back_to_object_path() -> None:
+    sources = [Source(distance_m=80.0, mark=_AttributeMark(1.0, 0.5, 0.01))]
+    assert SourceColumns.from_population(sources) is None
+    aggregator = SupraharmonicAggregator(ExponentialKernel(alpha=0.5))
+    value = aggregator.aggregate_complex_voltage(10.0, sources)
+    assert value == aggregator._aggregate_objects(10.0, sources)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tile_size", [1, 7, 1024])
+def test_aggregate_spectrum_matches_per_frequency_aggregation(tile_size: int) -> None:
+    population = generate_source_population(
+        density=120.0,
+        region_radius_m=400.0,
+        coherence=0.2,
+        base_current_a=1.0,
+        admittance_s=0.02,
+        rng=random.Random(8),
+    )
+    aggregator = SupraharmonicAggregator(ExponentialKernel(alpha=0.8, resonance_scale=0.05))
+    frequencies = [2.0, 9.5, 30.0, 31.0, 150.0]
+    spectrum = aggregator.aggregate_spectrum(frequencies, population, tile_size=tile_size)
+    for frequency, value in zip(frequencies, spectrum):
+        expected = aggregator._aggregate_objects(frequency, population)
+        assert value == pytest.approx(expected, rel=1e-12)
+
+    custom = [Source(distance_m=80.0, mark=_AttributeMark(1.0, 0.5, 0.01))]
+    assert aggregator.aggregate_spectrum(frequencies, custom) == [
+        aggregator._aggregate_objects(frequency, custom) for frequency in frequencies
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("anchor_interval", [1, 4, 32])
+def test_uniform_grid_phasor_recurrence_tracks_exact_evaluation(anchor_interval: int) -> None:
+    population = generate_source_population(
+        density=200.0,
+        region_radius_m=400.0,
+        coherence=0.2,
+        base_current_a=1.0,
+        admittance_s=0.02,
+        rng=random.Random(17),
+    )
+    aggregator = SupraharmonicAggregator(
+        ExponentialKernel(alpha=0.8, resonance_scale=0.05),
+        phasor_anchor_interval=anchor_interval,
+    )
+    # Review-ready style grid with a trailing off-grid stop frequency.
+    frequencies = [round(2.0 + idx * 0.5, 6) for idx in range(120)] + [61.7]
+    steps = aggregator._phasor_steps(frequencies)
+    assert steps[0] is None and steps[-1] is None
+    assert sum(step is None for step in steps) >= len(frequencies) // anchor_interval
+    spectrum = aggregator.aggregate_spectrum(frequencies, population)
+    for frequency, value in zip(frequencies, spectrum):
+        expected = aggregator._aggregate_objects(frequency, population)
+        assert value == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.unit
+def test_piecewise_uniform_grid_adopts_each_segment_step() -> None:
+    population = generate_source_population(
+        density=200.0,
+        region_radius_m=400.0,
+        coherence=0.2,
+        base_current_a=1.0,
+        admittance_s=0.02,
+        rng=random.Random(23),
+    )
+    aggregator = SupraharmonicAggregator(ExponentialKernel(alpha=0.8, resonance_scale=0.05))
+    fine = [2.0 + idx * 0.25 for idx in range(20)]
+    frequencies = fine + [fine[-1] + 2.0 * (idx + 1) for idx in range(40)]
+    steps = aggregator._phasor_steps(frequencies)
+    assert [idx for idx, step in enumerate(steps) if step is None] == [0, 20, 52]
+    assert steps[19] == 0.25 and steps[21] == 2.0
+    spectrum = aggregator.aggregate_spectrum(frequencies, population)
+    for frequency, value in zip(frequencies, spectrum):
+        expected = aggregator._aggregate_objects(frequency, population)
+        assert value == pytest.approx(expected, rel=1e-12)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from supraharmonic_aggregation.analysis.analytical import compute_analytical_statistics
+from supraharmonic_aggregation.cache import ArrayStore, cache_key, open_store
+
+
+@pytest.mark.unit
+def test_cache_key_is_canonical_over_payload_order() -> None:
+    first = cache_key("transfer_moments", {"a": 1.0, "b": [2.0, 3.0]})
+    second = cache_key("transfer_moments", {"b": [2.0, 3.0], "a": 1.0})
+    assert first == second
+    assert first != cache_key("distance_table", {"a": 1.0, "b": [2.0, 3.0]})
+
+
+@pytest.mark.unit
+def test_array_store_round_trips_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    store = ArrayStore(tmp_path / "cache", max_bytes=3 * 8 * 8)
+    for age, name in enumerate(("a", "b", "c"), start=1):
+        key = cache_key("t", {"name": name})
+        store.put(key, [float(idx) for idx in range(8)])
+        os.utime(store.path_for(key), (age, age))
+    assert list(store.get(cache_key("t", {"name": "a"})) or []) == [float(i) for i in range(8)]
+    store.put(cache_key("t", {"name": "d"}), [1.0] * 8)
+    stats = store.stats()
+    assert stats.entries == 3
+    assert stats.evictions == 1
+    assert store.get(cache_key("t", {"name": "b"})) is None
+    assert store.get(cache_key("t", {"name": "a"})) is not None
+    assert store.clear() == 3
+    assert store.stats().entries == 0
+
+
+@pytest.mark.unit
+def test_array_store_sweeps_orphaned_temporary_files(tmp_path: Path) -> None:
+    store = ArrayStore(tmp_path / "cache")
+    key = cache_key("t", {"name": "a"})
+    store.put(key, [1.0])
+    stale = store.path_for(key).with_suffix(".999.tmp")
+    fresh = store.path_for(key).with_suffix(".998.tmp")
+    stale.write_bytes(b"partial")
+    fresh.write_bytes(b"partial")
+    os.utime(stale, (1, 1))
+    store.put(cache_key("t", {"name": "b"}), [2.0])
+    assert not stale.exists() and fresh.exists()
+    assert store.stats().entries == 2
+    store.clear()
+    assert not fresh.exists()
+
+
+@pytest.mark.unit
+def test_analytical_statistics_warm_start_from_store(baseline_config, tmp_path: Path) -> None:
+    baseline_config.cache_dir = str(tmp_path / "cache")
+    cold = compute_analytical_statistics(baseline_config)
+    warm = compute_analytical_statistics(baseline_config)
+    assert cold == warm
+    store = open_store(baseline_config)
+    assert store is not None and store.stats().entries == 1
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+
+from supraharmonic_aggregation.analysis.calibration import (
+    FeederMeasurement,
+    calibrate_feeders,
+    calibrate_kernel,
+)
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+
+_FREQUENCIES = [2.0, 5.0, 10.0, 20.0, 40.0, 75.0, 110.0, 150.0]
+_DISTANCES = [50.0, 150.0, 300.0, 500.0, 800.0]
+
+
+def _measurement(feeder_id: str, kernel: ExponentialKernel) -> FeederMeasurement:
+    return FeederMeasurement(
+        feeder_id=feeder_id,
+        frequencies_khz=_FREQUENCIES,
+        distances_m=_DISTANCES,
+        impedances=kernel.impedance_grid(_FREQUENCIES, _DISTANCES),
+    )
+
+
+@pytest.mark.unit
+def test_calibration_recovers_rlgc_parameters_from_synthetic_sweep() -> None:
+    truth = ExponentialKernel(
+        alpha=0.8,
+        r_ohm_per_km=0.5,
+        l_h_per_km=0.4e-3,
+        c_f_per_km=100e-9,
+        skin_effect_coeff=0.25,
+        dielectric_tan_delta=0.02,
+        termination_mode="resistive",
+    )
+    initial = ExponentialKernel(alpha=0.8, termination_mode="resistive")
+    result = calibrate_kernel(_measurement("f1", truth), initial)
+    assert result.converged
+    assert result.final_cost < 1e-3 * result.initial_cost
+    assert result.parameters["r_ohm_per_km"] == pytest.approx(0.5, rel=1e-3)
+    assert result.parameters["c_f_per_km"] == pytest.approx(100e-9, rel=1e-3)
+    assert result.rms_relative_error < 1e-4
+
+
+@pytest.mark.unit
+def test_calibrate_feeders_fans_out_and_preserves_order() -> None:
+    initial = ExponentialKernel(alpha=0.8)
+    measurements = [
+        _measurement("a", ExponentialKernel(alpha=0.8, r_ohm_per_km=0.30)),
+        _measurement("b", ExponentialKernel(alpha=0.8, r_ohm_per_km=0.45)),
+    ]
+    results = calibrate_feeders(measurements, initial, parameters=("r_ohm_per_km",), max_workers=2)
+    assert [result.feeder_id for result in results] == ["a", "b"]
+    assert results[0].parameters["r_ohm_per_km"] == pytest.approx(0.30, rel=1e-3)
+    assert results[1].parameters["r_ohm_per_km"] == pytest.approx(0.45, rel=1e-3)
+
+
+@pytest.mark.unit
+def test_calibration_seeds_disabled_resonance_from_nominal_values() -> None:
+    truth = ExponentialKernel(
+        alpha=0.8, resonance_scale=2.0, resonance_center_hz=30_000.0, resonance_width_hz=8_000.0
+    )
+    result = calibrate_kernel(
+        _measurement("r", truth),
+        ExponentialKernel(alpha=0.8),
+        parameters=("resonance_scale", "resonance_center_hz", "resonance_width_hz"),
+    )
+    assert result.converged
+    assert result.parameters["resonance_scale"] == pytest.approx(2.0, rel=1e-3)
+    assert result.parameters["resonance_center_hz"] == pytest.approx(30_000.0, rel=1e-3)
+    assert result.parameters["resonance_width_hz"] == pytest.approx(8_000.0, rel=1e-3)
+
+
+@pytest.mark.unit
+def test_calibration_reports_a_stalled_fit_as_not_converged() -> None:
+    truth = ExponentialKernel(alpha=0.8, resonance_scale=2.0)
+    # Without a resonance the width has no effect, so no step can reduce the misfit.
+    result = calibrate_kernel(
+        _measurement("s", truth), ExponentialKernel(alpha=0.8), parameters=("resonance_width_hz",)
+    )
+    assert not result.converged
+    assert result.final_cost == result.initial_cost
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import bisect
+import math
+import random
+from dataclasses import replace
+
+import pytest
+
+from supraharmonic_aggregation.core.aggregator import SupraharmonicAggregator
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.vonmises import von_mises_table
+from supraharmonic_aggregation.simulation.coherence_sweep import CoherenceSweepRunner
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kappa", [0.2, 5.4, 26.2])
+def test_tabulated_inverse_cdf_matches_vonmisesvariate(kappa: float) -> None:
+    table = von_mises_table(kappa)
+    rng = random.Random(3)
+    n = 4000
+    tabulated = sorted(table.ppf(rng.random()) for _ in range(n))
+    reference = sorted(
+        (rng.vonmisesvariate(0.0, kappa) + math.pi) % (2.0 * math.pi) - math.pi for _ in range(n)
+    )
+    statistic = (
+        max(
+            abs(bisect.bisect_right(tabulated, x) - bisect.bisect_right(reference, x))
+            for x in tabulated
+        )
+        / n
+    )
+    assert statistic < 1.95 * math.sqrt(2.0 / n)
+    assert table.ppf(0.5) == pytest.approx(0.0, abs=1e-9)
+    assert table.ppf(0.0) == -math.pi
+
+
+@pytest.mark.unit
+def test_sweep_levels_match_direct_aggregation_and_share_randomness(baseline_config) -> None:
+    config = replace(baseline_config, density=80.0, simulation_streams="keyed")
+    runner = CoherenceSweepRunner(config, seed=6)
+    sweep = runner.run(120, [0.40, 0.45])
+    kernel = ExponentialKernel(alpha=config.kernel_alpha, resonance_scale=config.resonance_scale)
+    spectrum = SupraharmonicAggregator(kernel).aggregate_spectrum(
+        config.frequencies_khz, runner.population(7, 0.45)
+    )
+    for frequency, value in zip(config.frequencies_khz, spectrum):
+        assert sweep.per_coherence_samples[1][str(frequency)][7] == pytest.approx(
+            abs(value), rel=1e-12
+        )
+
+    # Common random numbers: level differences vary far less than independent draws.
+    key = str(config.frequencies_khz[-1])
+    low, high = sweep.per_coherence_samples[0][key], sweep.per_coherence_samples[1][key]
+
+    def variance(values: list[float]) -> float:
+        mean = sum(values) / len(values)
+        return sum((value - mean) ** 2 for value in values) / (len(values) - 1)
+
+    differences = [b - a for a, b in zip(low, high)]
+    assert variance(differences) < 0.1 * (variance(low) + variance(high))
+    with pytest.raises(ValueError):
+        runner.run(2, [1.5])
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import replace
+
+import pytest
+
+from supraharmonic_aggregation.core.aggregator import SupraharmonicAggregator
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.marks import generate_source_population
+from supraharmonic_aggregation.core.streams import stream_rng
+from supraharmonic_aggregation.simulation.density_sweep import DensitySweepRunner
+from supraharmonic_aggregation.simulation.monte_carlo import MonteCarloRunner
+
+
+@pytest.mark.unit
+def test_top_level_reproduces_monte_carlo_at_max_density(baseline_config) -> None:
+    densities = [40.0, 10.0, 80.0]
+    sweep = DensitySweepRunner(baseline_config, seed=5).run(8, densities)
+    reference = MonteCarloRunner(replace(baseline_config, density=80.0), seed=5).run(8)
+    for key, values in reference.per_frequency_samples.items():
+        assert sweep.per_density_samples[2][key] == pytest.approx(values, rel=1e-12)
+    assert [row["density"] for row in sweep.statistics_frame[::3]] == densities
+
+
+@pytest.mark.unit
+def test_lower_levels_are_nested_thinnings(baseline_config) -> None:
+    densities = [20.0, 60.0, 120.0]
+    sweep = DensitySweepRunner(baseline_config, seed=3).run(200, densities)
+    low, mid, high = sweep.per_density_source_counts
+    assert all(a <= b <= c for a, b, c in zip(low, mid, high))
+    area_km2 = math.pi * 0.3**2
+    for density, counts in zip(densities, sweep.per_density_source_counts):
+        assert sum(counts) / len(counts) == pytest.approx(density * area_km2, rel=0.1)
+
+    # Rebuild the first realization and thin it by hand.
+    population = generate_source_population(
+        density=120.0,
+        region_radius_m=baseline_config.region_radius_m,
+        coherence=baseline_config.coherence,
+        base_current_a=baseline_config.base_current_a,
+        admittance_s=baseline_config.admittance_s,
+        rng=random.Random(3),
+    )
+    thinning = stream_rng(3, 0, "thinning")
+    kept = [source for source in population if thinning.random() < 20.0 / 120.0]
+    kernel = ExponentialKernel(
+        alpha=baseline_config.kernel_alpha, resonance_scale=baseline_config.resonance_scale
+    )
+    expected = SupraharmonicAggregator(kernel).aggregate_spectrum(
+        baseline_config.frequencies_khz, kept
+    )
+    for frequency, value in zip(baseline_config.frequencies_khz, expected):
+        assert sweep.per_density_samples[0][str(frequency)][0] == pytest.approx(
+            abs(value), rel=1e-12, abs=1e-15
+        )
+    with pytest.raises(ValueError):
+        DensitySweepRunner(baseline_config).run(4, [10.0, 0.0])
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from supraharmonic_aggregation.benchmark.timing import benchmark_intensity_samplers
+from supraharmonic_aggregation.core.intensity import PlanarIntensity, RadialIntensity
+from supraharmonic_aggregation.core.point_process import generate_process_population
+
+
+def _hotspot(x: float, y: float) -> float:
+    return 10.0 + 5000.0 * math.exp(-((x - 300.0) ** 2 + (y + 200.0) ** 2) / (2.0 * 30.0**2))
+
+
+HOTSPOT_MEAN = 10.0 * math.pi + 5000.0 * 2.0 * math.pi * 30.0**2 / 1e6
+
+
+@pytest.mark.unit
+def test_radial_inverse_cdf_matches_ring_profile() -> None:
+    ring = RadialIntensity(lambda r: 20.0 + 300.0 * math.exp(-(((r - 600.0) / 60.0) ** 2)))
+    rng = random.Random(4)
+    samples = [ring.sample_points(1000.0, rng) for _ in range(300)]
+    expected = ring.expected_count(1000.0)
+    # 20/km^2 over the disc plus the Gaussian ring, integrated in closed form (km units).
+    ring_mass = 300.0 * 2.0 * math.pi * 0.6 * 0.06 * math.sqrt(math.pi)
+    assert expected == pytest.approx(20.0 * math.pi + ring_mass, rel=1e-3)
+    total = sum(map(len, samples))
+    assert total / 300 == pytest.approx(expected, rel=0.03)
+    in_ring = sum(1 for points in samples for x, y in points if 480.0 < math.hypot(x, y) < 720.0)
+    ring_share = math.erf(2.0) * ring_mass + 20.0 * math.pi * (0.72**2 - 0.48**2)
+    assert in_ring / total == pytest.approx(ring_share / expected, abs=0.015)
+    assert ring.stats.acceptance_rate == 1.0
+
+    flat = RadialIntensity.from_profile([0.0, 1000.0], [50.0, 50.0])
+    assert flat.expected_count(500.0) == pytest.approx(50.0 * math.pi * 0.25)
+    with pytest.raises(ValueError):
+        RadialIntensity.from_profile([0.0, 0.0], [1.0, 2.0])
+
+
+@pytest.mark.unit
+def test_thinning_with_cell_majorant_is_unbiased_and_reports_violations() -> None:
+    rng = random.Random(6)
+    fine = PlanarIntensity(_hotspot, majorant_cells=64)
+    counts = [len(fine.sample_points(1000.0, rng)) for _ in range(200)]
+    assert sum(counts) / 200 == pytest.approx(HOTSPOT_MEAN, rel=0.05)
+    assert fine.stats.majorant_violations == 0
+    assert fine.stats.acceptance_rate > 0.5
+
+    coarse = PlanarIntensity(_hotspot, majorant_cells=1)
+    for _ in range(50):
+        coarse.sample_points(1000.0, rng)
+    assert coarse.stats.majorant_violations > 0
+
+    population = generate_process_population(
+        fine,
+        region_radius_m=1000.0,
+        coherence=0.1,
+        base_current_a=1.0,
+        admittance_s=0.01,
+        rng=rng,
+    )
+    assert all(source.distance_m <= 1000.0 for source in population)
+
+
+@pytest.mark.unit
+def test_intensity_benchmark_reports_acceptance_and_throughput() -> None:
+    rows = benchmark_intensity_samplers(
+        {
+            "radial": RadialIntensity(lambda r: 100.0),
+            "planar": PlanarIntensity(_hotspot, majorant_cells=16),
+        },
+        region_radius_m=1000.0,
+        n_realizations=5,
+    )
+    assert [row["sampler"] for row in rows] == ["radial", "planar"]
+    assert rows[0]["acceptance_rate"] == 1.0
+    assert 0.0 < float(rows[1]["acceptance_rate"]) < 1.0
+    assert all(float(row["points_per_second"]) > 0.0 for row in rows)
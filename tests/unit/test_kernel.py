@@ -24,3 +24,33 @@ def test_kernel_resonance_center_shift_changes_magnitude_profile() -> None:
     baseline_mag = abs(baseline.impedance(45.0, 120.0))
     shifted_mag = abs(shifted.impedance(45.0, 120.0))
     assert shifted_mag > baseline_mag
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("termination_mode", ["matched", "resistive"])
+def test_kernel_impedance_grid_matches_scalar_reference(termination_mode: str) -> None:
+    pytest.importorskip("numpy")
+    kernel = ExponentialKernel(
+        alpha=0.8,
+        resonance_scale=0.1,
+        resonance_center_hz=45_000.0,
+        termination_mode=termination_mode,  # type: ignore[arg-type]
+    )
+    frequencies = [2.0, 30.0, 45.0, 150.0]
+    distances = [0.0, 35.0, 480.0, 1000.0, 1600.0]
+    grid = kernel.impedance_grid(frequencies, distances, backend="numpy")
+    reference = kernel.impedance_grid(frequencies, distances, backend="python")
+    assert len(grid) == len(frequencies)
+    for row, reference_row in zip(grid, reference):
+        assert len(row) == len(distances)
+        for value, expected in zip(row, reference_row):
+            assert isinstance(value, complex)
+            assert abs(value - expected) <= 1e-9 * abs(expected)
+
+
+@pytest.mark.unit
+def test_kernel_plan_matches_direct_impedance() -> None:
+    kernel = ExponentialKernel(alpha=0.8, resonance_scale=0.1, termination_mode="resistive")
+    plan = kernel.plan(75.0)
+    distances = [0.0, 80.0, 999.0, 1000.0, 1400.0]
+    assert plan.impedances(distances) == [kernel.impedance(75.0, d) for d in distances]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import bisect
+import math
+import random
+import statistics
+from dataclasses import replace
+
+import pytest
+
+from supraharmonic_aggregation.core.aggregator import SupraharmonicAggregator
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.mark_families import (
+    mark_family,
+    normal_ppf,
+    register_mark_family,
+)
+from supraharmonic_aggregation.core.marks import sample_mark
+from supraharmonic_aggregation.simulation.mark_family_sweep import MarkFamilySweepRunner
+
+np = pytest.importorskip("numpy")
+
+
+def _ks(left: list[float], right: list[float]) -> float:
+    left, right = sorted(left), sorted(right)
+    return max(
+        abs(bisect.bisect_right(left, x) / len(left) - bisect.bisect_right(right, x) / len(right))
+        for x in left + right
+    )
+
+
+@pytest.mark.unit
+def test_families_follow_their_reference_distributions() -> None:
+    probabilities = [1e-300, 1e-12, 0.02, 0.3, 0.5, 0.9, 1.0 - 1e-12]
+    reference = [statistics.NormalDist().inv_cdf(p) for p in probabilities]
+    assert normal_ppf(np.array(probabilities)).tolist() == pytest.approx(reference, rel=1e-14)
+
+    n = 6000
+    generator = np.random.default_rng(5)
+    family = mark_family("lognormal_burst", 0.2, 0.05)
+    drawn = np.clip(family.amplitudes(generator.random(n), generator.random(n)), 1e-6, 2.0)
+    rng = random.Random(5)
+    scalar = [sample_mark(rng, 0.2, 0.05, 0.0, 0.0).amplitude_a for _ in range(n)]
+    assert _ks(drawn.tolist(), scalar) < 1.95 * math.sqrt(2.0 / n)
+
+    for shape in (0.4, 3.0):
+        gamma = mark_family("gamma", 0.2, 0.05, shape=shape).amplitudes(generator.random(n), None)
+        reference_gamma = generator.gamma(shape, 0.05 / shape, size=n)
+        assert _ks(gamma.tolist(), reference_gamma.tolist()) < 1.95 * math.sqrt(2.0 / n)
+    weibull = mark_family("weibull", 0.2, 0.05).amplitudes(generator.random(200_000), None)
+    assert weibull.mean() == pytest.approx(0.05, rel=0.01)
+
+
+@pytest.mark.unit
+def test_registry_rejects_unknown_and_duplicate_names() -> None:
+    with pytest.raises(ValueError, match="Unknown mark family"):
+        mark_family("cauchy", 0.1, 0.05)
+    with pytest.raises(ValueError, match="already registered"):
+        register_mark_family("gamma", lambda coherence, base_current_a: None)
+
+
+@pytest.mark.unit
+def test_sweep_matches_direct_aggregation_and_couples_families(baseline_config) -> None:
+    config = replace(baseline_config, density=80.0, simulation_streams="keyed")
+    runner = MarkFamilySweepRunner(config, seed=4)
+    families = ["lognormal", "gamma", "empirical"]
+    custom = {
+        "lognormal": mark_family("lognormal", config.coherence, config.base_current_a),
+        "gamma": mark_family("gamma", config.coherence, config.base_current_a, shape=8.0),
+        "empirical": mark_family(
+            "empirical", config.coherence, config.base_current_a, values=[0.02, 0.05, 0.08]
+        ),
+    }
+    sweep = runner.run(150, custom)
+    assert sweep.families == families
+    kernel = ExponentialKernel(alpha=config.kernel_alpha, resonance_scale=config.resonance_scale)
+    spectrum = SupraharmonicAggregator(kernel).aggregate_spectrum(
+        config.frequencies_khz, runner.population(11, custom["gamma"])
+    )
+    for frequency, value in zip(config.frequencies_khz, spectrum):
+        assert sweep.per_family_samples[1][str(frequency)][11] == pytest.approx(
+            abs(value), rel=1e-12
+        )
+
+    rebatched = MarkFamilySweepRunner(replace(config, simulation_batch_size=7), seed=4)
+    for rebatched_samples, samples in zip(
+        rebatched.run(150, custom).per_family_samples, sweep.per_family_samples
+    ):
+        for frequency in config.frequencies_khz:
+            key = str(frequency)
+            assert rebatched_samples[key] == pytest.approx(samples[key], rel=1e-12)
+
+    # Shared spatial draws and uniforms: families differ far less than independent runs.
+    key = str(config.frequencies_khz[-1])
+    lognormal, gamma = sweep.per_family_samples[0][key], sweep.per_family_samples[1][key]
+    paired = statistics.pvariance([a - b for a, b in zip(lognormal, gamma)])
+    independent = statistics.pvariance(lognormal) + statistics.pvariance(gamma)
+    assert paired < 0.2 * independent
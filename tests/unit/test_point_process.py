@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from supraharmonic_aggregation.core.marks import SourceMark
+from supraharmonic_aggregation.core.point_process import (
+    MaternClusterProcess,
+    MaternHardCoreProcess,
+    PoissonProcess,
+    StraussProcess,
+    ThomasProcess,
+    generate_process_population,
+)
+
+RADIUS_M = 400.0
+
+
+def _mean_count(process, n: int = 200, seed: int = 3) -> float:  # type: ignore[no-untyped-def]
+    rng = random.Random(seed)
+    return sum(len(process.sample_points(RADIUS_M, rng)) for _ in range(n)) / n
+
+
+def _min_distance(points: list[tuple[float, float]]) -> float:
+    return min(
+        (math.dist(a, b) for idx, a in enumerate(points) for b in points[idx + 1 :]),
+        default=math.inf,
+    )
+
+
+def _mean_nearest_neighbour(points: list[tuple[float, float]]) -> float:
+    return sum(
+        min(math.dist(a, b) for jdx, b in enumerate(points) if jdx != idx)
+        for idx, a in enumerate(points)
+    ) / len(points)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "process",
+    [
+        PoissonProcess(150.0),
+        ThomasProcess(parent_density=15.0, mean_offspring=10.0, sigma_m=15.0),
+        MaternClusterProcess(parent_density=15.0, mean_offspring=10.0, cluster_radius_m=30.0),
+        MaternHardCoreProcess(density=300.0, hard_core_m=30.0),
+    ],
+)
+def test_mean_counts_match_intensity(process) -> None:  # type: ignore[no-untyped-def]
+    expected = process.intensity * math.pi * (RADIUS_M / 1000.0) ** 2
+    assert _mean_count(process) == pytest.approx(expected, rel=0.08)
+
+
+@pytest.mark.unit
+def test_grid_hash_hard_core_matches_brute_force_thinning() -> None:
+    process = MaternHardCoreProcess(density=600.0, hard_core_m=25.0)
+    rng = random.Random(8)
+    points = process.sample_points(RADIUS_M, rng)
+    assert _min_distance(points) >= 25.0
+
+    # Replay the same draws and thin by checking every pair.
+    replay = random.Random(8)
+    outer = RADIUS_M + 25.0
+    proposals = PoissonProcess(600.0).sample_points(outer, replay)
+    ages = [replay.random() for _ in proposals]
+    kept = [
+        point
+        for point, age in zip(proposals, ages)
+        if not any(
+            other_age < age and math.dist(point, other) < 25.0
+            for other, other_age in zip(proposals, ages)
+        )
+        and math.hypot(*point) <= RADIUS_M
+    ]
+    assert kept == points
+
+
+@pytest.mark.unit
+def test_strauss_interaction_and_cluster_spacing() -> None:
+    rng = random.Random(5)
+    hard = StraussProcess(beta=150.0, interaction_radius_m=30.0, gamma=0.0, sweeps=20)
+    assert _min_distance(hard.sample_points(RADIUS_M, rng)) >= 30.0
+    free = StraussProcess(beta=150.0, interaction_radius_m=30.0, gamma=1.0)
+    assert _mean_count(free) == pytest.approx(150.0 * math.pi * 0.16, rel=0.08)
+    soft = StraussProcess(beta=150.0, interaction_radius_m=30.0, gamma=0.5, sweeps=20)
+    assert _mean_count(soft, n=20) < _mean_count(free, n=20)
+
+    clustered = ThomasProcess(parent_density=10.0, mean_offspring=15.0, sigma_m=10.0)
+    ppp = PoissonProcess(150.0)
+    assert _mean_nearest_neighbour(clustered.sample_points(RADIUS_M, rng)) < (
+        0.6 * _mean_nearest_neighbour(ppp.sample_points(RADIUS_M, rng))
+    )
+
+
+@pytest.mark.unit
+def test_process_population_has_source_marks_inside_region() -> None:
+    population = generate_process_population(
+        MaternClusterProcess(parent_density=20.0, mean_offspring=8.0, cluster_radius_m=40.0),
+        region_radius_m=RADIUS_M,
+        coherence=0.2,
+        base_current_a=1.0,
+        admittance_s=0.01,
+        rng=random.Random(2),
+    )
+    assert population
+    assert all(type(source.mark) is SourceMark for source in population)
+    assert all(0.0 <= source.distance_m <= RADIUS_M for source in population)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from supraharmonic_aggregation.core.poisson import sample_poisson, sample_poisson_batch
+
+
+def _pmf(k: int, lam: float) -> float:
+    return math.exp(-lam + k * math.log(lam) - math.lgamma(k + 1.0))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("lam", [0.7, 9.5, 10.0, 60.0, 5_000.0, 2.0e5])
+def test_sample_poisson_matches_pmf(lam: float) -> None:
+    rng = random.Random(17)
+    n = 20_000
+    draws = [sample_poisson(lam, rng) for _ in range(n)]
+    mean = sum(draws) / n
+    variance = sum((draw - mean) ** 2 for draw in draws) / (n - 1)
+    assert mean == pytest.approx(lam, abs=5.0 * math.sqrt(lam / n))
+    assert variance == pytest.approx(lam, rel=0.06)
+    # Probability mass of the central +-1 sigma window, against the exact pmf.
+    lo = max(0, math.ceil(lam - math.sqrt(lam)))
+    hi = math.floor(lam + math.sqrt(lam))
+    expected = sum(_pmf(k, lam) for k in range(lo, hi + 1))
+    observed = sum(1 for draw in draws if lo <= draw <= hi) / n
+    assert observed == pytest.approx(expected, abs=5.0 * math.sqrt(expected / n))
+
+
+@pytest.mark.unit
+def test_sample_poisson_edge_cases() -> None:
+    rng = random.Random(1)
+    assert sample_poisson(0.0, rng) == 0
+    assert sample_poisson(-3.0, rng) == 0
+    with pytest.raises(ValueError):
+        sample_poisson(math.nan, rng)
+    with pytest.raises(ValueError):
+        sample_poisson(math.inf, rng)
+
+
+@pytest.mark.unit
+def test_sample_poisson_batch_draws_per_mean() -> None:
+    np = pytest.importorskip("numpy")
+    generator = np.random.default_rng(5)
+    draws = sample_poisson_batch([0.0, 3.0, 4_000.0], generator)
+    assert draws.shape == (3,) and draws[0] == 0
+    many = sample_poisson_batch(250.0, generator, size=10_000)
+    assert float(many.mean()) == pytest.approx(250.0, abs=0.8)
+    with pytest.raises(ValueError):
+        sample_poisson_batch([1.0, math.nan], generator)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from supraharmonic_aggregation.cache import ArrayStore
+from supraharmonic_aggregation.core.marks import SourceColumns
+from supraharmonic_aggregation.core.population_bank import PopulationBank, PopulationKey
+from supraharmonic_aggregation.simulation.monte_carlo import MonteCarloRunner
+
+
+def _columns(n: int, offset: float) -> SourceColumns:
+    return SourceColumns(*([offset + idx for idx in range(n)] for _ in range(8)))
+
+
+@pytest.mark.unit
+def test_bank_evicts_least_recently_used_and_reloads_spilled_entries(tmp_path: Path) -> None:
+    key = PopulationKey(
+        seed=1,
+        density=10.0,
+        region_radius_m=300.0,
+        coherence=0.1,
+        base_current_a=0.05,
+        admittance_s=0.0,
+    )
+    store = ArrayStore(tmp_path / "cache")
+    bank = PopulationBank(max_bytes=2 * 8 * 8 * 4, store=store)
+    for index in range(3):
+        bank.put(key, index, _columns(4, float(index)))
+    assert bank.get(key, 1) == _columns(4, 1.0)
+    stats = bank.stats()
+    assert stats.resident_entries == 2 and stats.evictions == 1 and stats.spills == 1
+    assert bank.contains(key, 0)
+    assert bank.get(key, 0) == _columns(4, 0.0)
+    assert bank.stats().loads == 1
+    assert bank.get(dataclasses.replace(key, seed=2), 0) is None
+
+    memory_only = PopulationBank(max_bytes=8 * 8 * 4)
+    memory_only.put(key, 0, _columns(4, 0.0))
+    memory_only.put(key, 1, _columns(4, 1.0))
+    assert not memory_only.contains(key, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("streams", ["sequential", "keyed"])
+def test_kernel_sweep_replays_banked_populations(baseline_config, streams: str) -> None:
+    bank = PopulationBank()
+    MonteCarloRunner(baseline_config, streams=streams, population_bank=bank).run(40)
+    sampled = bank.stats()
+    assert sampled.resident_entries == 40
+
+    swept = dataclasses.replace(baseline_config, kernel_alpha=2.0 * baseline_config.kernel_alpha)
+    replayed = MonteCarloRunner(swept, streams=streams, population_bank=bank).run(40)
+    fresh = MonteCarloRunner(swept, streams=streams).run(40)
+    assert replayed.per_frequency_samples == fresh.per_frequency_samples
+    assert bank.stats().hits == sampled.hits + 40
+    assert bank.stats().misses == sampled.misses
+
+
+@pytest.mark.unit
+def test_sequential_numpy_bank_skips_partial_batches(baseline_config) -> None:
+    pytest.importorskip("numpy")
+    bank = PopulationBank()
+    MonteCarloRunner(baseline_config, sampler="numpy", batch_size=8, population_bank=bank).run(16)
+    shorter = MonteCarloRunner(
+        baseline_config, sampler="numpy", batch_size=8, population_bank=bank
+    ).run(10)
+    fresh = MonteCarloRunner(baseline_config, sampler="numpy", batch_size=8).run(10)
+    assert shorter.per_frequency_samples == fresh.per_frequency_samples
+
+    MonteCarloRunner(baseline_config, sampler="numpy", batch_size=8, population_bank=bank).run(10)
+    longer = MonteCarloRunner(
+        baseline_config, sampler="numpy", batch_size=8, population_bank=bank
+    ).run(16)
+    fresh = MonteCarloRunner(baseline_config, sampler="numpy", batch_size=8).run(16)
+    assert longer.per_frequency_samples == fresh.per_frequency_samples
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from supraharmonic_aggregation.benchmark.independent import IndependentBenchmarkRunner
+from supraharmonic_aggregation.core.aggregator import SupraharmonicAggregator
+from supraharmonic_aggregation.core.batch import PopulationBatch, batch_ranges
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.marks import generate_source_population
+from supraharmonic_aggregation.simulation.monte_carlo import MonteCarloRunner
+from supraharmonic_aggregation.simulation.synthetic_data import SyntheticDataGenerator
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tile_size", [1, 5, 1024])
+def test_aggregate_batch_rows_match_per_population_spectra(tile_size: int) -> None:
+    rng = random.Random(12)
+    populations = [
+        generate_source_population(
+            density=60.0,
+            region_radius_m=400.0,
+            coherence=0.3,
+            base_current_a=1.0,
+            admittance_s=0.01,
+            rng=rng,
+        )
+        for _ in range(9)
+    ]
+    populations[4] = []
+    batch = PopulationBatch.from_populations(populations)
+    assert batch is not None and len(batch) == 9
+    assert batch.counts() == [len(population) for population in populations]
+
+    aggregator = SupraharmonicAggregator(ExponentialKernel(alpha=0.8, resonance_scale=0.05))
+    frequencies = [2.0, 30.0, 150.0]
+    matrix = aggregator.aggregate_batch(frequencies, batch, tile_size=tile_size)
+    expected = [
+        aggregator.aggregate_spectrum(frequencies, population, tile_size=tile_size)
+        for population in populations
+    ]
+    assert matrix == expected
+    assert matrix[4] == [0j, 0j, 0j]
+    realization = batch.realization(2)
+    assert aggregator.aggregate_spectrum(frequencies, realization, tile_size) == expected[2]
+
+
+@pytest.mark.unit
+def test_runners_are_invariant_to_batch_size(baseline_config) -> None:
+    monte_carlo = [
+        MonteCarloRunner(baseline_config, seed=5, batch_size=size).run(11).per_frequency_samples
+        for size in (1, 4)
+    ]
+    assert monte_carlo[0] == monte_carlo[1]
+
+    synthetic = [
+        SyntheticDataGenerator(baseline_config, seed=5, batch_size=size)
+        .generate(n_samples=7)
+        .observations
+        for size in (1, 3)
+    ]
+    assert synthetic[0] == synthetic[1]
+
+    independent = [
+        IndependentBenchmarkRunner(baseline_config, seed=5, batch_size=size)
+        .run(9)
+        .per_frequency_samples
+        for size in (1, 64)
+    ]
+    assert independent[0] == independent[1]
+
+
+@pytest.mark.unit
+def test_batch_ranges_cover_samples_in_order() -> None:
+    assert batch_ranges(7, 3) == [(0, 3), (3, 6), (6, 7)]
+    assert batch_ranges(0, 3) == []
+    with pytest.raises(ValueError):
+        batch_ranges(4, 0)
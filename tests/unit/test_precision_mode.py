@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import random
+from array import array
+
+import pytest
+
+from supraharmonic_aggregation.core.aggregator import SupraharmonicAggregator
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.marks import generate_source_population
+from supraharmonic_aggregation.simulation.monte_carlo import MonteCarloRunner
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tile_size", [3, 1024])
+def test_float32_batch_tracks_float64_batch(tile_size: int) -> None:
+    rng = random.Random(21)
+    populations = [
+        generate_source_population(
+            density=density,
+            region_radius_m=400.0,
+            coherence=0.3,
+            base_current_a=1.0,
+            admittance_s=0.01,
+            rng=rng,
+        )
+        for density in (30.0, 0.001, 300.0, 30.0)
+    ]
+    aggregator = SupraharmonicAggregator(ExponentialKernel(alpha=0.8, resonance_scale=0.05))
+    frequencies = [2.0, 30.0, 150.0]
+    exact = aggregator.aggregate_batch(frequencies, populations, tile_size=tile_size)
+    reduced = aggregator.aggregate_batch(
+        frequencies, populations, tile_size=tile_size, precision="float32"
+    )
+    for exact_row, reduced_row in zip(exact, reduced):
+        for value, approx in zip(exact_row, reduced_row):
+            assert approx == pytest.approx(value, rel=1e-4, abs=1e-9)
+    with pytest.raises(ValueError):
+        aggregator.aggregate_batch(
+            frequencies,
+            populations,
+            precision="float16",  # type: ignore[arg-type]
+        )
+
+
+@pytest.mark.unit
+def test_float32_runner_stores_compact_samples_with_accuracy_report(baseline_config) -> None:
+    exact = MonteCarloRunner(baseline_config, seed=9).run(40)
+    reduced = MonteCarloRunner(
+        baseline_config, seed=9, batch_size=16, precision="float32", accuracy_subsample=10
+    ).run(40)
+    assert exact.accuracy_report is None and reduced.precision == "float32"
+    report = reduced.accuracy_report
+    assert report is not None and len(report) == len(baseline_config.frequencies_khz)
+    for row in report:
+        assert row["subsample_size"] == 10
+        assert row["within_tolerance"] == 1
+        key = str(row["frequency_khz"])
+        samples = reduced.per_frequency_samples[key]
+        assert isinstance(samples, array) and samples.typecode == "f"
+        assert list(samples) == pytest.approx(exact.per_frequency_samples[key], rel=1e-4)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+
+import pytest
+
+from supraharmonic_aggregation.core.aggregator import SupraharmonicAggregator
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.marks import generate_source_population
+from supraharmonic_aggregation.simulation.monte_carlo import MonteCarloRunner
+
+FREQUENCIES = [2.0, 10.0, 30.0, 75.0, 150.0]
+
+
+def _population(density: float, radius_m: float, seed: int) -> list:
+    return generate_source_population(
+        density=density,
+        region_radius_m=radius_m,
+        coherence=0.3,
+        base_current_a=1.0,
+        admittance_s=0.01,
+        rng=random.Random(seed),
+    )
+
+
+@pytest.mark.unit
+def test_zero_tolerance_keeps_every_source() -> None:
+    aggregator = SupraharmonicAggregator(ExponentialKernel(alpha=0.8, resonance_scale=0.05))
+    population = _population(60.0, 500.0, seed=1)
+    full = aggregator.aggregate_spectrum(FREQUENCIES, population)
+    pruned = aggregator.aggregate_spectrum_pruned(FREQUENCIES, population, tolerance_v=0.0)
+    assert pruned.pruned_fractions == [0.0] * len(FREQUENCIES)
+    assert pruned.error_estimates_v == [0.0] * len(FREQUENCIES)
+    for value, reference in zip(pruned.values, full):
+        assert value == pytest.approx(reference, rel=1e-12, abs=1e-15)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tile_size", [64, 1024])
+def test_pruned_error_stays_within_reported_estimate(tile_size: int) -> None:
+    aggregator = SupraharmonicAggregator(ExponentialKernel(alpha=8.0, resonance_scale=0.05))
+    population = _population(100.0, 4000.0, seed=2)
+    full = aggregator.aggregate_spectrum(FREQUENCIES, population)
+    pruned = aggregator.aggregate_spectrum_pruned(
+        FREQUENCIES, population, tolerance_v=1e-4, tile_size=tile_size
+    )
+    assert min(pruned.pruned_fractions) > 0.5
+    for value, reference, estimate in zip(pruned.values, full, pruned.error_estimates_v):
+        assert estimate <= 1e-4
+        assert abs(value - reference) <= estimate + 1e-12
+
+
+@pytest.mark.unit
+def test_runner_reports_pruning(baseline_config) -> None:
+    config = replace(baseline_config, region_radius_m=3000.0, kernel_alpha=6.0)
+    result = MonteCarloRunner(config, seed=5, prune_tolerance_v=1e-3).run(6)
+    report = result.pruning_report
+    assert report is not None and len(report) == len(config.frequencies_khz)
+    assert all(0.0 < row["mean_pruned_fraction"] < 1.0 for row in report)
+    assert all(row["max_error_estimate_v"] <= 1e-3 for row in report)
+    assert MonteCarloRunner(config, seed=5).run(6).pruning_report is None
+    with pytest.raises(ValueError):
+        MonteCarloRunner(config, seed=5, precision="float32", prune_tolerance_v=1e-3).run(2)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import math
+from dataclasses import replace
+
+import pytest
+
+from supraharmonic_aggregation.core.aggregator import SupraharmonicAggregator
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.qmc import (
+    SobolEngine,
+    primitive_polynomials,
+    qmc_dimensions,
+    qmc_population_batch,
+)
+from supraharmonic_aggregation.simulation.monte_carlo import MonteCarloRunner
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.unit
+def test_sobol_points_are_stratified_before_and_after_scrambling() -> None:
+    assert primitive_polynomials(6) == (0b11, 0b111, 0b1011, 0b1101, 0b10011, 0b11001)
+    plain = SobolEngine.create(3).points(0, 4) - 2.0**-33
+    assert plain.tolist() == [[0.0] * 3, [0.5] * 3, [0.25, 0.75, 0.25], [0.75, 0.25, 0.75]]
+
+    engine = SobolEngine.create(qmc_dimensions(32), seed=17)
+    points = engine.points(0, 512)
+    for column in points.T:
+        assert len(set((column * 512).astype(int).tolist())) == 512
+    assert np.array_equal(engine.points(100, 140), points[100:140])
+    assert not np.array_equal(SobolEngine.create(4, seed=18).points(0, 8), points[:8, :4])
+
+
+@pytest.mark.unit
+def test_qmc_populations_follow_the_ppp_distribution() -> None:
+    n = 2048
+    points = SobolEngine.create(qmc_dimensions(8), seed=3).points(0, n)
+    paddings = [np.random.default_rng(idx) for idx in range(n)]
+    batch = qmc_population_batch(points, 60.0, 300.0, 0.1, 0.05, 0.0, paddings)
+    mean_count = 60.0 * math.pi * 0.3**2
+    assert sum(batch.counts()) / n == pytest.approx(mean_count, rel=0.01)
+    radii = np.sort(np.asarray(batch.columns.distance_m) / 300.0)
+    # Pooled radii of a homogeneous disc have CDF r^2.
+    statistic = np.max(np.abs(np.arange(1, len(radii) + 1) / len(radii) - radii**2))
+    assert statistic < 1.36 / math.sqrt(len(radii))
+    fresh = [np.random.default_rng(idx) for idx in range(5)]
+    head = qmc_population_batch(points[:5], 60.0, 300.0, 0.1, 0.05, 0.0, fresh)
+    assert head.columns.distance_m == batch.columns.distance_m[: batch.offsets[5]]
+
+
+@pytest.mark.unit
+def test_qmc_runner_is_random_access_and_reports_replicate_errors(baseline_config) -> None:
+    config = replace(baseline_config, simulation_sampler="qmc", density=40.0)
+    full = MonteCarloRunner(config, seed=2, batch_size=64).run(256)
+    rebatched = MonteCarloRunner(config, seed=2, batch_size=7).run(256)
+    assert rebatched.per_frequency_samples == full.per_frequency_samples
+    kernel = ExponentialKernel(alpha=config.kernel_alpha, resonance_scale=config.resonance_scale)
+    spectrum = SupraharmonicAggregator(kernel).aggregate_spectrum(
+        config.frequencies_khz, MonteCarloRunner(config, seed=2).population(37)
+    )
+    for frequency, value in zip(config.frequencies_khz, spectrum):
+        assert abs(value) == pytest.approx(full.per_frequency_samples[str(frequency)][37])
+
+    reference = MonteCarloRunner(config, seed=5, sampler="numpy").run(4000)
+    for row, ref in zip(full.qmc_report, reference.statistics_frame):
+        assert row["replicates"] == 8
+        assert row["mean_abs_v_std_error"] > 0
+        ref_error = math.sqrt(ref["var_v"] / ref["sample_size"])
+        combined = math.hypot(row["mean_abs_v_std_error"], ref_error)
+        assert abs(row["mean_abs_v"] - ref["mean_abs_v"]) < 4.0 * combined
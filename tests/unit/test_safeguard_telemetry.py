@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from supraharmonic_aggregation.analysis.safeguard import (
+    safeguard_activation_frame,
+    sweep_safeguard_thresholds,
+)
+from supraharmonic_aggregation.core.aggregator import Source, SupraharmonicAggregator
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.marks import SourceMark, generate_source_population
+from supraharmonic_aggregation.core.safeguard import SafeguardTelemetry
+from supraharmonic_aggregation.simulation.monte_carlo import MonteCarloRunner
+
+
+class _NearSingularKernel:
+    def impedance(self, frequency_khz: float, distance_m: float) -> complex:
+        return complex(-100.0, 0.0)
+
+
+@pytest.mark.unit
+def test_activation_counters_per_realization_and_frequency() -> None:
+    aggregator = SupraharmonicAggregator(_NearSingularKernel())
+    mark = SourceMark(
+        amplitude_a=1.0, phase_rad=0.0, admittance_s=0.01, admittance_rolloff_per_khz=0.01
+    )
+    populations = [[Source(20.0, mark)] * 3, [], [Source(40.0, mark)]]
+    telemetry = SafeguardTelemetry([10.0, 150.0], aggregator.min_denominator_magnitude)
+    aggregator.aggregate_batch([10.0, 150.0], populations, telemetry=telemetry)
+    # At 10 kHz 1 + Y*Z is exactly zero; above the reference frequency Y rolls off.
+    assert telemetry.activations == [[3, 0], [0, 0], [1, 0]]
+    assert telemetry.activation_rate() == [1.0, 0.0]
+    frame = safeguard_activation_frame(telemetry)
+    assert frame[0]["realization_activation_frequency_pct"] == pytest.approx(200.0 / 3.0)
+
+
+@pytest.mark.unit
+def test_recorded_denominators_reproduce_rerun_thresholds() -> None:
+    rng = random.Random(4)
+    populations = [
+        generate_source_population(
+            density=50.0,
+            region_radius_m=500.0,
+            coherence=0.3,
+            base_current_a=1.0,
+            admittance_s=10.0,
+            rng=rng,
+        )
+        for _ in range(6)
+    ]
+    kernel = ExponentialKernel(alpha=0.8, resonance_scale=0.05)
+    frequencies = [2.0, 30.0, 150.0]
+    aggregator = SupraharmonicAggregator(kernel)
+    telemetry = SafeguardTelemetry(
+        frequencies, aggregator.min_denominator_magnitude, record_below=0.9
+    )
+    spectra = aggregator.aggregate_batch(frequencies, populations, telemetry=telemetry)
+    assert telemetry.records
+
+    for threshold in (1e-6, 0.3, 0.9):
+        rerun = SupraharmonicAggregator(kernel, min_denominator_magnitude=threshold)
+        expected = rerun.aggregate_batch(frequencies, populations)
+        for realization, freq_idx in telemetry.records:
+            assert telemetry.voltage_at((realization, freq_idx), threshold) == pytest.approx(
+                expected[realization][freq_idx], rel=1e-9
+            )
+
+    samples = {
+        str(frequency): [abs(row[idx]) for row in spectra]
+        for idx, frequency in enumerate(frequencies)
+    }
+    rows = sweep_safeguard_thresholds(telemetry, samples, [1e-6, 0.9], exceedance_threshold=1.0)
+    assert len(rows) == 2 * len(frequencies)
+    assert rows[0]["mean_abs_v"] == pytest.approx(sum(samples["2.0"]) / 6, rel=1e-9)
+    with pytest.raises(ValueError):
+        sweep_safeguard_thresholds(telemetry, samples, [1.5], exceedance_threshold=1.0)
+    with pytest.raises(ValueError):
+        sweep_safeguard_thresholds(telemetry, samples, [1e-7], exceedance_threshold=1.0)
+    with pytest.raises(ValueError):
+        SafeguardTelemetry(frequencies, min_denominator_magnitude=0.5, record_below=0.1)
+
+
+@pytest.mark.unit
+def test_monte_carlo_result_exposes_safeguard_counters(baseline_config) -> None:
+    result = MonteCarloRunner(baseline_config, seed=3, batch_size=4).run(10)
+    telemetry = result.safeguard
+    assert telemetry is not None
+    assert len(telemetry.activations) == 10
+    assert all(len(row) == len(baseline_config.frequencies_khz) for row in telemetry.activations)
+    assert not telemetry.records
@@ -0,0 +1,107 @@
+"""Distributional equivalence of the vectorized sampler and the scalar reference.
+
+The two samplers use different random streams, so each mark field is compared with a
+two-sample Kolmogorov-Smirnov test at a 0.1% false-alarm level (critical coefficient
+1.95) and the Poisson counts by their mean and variance. Phases share a per-population
+common phase, so they are compared through wrapped differences of disjoint source pairs,
+which are i.i.d. across populations. Seeds are fixed, so the tests are deterministic.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import replace
+
+import pytest
+
+from supraharmonic_aggregation.core.batch import PopulationBatch
+from supraharmonic_aggregation.core.marks import generate_source_population
+from supraharmonic_aggregation.simulation.monte_carlo import MonteCarloRunner
+
+sampling = pytest.importorskip("supraharmonic_aggregation.core.sampling")
+pytest.importorskip("numpy")
+
+PARAMS = dict(
+    density=40.0, region_radius_m=500.0, coherence=0.4, base_current_a=2.0, admittance_s=0.02
+)
+FIELDS = (
+    "distance_m",
+    "amplitude_a",
+    "spectral_tilt_per_decade",
+    "phase_slope_rad_per_khz",
+    "admittance_rolloff_per_khz",
+)
+
+
+def _pair_phase_differences(batch: PopulationBatch) -> list[float]:
+    phases = batch.columns.phase_rad
+    return [
+        (phases[idx + 1] - phases[idx] + math.pi) % (2.0 * math.pi) - math.pi
+        for start, stop in zip(batch.offsets, batch.offsets[1:])
+        for idx in range(start, stop - 1, 2)
+    ]
+
+
+def _ks_statistic(left: list[float], right: list[float]) -> float:
+    left, right = sorted(left), sorted(right)
+    i = j = 0
+    statistic = 0.0
+    while i < len(left) and j < len(right):
+        value = min(left[i], right[j])
+        while i < len(left) and left[i] <= value:
+            i += 1
+        while j < len(right) and right[j] <= value:
+            j += 1
+        statistic = max(statistic, abs(i / len(left) - j / len(right)))
+    return statistic
+
+
+@pytest.mark.unit
+def test_vectorized_marks_match_scalar_sampler_distribution() -> None:
+    rng = random.Random(11)
+    scalar = PopulationBatch.from_populations(
+        [generate_source_population(rng=rng, **PARAMS) for _ in range(400)]
+    )
+    vector = sampling.sample_population_batch(
+        400, generator=sampling.default_generator(11), **PARAMS
+    )
+    assert scalar is not None
+    samples = [(getattr(scalar.columns, name), getattr(vector.columns, name)) for name in FIELDS]
+    samples.append((_pair_phase_differences(scalar), _pair_phase_differences(vector)))
+    for name, (left, right) in zip(FIELDS + ("phase_difference",), samples):
+        n, m = len(left), len(right)
+        assert _ks_statistic(left, right) < 1.95 * math.sqrt((n + m) / (n * m)), name
+    for columns in (scalar.columns, vector.columns):
+        assert max(columns.amplitude_a) <= 80.0
+        assert all(0.0 <= phase < 2.0 * math.pi for phase in columns.phase_rad)
+        assert set(columns.admittance_s) == {0.02}
+
+
+@pytest.mark.unit
+def test_population_counts_are_poisson() -> None:
+    counts = sampling.sample_population_batch(
+        4000, generator=sampling.default_generator(3), **PARAMS
+    ).counts()
+    lam = PARAMS["density"] * math.pi * 0.25
+    mean = sum(counts) / len(counts)
+    variance = sum((count - mean) ** 2 for count in counts) / (len(counts) - 1)
+    assert mean == pytest.approx(lam, abs=4.0 * math.sqrt(lam / len(counts)))
+    assert variance == pytest.approx(lam, rel=0.1)
+    empty = sampling.sample_population_batch(0, generator=sampling.default_generator(3), **PARAMS)
+    assert empty.counts() == [] and empty.offsets == [0]
+    with pytest.raises(ValueError):
+        sampling.sample_population_batch(-1, generator=sampling.default_generator(3), **PARAMS)
+
+
+@pytest.mark.unit
+def test_runner_with_numpy_sampler_is_reproducible_and_consistent(baseline_config) -> None:
+    config = replace(baseline_config, density=60.0, simulation_sampler="numpy")
+    first = MonteCarloRunner(config, seed=9, batch_size=5).run(40)
+    second = MonteCarloRunner(config, seed=9, batch_size=5).run(40)
+    assert first.per_frequency_samples == second.per_frequency_samples
+    reference = MonteCarloRunner(config, seed=9, sampler="python").run(400)
+    for row, ref in zip(
+        MonteCarloRunner(config, seed=9).run(400).statistics_frame, reference.statistics_frame
+    ):
+        assert row["mean_abs_v"] == pytest.approx(ref["mean_abs_v"], rel=0.1)
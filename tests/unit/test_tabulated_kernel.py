@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from supraharmonic_aggregation.cache import ArrayStore
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.tabulated import TabulatedKernel
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("termination_mode", ["matched", "resistive"])
+def test_tabulated_kernel_tracks_exact_kernel_within_tolerance(termination_mode: str) -> None:
+    base = ExponentialKernel(
+        alpha=0.8,
+        resonance_scale=0.05,
+        termination_mode=termination_mode,  # type: ignore[arg-type]
+    )
+    tolerance = 1e-4
+    kernel = TabulatedKernel(base, region_radius_m=1500.0, relative_tolerance=tolerance)
+    rng = random.Random(5)
+    for frequency in (2.0, 30.0, 150.0):
+        assert kernel.table(frequency).max_relative_error <= tolerance
+        for _ in range(200):
+            distance = 1500.0 * rng.random()
+            exact = base.impedance(frequency, distance)
+            assert abs(kernel.impedance(frequency, distance) - exact) <= tolerance * abs(exact)
+
+
+@pytest.mark.unit
+def test_tabulated_kernel_refines_around_feeder_knee() -> None:
+    base = ExponentialKernel(alpha=0.8, termination_mode="resistive")
+    table = TabulatedKernel(base, region_radius_m=2000.0).table(150.0)
+    assert 1000.0 in table.distances_m
+    spacing_near_knee = min(
+        right - left
+        for left, right in zip(table.distances_m, table.distances_m[1:])
+        if 900.0 <= left <= 1000.0
+    )
+    assert spacing_near_knee < 2000.0 / 32
+
+
+@pytest.mark.unit
+def test_tabulated_kernel_tables_are_shared_through_lru_cache() -> None:
+    TabulatedKernel.cache_clear()
+    base = ExponentialKernel(alpha=0.6, resonance_scale=0.1)
+    TabulatedKernel(base, region_radius_m=400.0).impedance(10.0, 100.0)
+    TabulatedKernel(base, region_radius_m=400.0).impedance(10.0, 250.0)
+    info = TabulatedKernel.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.size == 1
+
+
+@pytest.mark.unit
+def test_tabulated_kernel_tables_persist_in_array_store(tmp_path) -> None:
+    store = ArrayStore(tmp_path / "cache")
+    base = ExponentialKernel(alpha=0.7, termination_mode="resistive")
+    TabulatedKernel.cache_clear()
+    cold = TabulatedKernel(base, region_radius_m=600.0, store=store).table(30.0)
+    TabulatedKernel.cache_clear()
+    warm = TabulatedKernel(base, region_radius_m=600.0, store=store).table(30.0)
+    assert warm == cold
+    assert store.hits == 1
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+from supraharmonic_aggregation.benchmark.timing import (
+    benchmark_kernel_plan,
+    benchmark_poisson_sampler,
+)
+
+
+@pytest.mark.unit
+def test_kernel_plan_benchmark_reports_per_source_costs() -> None:
+    rows = benchmark_kernel_plan(frequencies_khz=[10.0, 30.0], n_sources=50, repeats=1)
+    assert [row["frequency_khz"] for row in rows] == [10.0, 30.0]
+    for row in rows:
+        assert float(row["direct_ns_per_source"]) > 0.0
+        assert float(row["planned_ns_per_source"]) > 0.0
+        assert float(row["speedup"]) > 0.0
+
+
+@pytest.mark.unit
+def test_poisson_benchmark_compares_samplers() -> None:
+    rows = benchmark_poisson_sampler(means=[20.0, 800.0], n_draws=200, repeats=1)
+    assert [row["lambda"] for row in rows] == [20.0, 800.0]
+    for row in rows:
+        assert float(row["legacy_us_per_draw"]) > 0.0
+        assert float(row["ptrs_us_per_draw"]) > 0.0
+        assert float(row["ptrs_sample_mean"]) == pytest.approx(float(row["lambda"]), rel=0.1)
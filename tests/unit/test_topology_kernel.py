@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from supraharmonic_aggregation.core.aggregator import Source, SupraharmonicAggregator
+from supraharmonic_aggregation.core.kernel import ExponentialKernel
+from supraharmonic_aggregation.core.marks import SourceMark
+from supraharmonic_aggregation.core.topology import CableType, FeederSegment, RadialFeederKernel
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("distance_m", [40.0, 400.0, 950.0])
+def test_two_segment_chain_matches_exponential_kernel(distance_m: float) -> None:
+    reference = ExponentialKernel(alpha=0.8, termination_mode="resistive")
+    cable = CableType(alpha=0.8)
+    topology = RadialFeederKernel(
+        [
+            FeederSegment("source", "pcc", distance_m, cable),
+            FeederSegment("end", "source", 1000.0 - distance_m, cable, load_impedance_ohm=0.30),
+        ]
+    )
+    for frequency in (2.0, 30.0, 150.0):
+        expected = reference.impedance(frequency, distance_m)
+        value = topology.plan(frequency).node_impedance("source")
+        assert abs(value - expected) <= 1e-9 * abs(expected)
+
+
+@pytest.mark.unit
+def test_lateral_nodes_share_upstream_cascade_and_map_by_distance() -> None:
+    trunk = CableType(alpha=0.5)
+    lateral = CableType(r_ohm_per_km=0.8, l_h_per_km=0.3e-3, c_f_per_km=60e-9, alpha=0.5)
+    topology = RadialFeederKernel(
+        [
+            FeederSegment("t1", "pcc", 200.0, trunk),
+            FeederSegment("t2", "t1", 300.0, trunk, load_impedance_ohm=0.5),
+            FeederSegment("l1", "t1", 150.0, lateral, load_impedance_ohm=2.0),
+        ]
+    )
+    assert topology.nodes == ["pcc", "t1", "t2", "l1"]
+    assert topology.path_distances_m == [0.0, 200.0, 500.0, 350.0]
+    rows = topology.transfer_impedances([10.0, 75.0])
+    assert len(rows) == 2 and all(len(row) == 4 for row in rows)
+    plan = topology.plan(75.0)
+    assert topology.plan(75.0) is plan and rows[1] == plan.transfer_impedances
+    assert plan.impedance(340.0) == plan.node_impedance("l1")
+    assert plan.impedance(480.0) == plan.node_impedance("t2")
+
+    aggregator = SupraharmonicAggregator(topology)
+    source = Source(distance_m=350.0, mark=SourceMark(1.0, 0.0, 0.0))
+    assert aggregator.aggregate_complex_voltage(75.0, [source]) == plan.node_impedance("l1")
+
+
+@pytest.mark.unit
+def test_radial_feeder_rejects_disconnected_segments() -> None:
+    with pytest.raises(ValueError):
+        RadialFeederKernel([FeederSegment("a", "missing", 10.0)])
+    with pytest.raises(ValueError):
+        RadialFeederKernel([FeederSegment("a", "b", 10.0), FeederSegment("b", "a", 10.0)])